@@ -3,7 +3,7 @@ import importlib
 import logging
 import os
 
-from parsons.etl.table import Table
+from parsons.etl.table import Table  # noqa: F401 (listed in __all__ below)
 
 # Define the default logging config for Parsons and its submodules. For now the
 # logger gets a StreamHandler by default. At some point a NullHandler may be more
@@ -23,9 +23,9 @@ elif os.environ.get("DEBUG"):
 else:
     logger.setLevel("INFO")
 
-# Table is referenced by many connectors, so we add it immediately to limit the damage
-# of circular dependencies
-__all__ = ["Table"]
+# Connectors are imported the first time they are used, so that importing Parsons doesn't
+# import every connector's dependencies, eg. boto3 or the Google Cloud libraries
+_CONNECTORS = {}
 for module_path, connector_name in (
     ("parsons.actblue.actblue", "ActBlue"),
     ("parsons.action_kit.action_kit", "ActionKit"),
@@ -95,8 +95,39 @@ for module_path, connector_name in (
     ("parsons.zoom.zoom", "Zoom"),
     ("parsons.empower.empower", "Empower"),
 ):
+    _CONNECTORS[connector_name] = module_path
+
+
+def __getattr__(name):
+    if name == "__all__":
+        # Only list the connectors whose dependencies are installed, so that
+        # `from parsons import *` works with limited dependencies. Table is referenced by many
+        # connectors, so it comes first to limit the damage of circular dependencies.
+        names = ["Table"]
+        for connector_name in _CONNECTORS:
+            try:
+                __getattr__(connector_name)
+            except AttributeError:
+                logger.debug(f"Could not import {connector_name}; skipping")
+            else:
+                names.append(connector_name)
+
+        globals()["__all__"] = names
+        return names
+
+    module_path = _CONNECTORS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
     try:
-        globals()[connector_name] = getattr(importlib.import_module(module_path), connector_name)
-        __all__.append(connector_name)
-    except ImportError:
-        logger.debug(f"Could not import {module_path}.{connector_name}; skipping")
+        connector = getattr(importlib.import_module(module_path), name)
+    except ImportError as e:
+        raise AttributeError(f"Could not import {module_path}.{name}: {e}") from e
+
+    # Cache the connector, so later lookups don't call __getattr__
+    globals()[name] = connector
+    return connector
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_CONNECTORS))
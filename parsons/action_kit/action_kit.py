@@ -1,15 +1,27 @@
+import collections
+import csv
 import json
 import logging
 import math
 import time
+from concurrent.futures import ThreadPoolExecutor
 
+import petl
 import requests
 
 from parsons.etl.table import Table
-from parsons.utilities import check_env
+from parsons.utilities import check_env, files
+from parsons.utilities.response_cache import mount_cache
 
 logger = logging.getLogger(__name__)
 
+# The number of uploads to send, or check on, at once
+UPLOAD_WORKERS = 4
+
+# The maximum number of upload files kept open at once while splitting a table by its blank
+# columns. Groups beyond this are closed and reopened when they get another row.
+MAX_OPEN_UPLOAD_FILES = 64
+
 
 class ActionKit(object):
     """
@@ -25,6 +37,9 @@ class ActionKit(object):
         password: str
             The authorized ActionKit user password. Not required if ``ACTION_KIT_PASSWORD``
             env variable set.
+        cache: ResponseCache
+            Optional :class:`~parsons.utilities.response_cache.ResponseCache` of ``GET``
+            responses, for reference data such as user fields that rarely changes.
     """
 
     _default_headers = {
@@ -32,16 +47,19 @@ class ActionKit(object):
         "accepts": "application/json",
     }
 
-    def __init__(self, domain=None, username=None, password=None):
+    def __init__(self, domain=None, username=None, password=None, cache=None):
         self.domain = check_env.check("ACTION_KIT_DOMAIN", domain)
         self.username = check_env.check("ACTION_KIT_USERNAME", username)
         self.password = check_env.check("ACTION_KIT_PASSWORD", password)
+        self.cache = cache
         self.conn = self._conn()
 
     def _conn(self, default_headers=_default_headers):
         client = requests.Session()
         client.auth = (self.username, self.password)
         client.headers.update(default_headers)
+        if self.cache is not None:
+            mount_cache(client, self.cache)
         return client
 
     def _base_endpoint(self, endpoint, entity_id=None):
@@ -844,7 +862,7 @@ class ActionKit(object):
             exception_message="Could not queue mailer",
         )
 
-    def paginated_get(self, object_type, limit=None, **kwargs):
+    def paginated_get(self, object_type, limit=None, stream=False, **kwargs):
         """Get multiple objects of a given type.
 
         `Args:`
@@ -864,10 +882,23 @@ class ActionKit(object):
                 .. code-block:: python
 
                     ak.paginated_get(name__contains="FirstName")
+            stream: bool
+                Return a Table that requests each page only as its rows are read, rather than
+                requesting every page up front. Defaults to ``False``.
         `Returns:`
             Parsons.Table
                 The objects data.
         """
+        pages = self._paginated_pages(object_type, limit=limit, **kwargs)
+
+        if stream:
+            return Table.from_pages(pages)
+
+        return Table([obj for page in pages for obj in page])
+
+    def _paginated_pages(self, object_type, limit=None, **kwargs):
+        # Yield the objects of each page as it arrives, stopping once `limit` objects are found
+
         # "The maximum number of objects returned per request is 100. Use paging
         # to get more objects."
         # (https://roboticdogs.actionkit.com/docs//manual/api/rest/overview.html#ordering)
@@ -875,16 +906,21 @@ class ActionKit(object):
         kwargs["_limit"] = min(100, limit or 1_000_000_000)
         json_data = self._base_get(object_type, params=kwargs)
         data = json_data["objects"]
-
         next_url = json_data.get("meta", {}).get("next")
-        while next_url:
-            resp = self.conn.get(f"https://{self.domain}{next_url}")
-            data.extend(resp.json().get("objects", []))
-            next_url = resp.json().get("meta", {}).get("next")
-            if limit and len(data) >= limit:
+        count = 0
+
+        while True:
+            if limit:
+                data = data[: limit - count]
+            count += len(data)
+            yield data
+
+            if not next_url or (limit and count >= limit):
                 break
 
-        return Table(data[:limit])
+            resp = self.conn.get(f"https://{self.domain}{next_url}")
+            data = resp.json().get("objects", [])
+            next_url = resp.json().get("meta", {}).get("next")
 
     def paginated_get_custom_limit(
         self,
@@ -1385,6 +1421,7 @@ class ActionKit(object):
         autocreate_user_fields=0,
         no_overwrite_on_empty=False,
         set_only_columns=None,
+        max_workers=UPLOAD_WORKERS,
     ):
         """
         Bulk upload a table of new users or user updates.
@@ -1418,6 +1455,9 @@ class ActionKit(object):
             set_only_columns: list
                 This is similar to no_overwrite_on_empty but restricts to a specific set of columns
                 which, if blank, should not be overwritten.
+            max_workers: int
+                The number of uploads to send at once, when the table is divided into
+                several uploads. Defaults to ``4``.
         `Returns`:
             dict
                 success: bool -- whether upload was successful (individual rows may not have been)
@@ -1426,52 +1466,82 @@ class ActionKit(object):
         """
 
         import_page = check_env.check("ACTION_KIT_IMPORTPAGE", import_page)
-        upload_tables = self._split_tables_no_empties(
-            table, no_overwrite_on_empty, set_only_columns
-        )
-        results = []
-        for tbl in upload_tables:
+        upload_files = self._split_files_no_empties(table, no_overwrite_on_empty, set_only_columns)
+
+        def upload(upload_file):
+            columns, path = upload_file
             user_fields_only = int(
-                not any([h for h in tbl.columns if h != "email" and not h.startswith("user_")])
+                not any([h for h in columns if h != "email" and not h.startswith("user_")])
             )
-            results.append(
-                self.bulk_upload_csv(
-                    tbl.to_csv(),
-                    import_page,
-                    autocreate_user_fields=autocreate_user_fields,
-                    user_fields_only=user_fields_only,
-                )
+            return self.bulk_upload_csv(
+                path,
+                import_page,
+                autocreate_user_fields=autocreate_user_fields,
+                user_fields_only=user_fields_only,
             )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(upload, upload_files))
+
         return {"success": all([r["success"] for r in results]), "results": results}
 
-    def _split_tables_no_empties(self, table, no_overwrite_on_empty, set_only_columns):
-        table_groups = {}
+    def _split_files_no_empties(self, table, no_overwrite_on_empty, set_only_columns):
+        # Group the rows by which of their columns are blank, in a single pass, writing each
+        # group to its own csv without the blank columns. Returns a (columns, path) pair for
+        # each group, in the order the groups first appear.
+        columns = table.columns
         # uploading combo of user_id and email column should be mutually exclusive
-        blank_columns_test = table.columns
+        blank_columns_test = columns
         if not no_overwrite_on_empty:
             blank_columns_test = set(["user_id", "email"] + (set_only_columns or [])).intersection(
-                table.columns
+                columns
             )
-        for row in table:
-            blanks = tuple(k for k in blank_columns_test if row.get(k) in (None, ""))
-            grp = table_groups.setdefault(blanks, [])
-            grp.append(row)
+        blank_indexes = [i for i, k in enumerate(columns) if k in blank_columns_test]
+
+        groups = {}
+        # The open files of the groups that got rows most recently
+        open_files = collections.OrderedDict()
+        try:
+            for row in petl.data(table.table):
+                blanks = tuple(i for i in blank_indexes if i >= len(row) or row[i] in (None, ""))
+                new = blanks not in groups
+                if new:
+                    kept = [i for i in range(len(columns)) if i not in blanks]
+                    groups[blanks] = (kept, files.create_temp_file(suffix=".csv"))
+
+                kept, path = groups[blanks]
+                if blanks in open_files:
+                    open_files.move_to_end(blanks)
+                else:
+                    if len(open_files) >= MAX_OPEN_UPLOAD_FILES:
+                        _, (f, _) = open_files.popitem(last=False)
+                        f.close()
+
+                    f = open(path, "a", newline="")
+                    writer = csv.writer(f)
+                    if new:
+                        writer.writerow([columns[i] for i in kept])
+                    open_files[blanks] = (f, writer)
+
+                _, writer = open_files[blanks]
+                writer.writerow([row[i] if i < len(row) else None for i in kept])
+        finally:
+            for f, _ in open_files.values():
+                f.close()
+
         results = []
-        for blanks, subset in table_groups.items():
-            subset_table = Table(subset)
-            if blanks:
-                subset_table.table = subset_table.table.cutout(*blanks)
-            logger.debug(f"Column Upload Blanks: {blanks}")
-            logger.debug(f"Column Upload Columns: {subset_table.columns}")
-            if not set(["user_id", "email"]).intersection(subset_table.columns):
+        for blanks, (kept, path) in groups.items():
+            group_columns = [columns[i] for i in kept]
+            logger.debug(f"Column Upload Blanks: {[columns[i] for i in blanks]}")
+            logger.debug(f"Column Upload Columns: {group_columns}")
+            if not set(["user_id", "email"]).intersection(group_columns):
                 logger.warning(
-                    f"Upload will fail without user_id or email. "
-                    f"Rows: {subset_table.num_rows}, Columns: {subset_table.columns}"
+                    f"Upload will fail without user_id or email. Columns: {group_columns}"
                 )
-            results.append(subset_table)
+            results.append((group_columns, path))
         return results
 
-    def collect_upload_errors(self, result_array):
+    def collect_upload_errors(self, result_array, max_workers=UPLOAD_WORKERS):
         """
         Collect any upload errors as a list of objects from bulk_upload_table 'results' key value.
         This waits for uploads to complete, so it may take some time if you uploaded a large file.
@@ -1481,40 +1551,47 @@ class ActionKit(object):
                 were any errors in the uploads.  If you call collect_upload_errors(result_array)
                 it will iterate across each of the uploads fetching the final result of e.g.
                 /rest/v1/uploaderror?upload=123
+            max_workers: int
+                The number of uploads to check on at once. Defaults to ``4``.
         `Returns`:
             [dict]
                 message: str -- error message
                 upload: str -- upload progress API path e.g. "/rest/v1/upload/123456/"
                 id: int -- upload error record id (different than upload id)
         """
+        upload_ids = [res.get("id") for res in result_array if res.get("id")]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            upload_errors = list(executor.map(self._collect_upload_errors, upload_ids))
+
+        return [error for errors in upload_errors for error in errors]
+
+    def _collect_upload_errors(self, upload_id):
+        # Pend until upload is complete
+        while True:
+            upload = self._base_get(endpoint="upload", entity_id=upload_id)
+            if upload.get("is_completed"):
+                break
+            else:
+                time.sleep(1)
+
+        # ActionKit limits length of error list returned
+        # Iterate until all errors are gathered
+        error_count = upload.get("has_errors")
+        limit = 20
+
         errors = []
-        for res in result_array:
-            upload_id = res.get("id")
-            if upload_id:
-                # Pend until upload is complete
-                while True:
-                    upload = self._base_get(endpoint="upload", entity_id=upload_id)
-                    if upload.get("is_completed"):
-                        break
-                    else:
-                        time.sleep(1)
-
-                # ActionKit limits length of error list returned
-                # Iterate until all errors are gathered
-                error_count = upload.get("has_errors")
-                limit = 20
-
-                error_pages = math.ceil(error_count / limit)
-                for page in range(0, error_pages):
-                    error_data = self._base_get(
-                        endpoint="uploaderror",
-                        params={
-                            "upload": upload_id,
-                            "_limit": limit,
-                            "_offset": page * limit,
-                        },
-                    )
-                    logger.debug(f"error collect result: {error_data}")
-                    errors.extend(error_data.get("objects", []))
+        error_pages = math.ceil(error_count / limit)
+        for page in range(0, error_pages):
+            error_data = self._base_get(
+                endpoint="uploaderror",
+                params={
+                    "upload": upload_id,
+                    "_limit": limit,
+                    "_offset": page * limit,
+                },
+            )
+            logger.debug(f"error collect result: {error_data}")
+            errors.extend(error_data.get("objects", []))
 
         return errors
@@ -1,5 +1,6 @@
 import json
 import logging
+import math
 import re
 import warnings
 from typing import Dict, List, Literal, Union
@@ -46,21 +47,40 @@ class ActionNetwork(object):
         # event_campaigns, campaigns, advocacy_campaigns, signatures, attendances, submissions,
         # donations and outreaches.
         # See Action Network API docs for more info: https://actionnetwork.org/docs/v2/
+        def get_page(page):
+            return self._get_page(object_name, page, per_page, filter=filter)
+
+        def page_count(response):
+            total_pages = response.get("total_pages")
+            if total_pages and limit:
+                total_pages = min(total_pages, math.ceil(limit / min(per_page, 25)))
+            return total_pages
+
+        def responses():
+            pages = self.api.get_pages(get_page, page_count)
+            yield from pages
+
+            if "total_pages" not in pages[0]:
+                # Without a page count, request pages until one comes back empty
+                page = 2
+                while True:
+                    yield get_page(page)
+                    page = page + 1
+
         count = 0
-        page = 1
         return_list = []
-        while True:
-            response = self._get_page(object_name, page, per_page, filter=filter)
-            page = page + 1
+        for response in responses():
             response_list = response["_embedded"][list(response["_embedded"])[0]]
             if not response_list:
-                return Table(return_list)
+                break
             return_list.extend(response_list)
             count = count + len(response_list)
             if limit:
                 if count >= limit:
                     return Table(return_list[0:limit])
 
+        return Table(return_list)
+
     # Advocacy Campaigns
     def get_advocacy_campaigns(self, limit=None, per_page=25, page=None, filter=None):
         """
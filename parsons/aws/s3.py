@@ -3,12 +3,17 @@ import os
 import re
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.client import ClientError
 
 from parsons.utilities import files
 
 logger = logging.getLogger(__name__)
 
+# Size of each multipart upload part when uploading a stream. Parts are buffered in memory
+# while they upload, so this bounds the memory used by put_stream.
+STREAM_PART_SIZE = 16 * 1024 * 1024
+
 
 class AWSConnection(object):
     def __init__(
@@ -291,6 +296,44 @@ class S3(object):
 
         self.client.upload_file(local_path, bucket, key, ExtraArgs={"ACL": acl, **kwargs})
 
+    def put_stream(
+        self,
+        bucket,
+        key,
+        stream,
+        acl="bucket-owner-full-control",
+        part_size=STREAM_PART_SIZE,
+        **kwargs,
+    ):
+        """
+        Uploads the contents of a readable, file-like object to an S3 bucket without writing
+        it to a local file first. The stream is read in parts that are sent as a multipart
+        upload as they fill, so it does not need to be seekable or to fit in memory.
+
+        `Args:`
+            bucket: str
+                The bucket name
+            key: str
+                The object key
+            stream: file-like object
+                A file-like object opened for reading in binary mode, eg. the result of
+                ``Table.to_csv_stream()``
+            acl: str
+                The S3 permissions on the file
+            part_size: int
+                The size in bytes of each part of the upload
+            kwargs:
+                Additional arguments for the S3 API call. See `AWS Put Object documentation
+                <https://docs.aws.amazon.com/AmazonS3/latest/API/RESTObjectPUT.html>`_ for more
+                info.
+        """
+
+        config = TransferConfig(multipart_threshold=part_size, multipart_chunksize=part_size)
+
+        self.client.upload_fileobj(
+            stream, bucket, key, ExtraArgs={"ACL": acl, **kwargs}, Config=config
+        )
+
     def remove_file(self, bucket, key):
         """
         Deletes an object from an S3 bucket
@@ -1,5 +1,6 @@
 import json
 import logging
+import math
 
 import requests
 
@@ -109,6 +110,25 @@ class Bloomerang(object):
     def _base_get(self, endpoint, entity_id=None, params=None):
         return self.conn.get_request(url=self._base_endpoint(endpoint, entity_id), params=params)
 
+    def _base_get_pages(self, endpoint, page_number=1, page_size=50, params=None):
+        # Fetch one page of results, or every page if page_number is None
+        params = params or {}
+
+        def get_page(page):
+            return self._base_get(
+                endpoint, params={**self._base_pagination_params(page, page_size), **params}
+            )
+
+        if page_number is not None:
+            return Table(get_page(page_number)["Results"])
+
+        def page_count(response):
+            total = response.get("TotalFiltered", response["Total"])
+            return math.ceil(total / min(page_size, 50))
+
+        responses = self.conn.get_pages(get_page, page_count)
+        return Table([result for response in responses for result in response["Results"]])
+
     def _base_delete(self, endpoint, entity_id=None):
         return self.conn.delete_request(url=self._base_endpoint(endpoint, entity_id))
 
@@ -163,7 +183,7 @@ class Bloomerang(object):
         """
         `Args:`
             page_number: int
-                Number of the page to fetch
+                Number of the page to fetch. Pass ``None`` to fetch every page.
             page_size: int
                 Number of records per page (maximum allowed is 50)
             order_by: str
@@ -175,14 +195,12 @@ class Bloomerang(object):
         `Returns:`
             A Table of the entries.
         """
-        params = self._base_pagination_params(page_number, page_size)
-        params.update(self._base_ordering_params(order_by, order_direction))
+        params = self._base_ordering_params(order_by, order_direction)
 
         if last_modified:
             params["lastModified"] = last_modified
 
-        response = self._base_get("constituents", params=params)
-        return Table(response["Results"])
+        return self._base_get_pages("constituents", page_number, page_size, params=params)
 
     def create_transaction(self, **kwargs):
         """
@@ -228,7 +246,7 @@ class Bloomerang(object):
         """
         `Args:`
             page_number: int
-                Number of the page to fetch
+                Number of the page to fetch. Pass ``None`` to fetch every page.
             page_size: int
                 Number of records per page (maximum allowed is 50)
             order_by: str
@@ -238,11 +256,9 @@ class Bloomerang(object):
         `Returns:`
             A  JSON of the entry or an error.
         """
-        params = self._base_pagination_params(page_number, page_size)
-        params.update(self._base_ordering_params(order_by, order_direction))
+        params = self._base_ordering_params(order_by, order_direction)
 
-        response = self._base_get("transactions", params=params)
-        return Table(response["Results"])
+        return self._base_get_pages("transactions", page_number, page_size, params=params)
 
     def get_transaction_designation(self, designation_id):
         """
@@ -260,7 +276,7 @@ class Bloomerang(object):
         """
         `Args:`
             page_number: int
-                Number of the page to fetch
+                Number of the page to fetch. Pass ``None`` to fetch every page.
             page_size: int
                 Number of records per page (maximum allowed is 50)
             order_by: str
@@ -270,11 +286,11 @@ class Bloomerang(object):
         `Returns:`
             A  JSON of the entry or an error.
         """
-        params = self._base_pagination_params(page_number, page_size)
-        params.update(self._base_ordering_params(order_by, order_direction))
+        params = self._base_ordering_params(order_by, order_direction)
 
-        response = self._base_get("transactions/designations", params=params)
-        return Table(response["Results"])
+        return self._base_get_pages(
+            "transactions/designations", page_number, page_size, params=params
+        )
 
     def create_interaction(self, **kwargs):
         """
@@ -320,12 +336,10 @@ class Bloomerang(object):
         """
         `Args:`
             page_number: int
-                Number of the page to fetch
+                Number of the page to fetch. Pass ``None`` to fetch every page.
             page_size: int
                 Number of records per page (maximum allowed is 50)
         `Returns:`
             A  JSON of the entry or an error.
         """
-        params = self._base_pagination_params(page_number, page_size)
-        response = self._base_get("interactions", params=params)
-        return Table(response["Results"])
+        return self._base_get_pages("interactions", page_number, page_size)
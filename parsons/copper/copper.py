@@ -1,12 +1,10 @@
 import json
 import logging
 import math
-import time
-
-from requests import request
 
 from parsons.etl import Table
 from parsons.utilities import check_env
+from parsons.utilities.api_connector import APIConnector
 
 logger = logging.getLogger(__name__)
 
@@ -33,11 +31,6 @@ class Copper(object):
         self.user_email = check_env.check("COPPER_USER_EMAIL", user_email)
         self.uri = COPPER_URI
 
-    def base_request(self, endpoint, req_type, page=1, page_size=200, filters=None):
-        # Internal Request Method
-
-        url = self.uri + endpoint
-
         # Authentication must be done through headers, requests HTTPBasicAuth doesn't work
         headers = {
             "X-PW-AccessToken": self.api_key,
@@ -45,6 +38,16 @@ class Copper(object):
             "X-PW-UserEmail": self.user_email,
             "Content-Type": "application/json",
         }
+        self.client = APIConnector(self.uri, headers=headers)
+
+        # Copper allows 180 requests a minute for each user
+        self.client.rate_limit = 3
+
+    def base_request(self, endpoint, req_type, page=1, page_size=200, filters=None):
+        # Internal Request Method
+
+        # Endpoints are relative to the versioned uri
+        url = endpoint.lstrip("/")
 
         payload = {}
         if filters is not None:
@@ -53,47 +56,44 @@ class Copper(object):
 
         # GET request with non-None data arg is malformed
         if req_type == "GET":
-            return request(req_type, url, params=json.dumps(payload), headers=headers)
+            return self.client.request(url, req_type, params=json.dumps(payload))
         else:
             payload["page_number"] = page
             payload["page_size"] = page_size
 
-            return request(req_type, url, data=json.dumps(payload), headers=headers)
+            return self.client.request(url, req_type, data=json.dumps(payload))
 
     def paginate_request(self, endpoint, req_type, page_size=200, filters=None):
         # Internal pagination method
 
         page = 1
-        total_pages = 2
-        blob = []
         only_page = False
 
         if isinstance(filters, dict):
             # Assume user wants just that page if page_number specified in filters
             if "page_number" in filters:
                 page = filters["page_number"]
-                # Ensure exactly one loop
-                total_pages = page
-                rows = f"{str(page_size)} or less"
                 only_page = True
         else:
             filters = {}
 
-        while page <= total_pages:
-            r = self.base_request(
+        def get_page(page):
+            return self.base_request(
                 endpoint, req_type, page_size=page_size, page=page, filters=filters
             )
 
-            if page == 1:
-                if "X-Pw-Total" in r.headers and not only_page:
-                    rows = r.headers["X-Pw-Total"]
-                    total_pages = int(math.ceil(int(rows) / float(page_size)))
-                else:
-                    rows = f"{str(page_size)} or less"
-                    total_pages = 1
-            logger.info(f"Retrieving page {page} of {total_pages}, total rows: {rows}")
-            page += 1
+        def page_count(r):
+            if "X-Pw-Total" in r.headers and not only_page:
+                rows = r.headers["X-Pw-Total"]
+                total_pages = int(math.ceil(int(rows) / float(page_size)))
+            else:
+                rows = f"{str(page_size)} or less"
+                total_pages = 1
+            logger.info(f"Retrieving {total_pages} pages, total rows: {rows}")
+            return total_pages
 
+        blob = []
+        for r in self.client.get_pages(get_page, page_count, first_page=page):
             if r.text == "":
                 return []
             # Avoid too many layers of nesting if possible
@@ -101,8 +101,6 @@ class Copper(object):
                 blob.extend(json.loads(r.text))
             else:
                 blob.append(json.loads(r.text))
-            # Wait for 1 second to avoid hitting rate limits
-            time.sleep(1)
 
         return blob
 
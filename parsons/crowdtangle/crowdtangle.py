@@ -1,16 +1,14 @@
 import logging
-import time
-
-from requests import request
 
 from parsons.etl import Table
 from parsons.utilities import check_env
+from parsons.utilities.api_connector import APIConnector
 
 logger = logging.getLogger(__name__)
 
 CT_URI = "https://api.crowdtangle.com/"
 PAGE_SIZE = 100
-REQUEST_SLEEP = 10  # CT has a rather agressive 6 requests per minute rate limit.
+REQUESTS_PER_SECOND = 0.1  # CT has a rather agressive 6 requests per minute rate limit.
 
 
 class CrowdTangle(object):
@@ -28,6 +26,10 @@ class CrowdTangle(object):
     def __init__(self, api_key=None):
         self.api_key = check_env.check("CT_API_KEY", api_key)
         self.uri = CT_URI
+        self.client = APIConnector(self.uri)
+        self.client.rate_limit = REQUESTS_PER_SECOND
+        # The API key is sent as a parameter, so identify the rate limit by it
+        self.client.rate_limit_key = self.api_key
 
     def _base_request(self, endpoint, req_type="GET", args=None):
         url = f"{self.uri}/{endpoint}"
@@ -37,16 +39,15 @@ class CrowdTangle(object):
         if args is not None:
             base_args.update(args)
 
-        r = request(req_type, url, params=base_args).json()
+        r = self.client.request(url, req_type, params=base_args).json()
         json = r["result"]
         keys = list(json.keys())
         data = json[keys[0]]
 
         while "nextPage" in list(json["pagination"].keys()):
             logger.info(f"Retrieving {PAGE_SIZE} rows.")
-            time.sleep(REQUEST_SLEEP)
             next_url = json["pagination"]["nextPage"]
-            r = request(req_type, next_url).json()
+            r = self.client.request(next_url, req_type).json()
             json = r["result"]
             data.extend(json[keys[0]])
 
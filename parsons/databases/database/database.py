@@ -1,6 +1,7 @@
 import logging
 
 import parsons.databases.database.constants as consts
+from parsons.utilities.sql_helpers import is_sql_number
 
 logger = logging.getLogger(__name__)
 
@@ -88,29 +89,7 @@ class DatabaseCreateStatement:
             bool
                 Whether or not the value is a valid sql number.
         """
-        # Python accepts numbers with single-underscore separators such as
-        # 100_000 (evals to 100000)
-        # SQL engines may not support this
-
-        # If its python type is a number, then it's a number
-        # 100_000 is stored at 100000 in memory so it's fine
-        # not using `isinstance` b/c isinstance(bool. (int, float)) == True
-        if type(val) in (int, float):
-            return True
-
-        # If it can be cast to a number and it doesn't contain underscores
-        # then it's a valid sql number
-        # Also check the first character is not zero
-        try:
-            if (float(val) or 1) and "_" not in val and (val in ("0", "0.0") or val[0] != "0"):
-                return True
-            else:
-                return False
-
-        # If it can't be cast to a number in python
-        # then it's not a number in sql
-        except (TypeError, ValueError):
-            return False
+        return is_sql_number(val)
 
     def detect_data_type(self, value, cmp_type=None):
         """Detect the higher of value's type cmp_type.
@@ -171,6 +150,46 @@ class DatabaseCreateStatement:
 
         return result
 
+    def detect_column_type(self, column, ignore_blanks=True):
+        """Detect the data type of a column from its ``Table.profile()`` stats.
+
+        This gives the same result as folding ``detect_data_type`` over every
+        value in the column, without rescanning the data. Columns mixing
+        booleans and numbers are typed as varchar.
+
+        `Args`:
+            column: dict
+                The column stats from ``Table.profile()``.
+            ignore_blanks: bool
+                Whether to ignore empty strings and ``'NA'`` placeholders.
+        `Returns`:
+            str
+                The string representation of the column type, or ``None`` if
+                the column has no values to type.
+        """
+        text_count = column["text_count"]
+        if ignore_blanks:
+            text_count -= column["blank_count"]
+
+        if text_count:
+            return self.VARCHAR
+
+        if column["bool_count"]:
+            if column["int_count"] or column["float_count"]:
+                return self.VARCHAR
+            return self.BOOL
+
+        if column["float_count"]:
+            return self.FLOAT
+
+        if column["int_count"]:
+            return self.get_bigger_int(
+                self.detect_data_type(column["int_min"]),
+                self.detect_data_type(column["int_max"]),
+            )
+
+        return None
+
     def format_column(self, col, index="", replace_chars=None, col_prefix="_"):
         """Format the column to meet database contraints.
 
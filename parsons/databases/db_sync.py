@@ -1,4 +1,8 @@
+import decimal
 import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from parsons.etl.table import Table
 
@@ -24,6 +28,25 @@ class DBSync:
         retries: int
             The number of times to retry if there is an error processing a
             chunk of data. The default value is 0.
+        pagination: str
+            How to page through the source table, either ``offset`` or ``keyset``. Offset
+            pagination uses ``LIMIT ... OFFSET``, which gets slower with every chunk on large
+            tables. Keyset pagination seeks on the ``order_by`` column (``WHERE key > last_key``),
+            so every chunk costs the same to read, and a retry resumes from the last key written
+            to the destination. The ``order_by`` column must be unique to use keyset pagination.
+            The default value is ``offset``.
+        slices: int
+            With keyset pagination on a numeric key, split the key range into this many slices
+            and copy them concurrently. The default value is 1.
+        max_workers: int
+            The maximum number of slices to copy at the same time. Defaults to ``slices``.
+        pipeline: bool
+            Read the next chunks from the source in a background thread while the current
+            chunk is being written to the destination, so that a sync runs at the speed of the
+            slower database rather than the sum of both. The default value is ``False``.
+        max_pipeline_rows: int
+            With ``pipeline`` enabled, the maximum number of rows that may be read ahead of the
+            destination writes and held in memory. Defaults to twice the ``write_chunk_size``.
     `Returns:`
         A DBSync object.
     """
@@ -35,12 +58,31 @@ class DBSync:
         read_chunk_size=100_000,
         write_chunk_size=None,
         retries=0,
+        pagination="offset",
+        slices=1,
+        max_workers=None,
+        pipeline=False,
+        max_pipeline_rows=None,
     ):
+        if pagination not in ("offset", "keyset"):
+            raise ValueError("Invalid pagination argument. Must be offset or keyset.")
+
+        if slices > 1 and pagination != "keyset":
+            raise ValueError("Copying in slices requires keyset pagination.")
+
         self.source_db = source_db
         self.dest_db = destination_db
         self.read_chunk_size = read_chunk_size
         self.write_chunk_size = write_chunk_size or read_chunk_size
         self.retries = retries
+        self.pagination = pagination
+        self.slices = slices
+        self.max_workers = max_workers or slices
+        self.pipeline = pipeline
+        self.max_pipeline_rows = max_pipeline_rows or 2 * self.write_chunk_size
+
+        # Progress of each slice of the most recent keyset copy
+        self.slice_progress = []
 
     def table_sync_full(
         self,
@@ -225,79 +267,318 @@ class DBSync:
             **kwargs: args
                 Optional copy arguments for destination database.
         `Returns:`
-            ``None``
+            int
+                The number of rows copied.
         """
 
+        if self.pagination == "keyset":
+            return self._copy_rows_keyset(
+                source_table_name, destination_table_name, cutoff, order_by, **kwargs
+            )
+
         # Create the table objects
         source_table = self.source_db.table(source_table_name)
 
-        # Initialize the Parsons table we will use to store rows before writing
-        buffer = Table()
+        progress = {"last_key": None, "rows_copied": 0, "done": False}
+        chunks = self._offset_chunks(source_table, cutoff, order_by)
 
-        # Track the number of retries we have left before giving up
-        retries_left = self.retries + 1
+        if self.pipeline:
+            chunks = self._prefetch(chunks)
+
+        self._write_chunks(chunks, destination_table_name, progress, **kwargs)
+
+        return progress["rows_copied"]
+
+    def _copy_rows_keyset(
+        self, source_table_name, destination_table_name, cutoff, primary_key, **kwargs
+    ):
+        """
+        Copy the rows from the source to the destination using keyset pagination, in one or
+        more key range slices.
+        """
+
+        if not primary_key:
+            raise ValueError("Keyset pagination requires an order_by column with unique values.")
+
+        source_table = self.source_db.table(source_table_name)
+
+        # Rows sharing a key across a page boundary would be skipped
+        if not source_table.distinct_primary_key(primary_key):
+            raise ValueError(
+                f"Keyset pagination requires unique values; {primary_key} is not distinct in "
+                f"{source_table_name}."
+            )
+
+        self.slice_progress = [
+            {"lower": lower, "upper": upper, "last_key": lower, "rows_copied": 0, "done": False}
+            for lower, upper in self._key_slices(source_table, cutoff, primary_key)
+        ]
+
+        def copy_from_last_key(progress):
+            # Pick up after the last key written to the destination, so a retry doesn't copy
+            # the rows already written again
+            chunks = self._keyset_chunks(
+                source_table, primary_key, progress["last_key"], progress["upper"]
+            )
+
+            if self.pipeline:
+                chunks = self._prefetch(chunks)
+
+            try:
+                self._write_chunks(chunks, destination_table_name, progress, retry=False, **kwargs)
+            finally:
+                chunks.close()
+
+        def copy_slice(progress):
+            self._retry("copying a slice", lambda: copy_from_last_key(progress))
+
+        if len(self.slice_progress) == 1:
+            copy_slice(self.slice_progress[0])
+
+        else:
+            logger.info(
+                "Copying %s slices of %s with %s workers",
+                len(self.slice_progress),
+                source_table_name,
+                self.max_workers,
+            )
+
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [
+                    executor.submit(copy_slice, progress) for progress in self.slice_progress
+                ]
+
+                # Raise the first error, if any
+                for future in futures:
+                    future.result()
+
+        return sum(progress["rows_copied"] for progress in self.slice_progress)
+
+    def _key_slices(self, source_table, cutoff, primary_key):
+        """
+        Split the key range after the cutoff into ``(lower, upper]`` slices. The first slice
+        has no lower bound for a full sync and the last slice has no upper bound, so rows
+        outside the sampled range are still copied.
+        """
+
+        if self.slices <= 1:
+            return [(cutoff, None)]
+
+        start = cutoff if cutoff is not None else source_table.min_primary_key(primary_key)
+        end = source_table.max_primary_key(primary_key)
+
+        numeric = (int, float, decimal.Decimal)
+        if not isinstance(start, numeric) or not isinstance(end, numeric):
+            logger.warning(
+                "Primary key %s is not numeric; copying the table in a single slice", primary_key
+            )
+            return [(cutoff, None)]
+
+        if end <= start:
+            return [(cutoff, None)]
+
+        step = (end - start) / self.slices
+        if isinstance(start, int) and isinstance(end, int):
+            step = max(1, int(step))
+
+        bounds = [cutoff]
+        for i in range(1, self.slices):
+            bound = start + step * i
+            if bound >= end:
+                break
+            bounds.append(bound)
+        bounds.append(None)
+
+        return list(zip(bounds[:-1], bounds[1:]))
+
+    def _offset_chunks(self, source_table, cutoff, order_by):
+        """
+        Read the source table in chunks with ``LIMIT ... OFFSET``. Yields tuples of
+        ``(rows, number_of_rows, last_key)``.
+        """
 
         total_rows_downloaded = 0
-        total_rows_written = 0
-        rows_buffered = 0
 
-        # Keep going until we break out
         while True:
-            try:
-                # Get the records to load into the database
-                if cutoff:
-                    # If we have a cutoff, we are loading data incrementally -- filter out
-                    # any data before our cutoff
-                    rows = source_table.get_new_rows(
+            # Get the records to load into the database
+            if cutoff:
+                # If we have a cutoff, we are loading data incrementally -- filter out
+                # any data before our cutoff
+                rows = self._retry(
+                    "reading data",
+                    lambda: source_table.get_new_rows(
                         primary_key=order_by,
                         cutoff_value=cutoff,
                         offset=total_rows_downloaded,
                         chunk_size=self.read_chunk_size,
-                    )
-                else:
-                    # Get a chunk
-                    rows = source_table.get_rows(
+                    ),
+                )
+            else:
+                # Get a chunk
+                rows = self._retry(
+                    "reading data",
+                    lambda: source_table.get_rows(
                         offset=total_rows_downloaded,
                         chunk_size=self.read_chunk_size,
                         order_by=order_by,
-                    )
-
-                number_of_rows = rows.num_rows
-                total_rows_downloaded += number_of_rows
-
-                # If we didn't get any data, exit the loop -- there's nothing to load
-                if number_of_rows == 0:
-                    # If we have any rows that are unwritten, flush them to the destination database
-                    if rows_buffered > 0:
-                        logger.debug(
-                            "Copying %s rows to %s",
-                            rows_buffered,
-                            destination_table_name,
-                        )
-                        self.dest_db.copy(
-                            buffer, destination_table_name, if_exists="append", **kwargs
+                    ),
+                )
+
+            number_of_rows = rows.num_rows
+
+            # If we didn't get any data, we're done -- there's nothing left to load
+            if number_of_rows == 0:
+                return
+
+            total_rows_downloaded += number_of_rows
+
+            yield rows, number_of_rows, None
+
+    def _keyset_chunks(self, source_table, primary_key, lower, upper):
+        """
+        Read the ``(lower, upper]`` key range of the source table in chunks, seeking past the
+        last key of each chunk. Yields tuples of ``(rows, number_of_rows, last_key)``.
+        """
+
+        last_key = lower
+
+        while True:
+            # Errors are retried for the whole slice, from the last key written
+            rows = source_table.get_new_rows(
+                primary_key=primary_key,
+                cutoff_value=last_key,
+                chunk_size=self.read_chunk_size,
+                upper_bound=upper,
+            )
+
+            number_of_rows = rows.num_rows
+
+            if number_of_rows > 0:
+                last_key = rows[number_of_rows - 1][primary_key]
+                yield rows, number_of_rows, last_key
+
+            # A short chunk means we've reached the end of the range
+            if not self.read_chunk_size or number_of_rows < self.read_chunk_size:
+                return
+
+    def _prefetch(self, chunks):
+        """
+        Read chunks in a background thread, passing them through a queue holding at most
+        ``max_pipeline_rows`` rows. The source is read while the caller writes the previous
+        chunks to the destination.
+        """
+
+        chunk_queue = queue.Queue()
+        rows_queued = [0]
+        room = threading.Condition()
+        stopped = threading.Event()
+
+        def read():
+            try:
+                for chunk in chunks:
+                    number_of_rows = chunk[1]
+
+                    with room:
+                        # Always let one chunk through, even if it's larger than the cap
+                        room.wait_for(
+                            lambda: stopped.is_set()
+                            or rows_queued[0] == 0
+                            or rows_queued[0] + number_of_rows <= self.max_pipeline_rows
                         )
-                        total_rows_written += rows_buffered
 
-                        # Reset the buffer
-                        rows_buffered = 0
-                        buffer = Table()
+                        if stopped.is_set():
+                            return
+
+                        rows_queued[0] += number_of_rows
+
+                    chunk_queue.put(("chunk", chunk))
+
+                chunk_queue.put(("done", None))
 
-                    break
+            except Exception as error:
+                chunk_queue.put(("error", error))
+
+        reader = threading.Thread(target=read, daemon=True)
+        reader.start()
+
+        try:
+            while True:
+                kind, item = chunk_queue.get()
 
-                # Add the new rows to our buffer
-                buffer.concat(rows)
-                rows_buffered += number_of_rows
+                if kind == "done":
+                    return
+                elif kind == "error":
+                    raise item
 
-                # If our buffer reaches our write threshold, write it out
-                if rows_buffered >= self.write_chunk_size:
-                    logger.debug("Copying %s rows to %s", rows_buffered, destination_table_name)
-                    self.dest_db.copy(buffer, destination_table_name, if_exists="append", **kwargs)
-                    total_rows_written += rows_buffered
+                yield item
 
-                    # Reset the buffer
-                    rows_buffered = 0
-                    buffer = Table()
+                with room:
+                    rows_queued[0] -= item[1]
+                    room.notify()
+
+        finally:
+            # Stop the reader if the writer gives up
+            stopped.set()
+            with room:
+                room.notify()
+
+    def _write_chunks(self, chunks, destination_table_name, progress, retry=True, **kwargs):
+        """
+        Buffer chunks of rows up to the write chunk size and copy them to the destination,
+        recording the last key and number of rows written in ``progress``. Each write is
+        retried unless ``retry`` is ``False``.
+        """
+
+        # Initialize the Parsons table we will use to store rows before writing
+        buffer = Table()
+        rows_buffered = 0
+        last_key = None
+
+        for rows, number_of_rows, last_key in chunks:
+            # Add the new rows to our buffer
+            buffer.concat(rows)
+            rows_buffered += number_of_rows
+
+            # If our buffer reaches our write threshold, write it out
+            if rows_buffered >= self.write_chunk_size:
+                self._write_buffer(buffer, rows_buffered, destination_table_name, retry, **kwargs)
+                progress["last_key"] = last_key
+                progress["rows_copied"] += rows_buffered
+
+                # Reset the buffer
+                buffer = Table()
+                rows_buffered = 0
+
+        # If we have any rows that are unwritten, flush them to the destination database
+        if rows_buffered > 0:
+            self._write_buffer(buffer, rows_buffered, destination_table_name, retry, **kwargs)
+            progress["last_key"] = last_key
+            progress["rows_copied"] += rows_buffered
+
+        progress["done"] = True
+
+    def _write_buffer(self, buffer, rows_buffered, destination_table_name, retry, **kwargs):
+        logger.debug("Copying %s rows to %s", rows_buffered, destination_table_name)
+
+        def write():
+            self.dest_db.copy(buffer, destination_table_name, if_exists="append", **kwargs)
+
+        if retry:
+            self._retry("copying data", write)
+        else:
+            write()
+
+    def _retry(self, action, func):
+        """
+        Call ``func``, retrying up to ``self.retries`` times if it raises an error.
+        """
+
+        # Track the number of retries we have left before giving up
+        retries_left = self.retries + 1
+
+        while True:
+            try:
+                return func()
 
             except Exception:
                 # Tick down the number of retries
@@ -309,9 +590,7 @@ class DBSync:
                     raise
 
                 # Otherwise, log the exception and try again
-                logger.exception("Unhandled error copying data; retrying")
-
-        return total_rows_written
+                logger.exception(f"Unhandled error {action}; retrying")
 
     @staticmethod
     def _check_column_match(source_table_obj, destination_table_obj):
@@ -1,7 +1,5 @@
 import logging
 
-import petl
-
 import parsons.databases.mysql.constants as consts
 from parsons.databases.database.database import DatabaseCreateStatement
 
@@ -52,14 +50,14 @@ class MySQLCreateTable(DatabaseCreateStatement):
 
     def evaluate_table(self, tbl):
         # Generate a dict of MySQL column types and widths for all columns
-        # in a table.
+        # in a table, from a single profiling pass over the table.
 
         table_map = []
 
-        for col in tbl.columns:
-            col_type, col_width = self.evaluate_column(tbl.column_data(col))
-            col_map = {"name": col, "type": col_type, "width": col_width}
-            table_map.append(col_map)
+        for col in tbl.profile()["columns"]:
+            col_type = self.detect_column_type(col, ignore_blanks=False) or self.VARCHAR
+            col_width = col["max_width"] if col_type == self.VARCHAR else 0
+            table_map.append({"name": col["name"], "type": col_type, "width": col_width})
 
         return table_map
 
@@ -67,7 +65,7 @@ class MySQLCreateTable(DatabaseCreateStatement):
         # Generate create statement SQL for a given Parsons table.
 
         # Validate and rename column names if needed
-        tbl.table = petl.setheader(tbl.table, self.columns_convert(tbl.columns))
+        tbl.set_header(self.columns_convert(tbl.columns))
 
         # Generate the table map
         table_map = self.evaluate_table(tbl)
@@ -1,16 +1,19 @@
 import logging
 import os
-import pickle
+import shutil
+import tempfile
+import threading
 from contextlib import contextmanager
 
 import mysql.connector as mysql
-import petl
 
 from parsons import Table
 from parsons.databases.alchemy import Alchemy
 from parsons.databases.database_connector import DatabaseConnector
 from parsons.databases.mysql.create_table import MySQLCreateTable
 from parsons.databases.table import BaseTable
+from parsons.etl.spill import SpillView, SpillWriter
+from parsons.etl.stream import CSVStream
 from parsons.utilities import check_env, files
 
 # Max number of rows that we query at a time, so we can avoid loading huge
@@ -18,6 +21,9 @@ from parsons.utilities import check_env, files
 # 100k rows per batch at ~1k bytes each = ~100MB per batch.
 QUERY_BATCH_SIZE = 100000
 
+# Bytes written at a time when streaming a LOAD DATA file
+STREAM_BLOCK_SIZE = 128 * 1024
+
 logger = logging.getLogger(__name__)
 
 
@@ -48,7 +54,7 @@ class MySQL(DatabaseConnector, MySQLCreateTable, Alchemy):
         self.port = port or os.environ.get("MYSQL_PORT")
 
     @contextmanager
-    def connection(self):
+    def connection(self, **kwargs):
         """
         Generate a MySQL connection. The connection is set up as a python "context manager", so
         it will be closed automatically (and all queries committed) when the connection goes out
@@ -58,6 +64,10 @@ class MySQL(DatabaseConnector, MySQLCreateTable, Alchemy):
         any context manager):
         ``with mysql.connection() as conn:``
 
+        `Args:`
+            **kwargs: kwargs
+                Additional arguments passed to ``mysql.connector.connect``
+
         `Returns:`
             MySQL `connection` object
         """
@@ -69,6 +79,7 @@ class MySQL(DatabaseConnector, MySQLCreateTable, Alchemy):
             passwd=self.password,
             database=self.db,
             port=self.port,
+            **kwargs,
         )
 
         try:
@@ -169,26 +180,23 @@ class MySQL(DatabaseConnector, MySQLCreateTable, Alchemy):
                 return None
 
             else:
-                # Fetch the data in batches, and "pickle" the rows to a temp file.
-                # (We pickle rather than writing to, say, a CSV, so that we maintain
+                # Fetch the data in batches, and write the rows to a temp spill file in
+                # blocks. (We spill rather than writing to, say, a CSV, so that we maintain
                 # all the type information for each field.)
                 temp_file = files.create_temp_file()
+                header = cursor.column_names
 
-                with open(temp_file, "wb") as f:
-                    # Grab the header
-                    pickle.dump(cursor.column_names, f)
-
+                with SpillWriter(temp_file, header) as writer:
                     while True:
                         batch = cursor.fetchmany(QUERY_BATCH_SIZE)
                         if len(batch) == 0:
                             break
 
                         logger.debug(f"Fetched {len(batch)} rows.")
-                        for row in batch:
-                            pickle.dump(row, f)
+                        writer.write(batch)
 
                 # Load a Table from the file
-                final_tbl = Table(petl.frompickle(temp_file))
+                final_tbl = Table(SpillView(temp_file))
 
                 logger.debug(f"Query returned {final_tbl.num_rows} rows.")
                 return final_tbl
@@ -198,16 +206,18 @@ class MySQL(DatabaseConnector, MySQLCreateTable, Alchemy):
         tbl: Table,
         table_name: str,
         if_exists: str = "fail",
-        chunk_size: int = 1000,
+        chunk_size: int = None,
         strict_length: bool = True,
+        method: str = "insert",
     ):
         """
         Copy a :ref:`parsons-table` to the database.
 
         .. note::
-            This method utilizes extended inserts rather `LOAD DATA INFILE` since
-            many MySQL Database configurations do not allow data files to be
-            loaded. It results in a minor performance hit compared to `LOAD DATA`.
+            By default this method uses batched, parameterized extended inserts rather than
+            `LOAD DATA INFILE` since many MySQL Database configurations do not allow data files
+            to be loaded. Pass ``method="load_data"`` to stream the table to the server with
+            `LOAD DATA LOCAL INFILE` when the server has ``local_infile`` enabled.
 
         `Args:`
             tbl: parsons.Table
@@ -218,50 +228,186 @@ class MySQL(DatabaseConnector, MySQLCreateTable, Alchemy):
                 If the table already exists, either ``fail``, ``append``, ``drop``
                 or ``truncate`` the table.
             chunk_size: int
-                The number of rows to insert per query.
+                The maximum number of rows to insert per query. If not set, batches are sized
+                to fit within the server's ``max_allowed_packet``.
             strict_length: bool
                 If the database table needs to be created, strict_length determines whether
                 the created table's column sizes will be sized to exactly fit the current data,
                 or if their size will be rounded up to account for future values being larger
                 then the current dataset. defaults to ``True``
+            method: str
+                Either ``insert`` or ``load_data``. If ``load_data`` is requested but the server
+                does not allow local data files, the copy falls back to ``insert``.
         """
 
+        if method not in ["insert", "load_data"]:
+            raise ValueError("Invalid value for `method` argument")
+
         if tbl.num_rows == 0:
             logger.info("Parsons table is empty. Table will not be created.")
             return None
 
-        with self.connection() as connection:
-            # Create table if not exists
-            if self._create_table_precheck(connection, table_name, if_exists):
-                sql = self.create_statement(tbl, table_name, strict_length=strict_length)
-                self.query_with_connection(sql, connection, commit=False)
-                logger.info(f"Table {table_name} created.")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # The connector will only read local data files from inside this directory
+            connect_args = {"allow_local_infile_in_path": temp_dir} if method == "load_data" else {}
 
-            # Chunk tables in batches of 1K rows, though this can be tuned and
-            # optimized further.
-            for t in tbl.chunk(chunk_size):
-                sql = self._insert_statement(t, table_name)
-                self.query_with_connection(sql, connection, commit=False)
+            with self.connection(**connect_args) as connection:
+                # Create table if not exists
+                if self._create_table_precheck(connection, table_name, if_exists):
+                    sql = self.create_statement(tbl, table_name, strict_length=strict_length)
+                    self.query_with_connection(sql, connection, commit=False)
+                    logger.info(f"Table {table_name} created.")
+
+                if method == "load_data":
+                    if self._server_variable(connection, "local_infile") in (1, "1", "ON"):
+                        self._load_data(tbl, table_name, connection, temp_dir)
+                        return None
+
+                    logger.warning(
+                        "Server does not allow LOAD DATA LOCAL INFILE. Falling back to inserts."
+                    )
 
-    def _insert_statement(self, tbl, table_name):
+                self._insert_rows(tbl, table_name, connection, chunk_size)
+
+    def _server_variable(self, connection, name):
+        with self.cursor(connection) as cursor:
+            cursor.execute(f"SELECT @@{name}")
+            return cursor.fetchone()[0]
+
+    def _insert_batches(self, rows, max_bytes, chunk_size=None):
         """
-        Convert the table data into a string for bulk importing.
+        Group rows into batches whose estimated statement size stays under ``max_bytes``.
         """
 
-        # Single column tables
-        if len(tbl.columns) == 1:
-            values = [f"({row[0]})" for row in tbl.data]
+        batch = []
+        batch_bytes = 0
 
-        # Multi-column tables
-        else:
-            values = [str(row) for row in tbl.data]
+        for row in rows:
+            # Rough size of the row once escaped into the VALUES clause
+            row_bytes = sum(len(str(v)) + 4 for v in row)
+
+            if batch and (
+                batch_bytes + row_bytes > max_bytes or (chunk_size and len(batch) >= chunk_size)
+            ):
+                yield batch
+                batch = []
+                batch_bytes = 0
+
+            batch.append(tuple(row))
+            batch_bytes += row_bytes
+
+        if batch:
+            yield batch
+
+    def _insert_rows(self, tbl, table_name, connection, chunk_size=None):
+        """
+        Insert the table's rows in a single pass with batched, parameterized inserts.
+        """
+
+        # Leave headroom in the packet for escaping and the statement itself
+        max_bytes = int(self._server_variable(connection, "max_allowed_packet")) // 2
+
+        rows = iter(tbl.table)
+        columns = next(rows)
 
-        # Create full insert statement
         sql = f"""INSERT INTO {table_name}
-                  ({",".join(tbl.columns)})
-                  VALUES {",".join(values)};"""
+                  ({",".join(columns)})
+                  VALUES ({",".join(["%s"] * len(columns))})"""
+
+        with self.cursor(connection) as cursor:
+            for batch in self._insert_batches(rows, max_bytes, chunk_size):
+                # The connector rewrites executemany inserts into a single multi-row INSERT
+                cursor.executemany(sql, batch)
+                logger.debug(f"Inserted {len(batch)} rows into {table_name}.")
+
+    @staticmethod
+    def _load_data_rows(tbl):
+        # Encode values the way LOAD DATA expects them with the default escape character
+        rows = iter(tbl.table)
+        yield next(rows)
+
+        for row in rows:
+            values = []
+            for v in row:
+                if v is None:
+                    values.append("\\N")
+                elif isinstance(v, bool):
+                    values.append(int(v))
+                elif isinstance(v, str):
+                    values.append(v.replace("\\", "\\\\"))
+                else:
+                    values.append(v)
+            yield values
+
+    def _load_data(self, tbl, table_name, connection, temp_dir):
+        """
+        Stream the table into the server with ``LOAD DATA LOCAL INFILE``.
+
+        On platforms with named pipes the CSV is written into a pipe as the server reads it,
+        so the data never touches the disk. Otherwise it is written to a temp file first.
+        """
+
+        stream = CSVStream(self._load_data_rows(tbl), write_header=False)
+        columns = tbl.columns
+        path = os.path.join(temp_dir, "data.csv")
+
+        sql = f"""LOAD DATA LOCAL INFILE '{path}'
+                  INTO TABLE {table_name}
+                  CHARACTER SET utf8mb4
+                  FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '"'
+                  LINES TERMINATED BY '\\r\\n'
+                  ({",".join(columns)})"""
+
+        if not hasattr(os, "mkfifo"):
+            with open(path, "wb") as f:
+                shutil.copyfileobj(stream, f)
+            self.query_with_connection(sql, connection, commit=False)
+            return None
+
+        os.mkfifo(path)
+        done = threading.Event()
+        errors = []
+
+        def write_pipe():
+            try:
+                with open(path, "wb") as f:
+                    while not done.is_set():
+                        block = stream.read(STREAM_BLOCK_SIZE)
+                        if not block:
+                            break
+                        f.write(block)
+            except BrokenPipeError:
+                logger.debug("LOAD DATA stopped reading before the end of the table.")
+            except BaseException as error:
+                # Closing the pipe looks like the end of the data to the server, so the error
+                # is raised once the load returns
+                errors.append(error)
+
+        writer = threading.Thread(target=write_pipe, daemon=True)
+        writer.start()
+
+        try:
+            self.query_with_connection(sql, connection, commit=False)
+        finally:
+            # Stop the writer, opening the pipe ourselves in case the server never did, and
+            # drain whatever it was blocked writing so that it can exit.
+            done.set()
+            fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+            try:
+                while writer.is_alive():
+                    try:
+                        os.read(fd, STREAM_BLOCK_SIZE)
+                    except BlockingIOError:
+                        writer.join(0.01)
+            finally:
+                os.close(fd)
+
+        # Don't keep the rows loaded before the table failed
+        if errors:
+            connection.rollback()
+            raise errors[0]
 
-        return sql
+        logger.debug(f"Loaded {stream.num_rows} rows into {table_name}.")
 
     def _create_table_precheck(self, connection, table_name, if_exists):
         """
@@ -59,6 +59,7 @@ class Postgres(PostgresCore, Alchemy, DatabaseConnector):
         table_name: str,
         if_exists: str = "fail",
         strict_length: bool = False,
+        stream: bool = True,
     ):
         """
         Copy a :ref:`parsons-table` to Postgres.
@@ -76,6 +77,10 @@ class Postgres(PostgresCore, Alchemy, DatabaseConnector):
                 the created table's column sizes will be sized to exactly fit the current data,
                 or if their size will be rounded up to account for future values being larger
                 then the current dataset. Defaults to ``False``.
+            stream: bool
+                Stream the rows straight into ``COPY FROM STDIN`` as CSV, rather than writing
+                the table to a temporary CSV file first. Streaming needs no disk space and only
+                reads through the table once. Defaults to ``True``.
         """
 
         with self.connection() as connection:
@@ -91,8 +96,15 @@ class Postgres(PostgresCore, Alchemy, DatabaseConnector):
             sql = f"""COPY "{table_name}" ("{'","'.join(tbl.columns)}") FROM STDIN CSV HEADER;"""
 
             with self.cursor(connection) as cursor:
-                cursor.copy_expert(sql, open(tbl.to_csv(), "r"))
-                logger.info(f"{tbl.num_rows} rows copied to {table_name}.")
+                if stream:
+                    csv_stream = tbl.to_csv_stream()
+                    cursor.copy_expert(sql, csv_stream)
+                    num_rows = csv_stream.num_rows
+                else:
+                    cursor.copy_expert(sql, open(tbl.to_csv(), "r"))
+                    num_rows = tbl.num_rows
+
+                logger.info(f"{num_rows} rows copied to {table_name}.")
 
     def table(self, table_name):
         # Return a Postgres table object
@@ -1,13 +1,12 @@
 import logging
-import pickle
 from contextlib import contextmanager
 from typing import Optional
 
-import petl
 import psycopg2
 import psycopg2.extras
 
 from parsons.databases.postgres.postgres_create_statement import PostgresCreateStatement
+from parsons.etl.spill import SpillView, SpillWriter
 from parsons.etl.table import Table
 from parsons.utilities import files
 
@@ -140,28 +139,23 @@ class PostgresCore(PostgresCreateStatement):
                 return None
 
             else:
-                # Fetch the data in batches, and "pickle" the rows to a temp file.
-                # (We pickle rather than writing to, say, a CSV, so that we maintain
+                # Fetch the data in batches, and write the rows to a temp spill file in
+                # blocks. (We spill rather than writing to, say, a CSV, so that we maintain
                 # all the type information for each field.)
-
                 temp_file = files.create_temp_file()
+                header = [i[0] for i in cursor.description]
 
-                with open(temp_file, "wb") as f:
-                    # Grab the header
-                    header = [i[0] for i in cursor.description]
-                    pickle.dump(header, f)
-
+                with SpillWriter(temp_file, header) as writer:
                     while True:
                         batch = cursor.fetchmany(QUERY_BATCH_SIZE)
                         if not batch:
                             break
 
                         logger.debug(f"Fetched {len(batch)} rows.")
-                        for row in batch:
-                            pickle.dump(list(row), f)
+                        writer.write(batch)
 
                 # Load a Table from the file
-                final_tbl = Table(petl.frompickle(temp_file))
+                final_tbl = Table(SpillView(temp_file))
 
                 logger.debug(f"Query returned {final_tbl.num_rows} rows.")
                 return final_tbl
@@ -1,7 +1,5 @@
 import logging
 
-import petl
-
 import parsons.databases.postgres.constants as consts
 from parsons.databases.database.database import DatabaseCreateStatement
 
@@ -59,11 +57,11 @@ class PostgresCreateStatement(DatabaseCreateStatement):
         # Redshift and should not be passed when generating a create statement for
         # Postgres.
 
-        if tbl.num_rows == 0:
+        if tbl.profile()["num_rows"] == 0:
             raise ValueError("Table is empty. Must have 1 or more rows.")
 
         # Validate and rename column names if needed
-        tbl.table = petl.setheader(tbl.table, self.column_name_validate(tbl.columns))
+        tbl.set_header(self.column_name_validate(tbl.columns))
 
         mapping = self.generate_data_types(tbl)
 
@@ -101,36 +99,16 @@ class PostgresCreateStatement(DatabaseCreateStatement):
         return self.is_valid_sql_num(val)
 
     def generate_data_types(self, table):
-        # Generate column data types
-
-        longest, type_list = [], []
-
-        cont = petl.records(table.table)
-
-        # Populate empty values for the columns
-        for col in table.columns:
-            longest.append(0)
-            type_list.append("")
-
-        for row in cont:
-            for i in range(len(row)):
-                # NA is the csv null value
-                if type_list[i] == "varchar" or row[i] in ["NA", ""]:
-                    pass
-                else:
-                    var_type = self.data_type(row[i], type_list[i])
-                    type_list[i] = var_type
-
-                # Calculate width
-                width = len(str(row[i]).encode("utf-8"))
-                if width > longest[i]:
-                    longest[i] = width
-
-        # In L140 'NA' and '' will be skipped
-        # If the entire column is either one of those (or a mix of the two)
-        # the type will be empty.
+        # Generate column data types from a single profiling pass over the table
+
+        columns = table.profile()["columns"]
+
+        longest = [col["max_width"] for col in columns]
+
+        # 'NA' and '' are csv null values, so they are ignored. If the entire
+        # column is either one of those (or a mix of the two) no type is detected.
         # Fill with a default varchar
-        type_list = [typ or "varchar" for typ in type_list]
+        type_list = [self.detect_column_type(col) or "varchar" for col in columns]
 
         return {"longest": longest, "headers": table.columns, "type_list": type_list}
 
@@ -2,12 +2,10 @@ import datetime
 import json
 import logging
 import os
-import pickle
 import random
 from contextlib import contextmanager
 from typing import List, Optional
 
-import petl
 import psycopg2
 import psycopg2.extras
 
@@ -18,6 +16,7 @@ from parsons.databases.redshift.rs_create_table import RedshiftCreateTable
 from parsons.databases.redshift.rs_schema import RedshiftSchema
 from parsons.databases.redshift.rs_table_utilities import RedshiftTableUtilities
 from parsons.databases.table import BaseTable
+from parsons.etl.spill import SpillView, SpillWriter
 from parsons.etl.table import Table
 from parsons.utilities import files, sql_helpers
 
@@ -237,28 +236,23 @@ class Redshift(
                 return None
 
             else:
-                # Fetch the data in batches, and "pickle" the rows to a temp file.
-                # (We pickle rather than writing to, say, a CSV, so that we maintain
+                # Fetch the data in batches, and write the rows to a temp spill file in
+                # blocks. (We spill rather than writing to, say, a CSV, so that we maintain
                 # all the type information for each field.)
-
                 temp_file = files.create_temp_file()
+                header = [i[0] for i in cursor.description]
 
-                with open(temp_file, "wb") as f:
-                    # Grab the header
-                    header = [i[0] for i in cursor.description]
-                    pickle.dump(header, f)
-
+                with SpillWriter(temp_file, header) as writer:
                     while True:
                         batch = cursor.fetchmany(QUERY_BATCH_SIZE)
                         if not batch:
                             break
 
                         logger.debug(f"Fetched {len(batch)} rows.")
-                        for row in batch:
-                            pickle.dump(list(row), f)
+                        writer.write(batch)
 
                 # Load a Table from the file
-                final_tbl = Table(petl.frompickle(temp_file))
+                final_tbl = Table(SpillView(temp_file))
 
                 logger.debug(f"Query returned {final_tbl.num_rows} rows.")
                 return final_tbl
@@ -499,6 +493,7 @@ class Redshift(
         temp_bucket_region: Optional[str] = None,
         strict_length: bool = True,
         csv_encoding: str = "utf-8",
+        parts: Optional[int] = None,
     ):
         """
         Copy a :ref:`parsons-table` to Redshift.
@@ -612,6 +607,12 @@ class Redshift(
             csv_ecoding: str
                 String encoding to use when writing the temporary CSV file that is uploaded to S3.
                 Defaults to 'utf-8'.
+            parts: int
+                The number of gzipped CSV files the table is split into and uploaded
+                concurrently, so that the cluster's slices can load them in parallel. If
+                ``None``, large tables are split into a multiple of the cluster's slice count and
+                small tables are uploaded as a single file. Set to ``1`` to always upload a
+                single file.
 
         `Returns`
             Parsons Table or ``None``
@@ -652,13 +653,28 @@ class Redshift(
                     tbl, table_name, drop_dependencies=alter_table_cascade
                 )
 
-            # Upload the table to S3
-            key = self.temp_s3_copy(
-                tbl,
-                aws_access_key_id=aws_access_key_id,
-                aws_secret_access_key=aws_secret_access_key,
-                csv_encoding=csv_encoding,
-            )
+            num_rows = None
+            if parts is None:
+                parts, num_rows = self._copy_parts(tbl)
+
+            # Upload the table to S3, split into parts listed in a manifest if needed
+            part_keys = []
+            if parts > 1:
+                key, part_keys = self.temp_s3_copy_parts(
+                    tbl,
+                    parts,
+                    aws_access_key_id=aws_access_key_id,
+                    aws_secret_access_key=aws_secret_access_key,
+                    csv_encoding=csv_encoding,
+                    num_rows=num_rows,
+                )
+            else:
+                key = self.temp_s3_copy(
+                    tbl,
+                    aws_access_key_id=aws_access_key_id,
+                    aws_secret_access_key=aws_secret_access_key,
+                    csv_encoding=csv_encoding,
+                )
 
             try:
                 # Copy to Redshift database.
@@ -680,6 +696,7 @@ class Redshift(
                     "aws_secret_access_key": aws_secret_access_key,
                     "compression": "gzip",
                     "bucket_region": temp_bucket_region,
+                    "manifest": bool(part_keys),
                 }
 
                 # Copy from S3 to Redshift
@@ -694,6 +711,8 @@ class Redshift(
             # Clean up the S3 bucket.
             finally:
                 if key and cleanup_s3_file:
+                    for part_key in part_keys:
+                        self.temp_s3_delete(part_key)
                     self.temp_s3_delete(key)
 
     def unload(
@@ -1184,10 +1203,10 @@ class Redshift(
         """
 
         # Make the Parsons table column names match valid Redshift names
-        tbl.table = petl.setheader(tbl.table, self.column_name_validate(tbl.columns))
+        tbl.set_header(self.column_name_validate(tbl.columns))
 
         # Create a list of column names and max width for string values.
-        pc = {c: tbl.get_column_max_width(c) for c in tbl.columns}
+        pc = {c["name"]: c["max_width"] for c in tbl.profile()["columns"]}
 
         # Determine the max width of the varchar columns in the Redshift table
         s, t = self.split_full_table_name(table_name)
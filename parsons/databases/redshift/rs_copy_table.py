@@ -1,6 +1,8 @@
 import logging
+import math
 import os
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 from parsons.aws.s3 import S3
 
@@ -8,12 +10,25 @@ logger = logging.getLogger(__name__)
 
 S3_TEMP_KEY_PREFIX = "Parsons_RedshiftCopyTable"
 
+# Each slice of a Redshift cluster loads one file at a time, so large tables are split into a
+# multiple of the slice count. Tables are only split once every slice gets this many rows.
+MIN_ROWS_PER_PART = 50000
+
+# Large tables get more than one part per slice, each about this many rows
+TARGET_ROWS_PER_PART = 1000000
+
+# The number of parts compressed and uploaded to S3 at once
+UPLOAD_WORKERS = 8
+
 
 class RedshiftCopyTable(object):
     aws_access_key_id = None
     aws_secret_access_key = None
     iam_role = None
 
+    # The number of slices in the cluster, read once per connector; 0 if it can't be read
+    _slice_count = None
+
     def __init__(self, use_env_token=True):
         self.use_env_token = use_env_token
 
@@ -139,13 +154,7 @@ class RedshiftCopyTable(object):
             aws_access_key_id, aws_secret_access_key
         )
 
-    def temp_s3_copy(
-        self,
-        tbl,
-        aws_access_key_id=None,
-        aws_secret_access_key=None,
-        csv_encoding="utf-8",
-    ):
+    def _temp_s3_setup(self, aws_access_key_id=None, aws_secret_access_key=None):
         if not self.s3_temp_bucket:
             raise KeyError(
                 (
@@ -164,19 +173,127 @@ class RedshiftCopyTable(object):
             use_env_token=self.use_env_token,
         )
 
-        hashed_name = hash(time.time())
-        key = f"{S3_TEMP_KEY_PREFIX}/{hashed_name}.csv.gz"
+        key = f"{S3_TEMP_KEY_PREFIX}/{hash(time.time())}"
         if self.s3_temp_bucket_prefix:
             key = self.s3_temp_bucket_prefix + "/" + key
 
-        # Convert table to compressed CSV file, to optimize the transfers to S3 and to
-        # Redshift.
-        local_path = tbl.to_csv(temp_file_compression="gzip", encoding=csv_encoding)
-        # Copy table to bucket
-        self.s3.put_file(self.s3_temp_bucket, key, local_path)
+        return key
+
+    def temp_s3_copy(
+        self,
+        tbl,
+        aws_access_key_id=None,
+        aws_secret_access_key=None,
+        csv_encoding="utf-8",
+    ):
+        key = self._temp_s3_setup(aws_access_key_id, aws_secret_access_key) + ".csv.gz"
+
+        # Stream the table to the bucket as compressed CSV, to optimize the transfers to S3 and
+        # to Redshift, without writing it to a local file.
+        stream = tbl.to_csv_stream(encoding=csv_encoding, compression="gzip")
+        self.s3.put_stream(self.s3_temp_bucket, key, stream)
 
         return key
 
+    def temp_s3_copy_parts(
+        self,
+        tbl,
+        parts,
+        aws_access_key_id=None,
+        aws_secret_access_key=None,
+        csv_encoding="utf-8",
+        max_workers=UPLOAD_WORKERS,
+        num_rows=None,
+    ):
+        """
+        Split a table into gzipped CSV parts, upload them to the temp bucket concurrently and
+        write a manifest listing them. Pass ``num_rows`` if the table's rows have already been
+        counted, so that the table isn't read an extra time to count them.
+
+        `Returns:`
+            tuple
+                The manifest key and a list of the part keys
+        """
+
+        prefix = self._temp_s3_setup(aws_access_key_id, aws_secret_access_key) + "/"
+        if num_rows is None:
+            num_rows = tbl.num_rows
+        rows_per_part = max(1, math.ceil(num_rows / parts))
+
+        def upload(part, key):
+            stream = part.to_csv_stream(encoding=csv_encoding, compression="gzip")
+            self.s3.put_stream(self.s3_temp_bucket, key, stream)
+
+        keys = []
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                pending = set()
+
+                # Parts are read from the table in a single pass; only as many as are being
+                # uploaded are held in memory at once.
+                for i, part in enumerate(tbl.iter_chunks(rows_per_part)):
+                    key = f"{prefix}part-{i:05d}.csv.gz"
+                    keys.append(key)
+                    pending.add(executor.submit(upload, part, key))
+
+                    if len(pending) >= max_workers:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            future.result()
+
+                for future in pending:
+                    future.result()
+
+            logger.info(f"Uploaded {len(keys)} parts to s3://{self.s3_temp_bucket}/{prefix}")
+
+            manifest_key = f"{prefix}manifest.json"
+            self.generate_manifest(
+                self.s3_temp_bucket,
+                aws_access_key_id=aws_access_key_id or self.aws_access_key_id,
+                aws_secret_access_key=aws_secret_access_key or self.aws_secret_access_key,
+                prefix=f"{prefix}part-",
+                manifest_bucket=self.s3_temp_bucket,
+                manifest_key=manifest_key,
+            )
+
+        except Exception:
+            for key in keys:
+                self.temp_s3_delete(key)
+            raise
+
+        return manifest_key, keys
+
+    def _slices(self):
+        if self._slice_count is None:
+            try:
+                self._slice_count = self.query("select count(*) as slices from stv_slices").first
+            except Exception:
+                logger.debug("Could not read the slice count from stv_slices.")
+                self._slice_count = 0
+
+        return self._slice_count or 0
+
+    def _copy_parts(self, tbl):
+        """
+        Choose how many parts to split a table into for a parallel ``COPY``: a multiple of the
+        cluster's slice count for large tables, and a single file for small ones.
+
+        `Returns:`
+            tuple
+                The number of parts and the table's row count, or ``None`` if the rows weren't
+                counted
+        """
+
+        slices = self._slices()
+        if not slices:
+            return 1, None
+
+        num_rows = tbl.num_rows
+        if num_rows < slices * MIN_ROWS_PER_PART:
+            return 1, num_rows
+
+        return slices * max(1, num_rows // (slices * TARGET_ROWS_PER_PART)), num_rows
+
     def temp_s3_delete(self, key):
         if key:
             self.s3.remove_file(self.s3_temp_bucket, key)
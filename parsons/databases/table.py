@@ -40,6 +40,20 @@ class BaseTable:
         """
         ).first
 
+    def min_primary_key(self, primary_key):
+        """
+        Get the minimum primary key in the table.
+        """
+
+        return self.db.query(
+            f"""
+            SELECT {primary_key}
+            FROM {self.table}
+            ORDER BY {primary_key} ASC
+            LIMIT 1
+        """
+        ).first
+
     def distinct_primary_key(self, primary_key):
         """
         Check if the passed primary key column is distinct.
@@ -115,20 +129,30 @@ class BaseTable:
 
         return self.db.query(sql, params).first
 
-    def get_new_rows(self, primary_key, cutoff_value, offset=0, chunk_size=None):
+    def get_new_rows(self, primary_key, cutoff_value, offset=0, chunk_size=None, upper_bound=None):
         """
         Get rows that have a greater primary key value than the one
         provided.
 
-        It will select every value greater than the provided value.
+        It will select every value greater than the provided value. If an
+        ``upper_bound`` is provided, it will also only select values less than
+        or equal to it. Passing the last primary key of the previous chunk as
+        the ``cutoff_value`` (rather than an ``offset``) pages through the
+        table with an index seek, so every chunk costs the same to read.
         """
 
+        clauses = []
+        parameters = []
+
         if cutoff_value is not None:
-            where_clause = f"WHERE {primary_key} > %s"
-            parameters = [cutoff_value]
-        else:
-            where_clause = ""
-            parameters = []
+            clauses.append(f"{primary_key} > %s")
+            parameters.append(cutoff_value)
+
+        if upper_bound is not None:
+            clauses.append(f"{primary_key} <= %s")
+            parameters.append(upper_bound)
+
+        where_clause = f"WHERE {' AND '.join(clauses)}" if clauses else ""
 
         sql = f"""
                SELECT
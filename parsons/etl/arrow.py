@@ -0,0 +1,307 @@
+import datetime
+import decimal
+import logging
+
+import petl
+
+logger = logging.getLogger(__name__)
+
+# Python types that round-trip through Arrow buffers without changing value or type. Columns
+# holding anything else (dicts, lists, mixed types, tz-aware datetimes) stay in petl.
+ARROW_SAFE_TYPES = (
+    bool,
+    int,
+    float,
+    str,
+    bytes,
+    decimal.Decimal,
+    datetime.date,
+    datetime.datetime,
+    datetime.time,
+)
+
+# petl string method converters and their vectorized Arrow equivalents
+STRING_METHODS = {
+    "upper": "utf8_upper",
+    "lower": "utf8_lower",
+    "strip": "utf8_trim_whitespace",
+    "lstrip": "utf8_ltrim_whitespace",
+    "rstrip": "utf8_rtrim_whitespace",
+}
+
+
+def import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            "The arrow engine requires pyarrow. Install it with `pip install parsons[arrow]`."
+        )
+
+    return pyarrow
+
+
+def is_arrow(tbl):
+    """
+    Returns ``True`` if the petl table is backed by Arrow column buffers.
+    """
+
+    return isinstance(tbl, ArrowView)
+
+
+class ArrowView(petl.Table):
+    """
+    A petl table backed by a ``pyarrow.Table``.
+
+    Iterating over the view yields the header followed by row tuples, so every petl function
+    works against it unchanged. Parsons ETL methods with a vectorized implementation check for
+    this class and operate on the underlying ``arrow_table`` directly.
+    """
+
+    def __init__(self, arrow_table):
+        self.arrow_table = arrow_table
+
+    def __iter__(self):
+        yield tuple(self.arrow_table.column_names)
+
+        for batch in self.arrow_table.to_batches():
+            columns = [column.to_pylist() for column in batch.columns]
+            yield from zip(*columns)
+
+    def __len__(self):
+        # petl.nrows() iterates the table; the row count is already known here
+        return self.arrow_table.num_rows + 1
+
+
+def _column_is_arrow_safe(values):
+    types = {type(v) for v in values if v is not None}
+
+    if len(types) > 1 or not all(t in ARROW_SAFE_TYPES for t in types):
+        return False
+
+    if datetime.datetime in types:
+        return not any(v.tzinfo for v in values if v is not None)
+
+    return True
+
+
+def to_arrow_table(tbl):
+    """
+    Build a ``pyarrow.Table`` from a petl table in a single pass.
+
+    `Args:`
+        tbl: petl table
+    `Returns:`
+        ``pyarrow.Table`` or ``None`` if a column cannot be stored without changing its values.
+    """
+
+    pa = import_pyarrow()
+
+    if is_arrow(tbl):
+        return tbl.arrow_table
+
+    it = iter(tbl)
+    header = [str(h) for h in next(it)]
+    columns = [[] for _ in header]
+
+    for row in it:
+        for i, column in enumerate(columns):
+            column.append(row[i] if i < len(row) else None)
+
+    arrays = []
+    for name, values in zip(header, columns):
+        if not _column_is_arrow_safe(values):
+            logger.debug(f"Column {name} holds values that Arrow cannot store losslessly")
+            return None
+
+        try:
+            arrays.append(pa.array(values))
+        except (pa.ArrowException, OverflowError, TypeError, ValueError):
+            logger.debug(f"Could not convert column {name} to an Arrow array")
+            return None
+
+    return pa.Table.from_arrays(arrays, names=header)
+
+
+def cut(tbl, columns):
+    """
+    Select columns by name or position. Returns ``None`` if the selection is not supported.
+    """
+
+    names = tbl.arrow_table.column_names
+
+    if len(set(names)) != len(names):
+        return None
+
+    indexes = []
+    for column in columns:
+        if isinstance(column, int) and not isinstance(column, bool) and column < len(names):
+            indexes.append(column)
+        elif isinstance(column, str) and column in names:
+            indexes.append(names.index(column))
+        else:
+            return None
+
+    return ArrowView(tbl.arrow_table.select(indexes))
+
+
+def select_rows(tbl, filters):
+    """
+    Apply ``pyarrow.compute.Expression`` filters. Returns ``None`` for any other filter type.
+    """
+
+    import pyarrow.compute as pc
+
+    if not filters or not all(isinstance(f, pc.Expression) for f in filters):
+        return None
+
+    arrow_table = tbl.arrow_table
+    for expression in filters:
+        arrow_table = arrow_table.filter(expression)
+
+    return ArrowView(arrow_table)
+
+
+def _sort_keys(tbl, columns):
+    names = tbl.arrow_table.column_names
+
+    if columns is None:
+        columns = names
+    elif isinstance(columns, str):
+        columns = [columns]
+
+    if not all(isinstance(c, str) and c in names for c in columns):
+        return None
+
+    # petl sorts None ahead of every other value; leave nullable keys to petl
+    if any(tbl.arrow_table.column(c).null_count for c in columns):
+        return None
+
+    return list(columns)
+
+
+def sort(tbl, columns=None, reverse=False):
+    """
+    Sort on one or more named columns. Returns ``None`` if the sort is not supported.
+    """
+
+    keys = _sort_keys(tbl, columns)
+    if keys is None:
+        return None
+
+    order = "descending" if reverse else "ascending"
+
+    return ArrowView(tbl.arrow_table.sort_by([(k, order) for k in keys]))
+
+
+def deduplicate(tbl, keys=None):
+    """
+    Keep the first row for each distinct key, sorted on the key, matching
+    ``petl.distinct(presorted=False)``. Returns ``None`` if not supported.
+    """
+
+    pa = import_pyarrow()
+
+    keys = _sort_keys(tbl, keys)
+    if keys is None:
+        return None
+
+    arrow_table = tbl.arrow_table
+    index_column = "__parsons_row_index"
+    indexed = arrow_table.append_column(index_column, pa.array(range(arrow_table.num_rows)))
+
+    try:
+        firsts = indexed.group_by(keys, use_threads=False).aggregate([(index_column, "min")])
+    except pa.ArrowException:
+        return None
+
+    indexes = sorted(firsts.column(f"{index_column}_min").to_pylist())
+    deduped = arrow_table.take(pa.array(indexes, type=pa.int64()))
+
+    # Arrow's sort is stable, so the first occurrence of each key is retained
+    return ArrowView(deduped.sort_by([(k, "ascending") for k in keys]))
+
+
+def convert_column(tbl, column, kwargs):
+    """
+    Vectorize ``convert_column`` calls that use a string method name (eg. ``"upper"``) or
+    ``int``/``float``/``str`` as the converter. Returns ``None`` if not supported.
+    """
+
+    pa = import_pyarrow()
+    import pyarrow.compute as pc
+
+    if kwargs or len(column) != 2:
+        return None
+
+    fields, converter = column
+    if isinstance(fields, str):
+        fields = [fields]
+
+    arrow_table = tbl.arrow_table
+    names = arrow_table.column_names
+
+    if len(set(names)) != len(names) or not all(f in names for f in fields):
+        return None
+
+    for field in fields:
+        index = names.index(field)
+        values = arrow_table.column(index)
+
+        try:
+            if isinstance(converter, str) and converter in STRING_METHODS:
+                if not pa.types.is_string(values.type):
+                    return None
+                converted = getattr(pc, STRING_METHODS[converter])(values)
+
+            elif converter is int and pa.types.is_integer(values.type):
+                converted = values
+
+            elif converter is int and pa.types.is_string(values.type):
+                converted = pc.cast(values, pa.int64())
+
+            elif converter is float and (
+                pa.types.is_integer(values.type)
+                or pa.types.is_floating(values.type)
+                or pa.types.is_string(values.type)
+            ):
+                converted = pc.cast(values, pa.float64())
+
+            elif (
+                converter is str
+                and values.null_count == 0
+                and (pa.types.is_integer(values.type) or pa.types.is_string(values.type))
+            ):
+                # str(None) is 'None' in petl, so columns with nulls are left to petl
+                converted = pc.cast(values, pa.string())
+
+            else:
+                return None
+
+        except pa.ArrowException:
+            return None
+
+        arrow_table = arrow_table.set_column(index, field, converted)
+
+    return ArrowView(arrow_table)
+
+
+def concat(tbl, others, missing=None):
+    """
+    Concatenate Arrow-backed tables, padding missing columns with nulls. Returns ``None`` if
+    any table is not Arrow-backed or the column types cannot be unified.
+    """
+
+    pa = import_pyarrow()
+
+    if missing is not None or not all(is_arrow(t) for t in others):
+        return None
+
+    arrow_tables = [tbl.arrow_table] + [t.arrow_table for t in others]
+
+    try:
+        combined = pa.concat_tables(arrow_tables, promote_options="default")
+    except pa.ArrowException:
+        return None
+
+    return ArrowView(combined)
@@ -0,0 +1,210 @@
+import itertools
+import logging
+import os
+import sys
+import tempfile
+
+import petl
+
+from parsons.etl.external_sort import (
+    MERGE_FAN_IN,
+    OVERHEAD,
+    SAMPLE_EVERY,
+    SAMPLE_ROWS,
+    parse_memory_limit,
+)
+from parsons.etl.spill import SpillView, SpillWriter
+
+logger = logging.getLogger(__name__)
+
+
+def _row_size(row):
+    return sys.getsizeof(row) + sum(map(sys.getsizeof, row))
+
+
+class _Recording(object):
+    # The rows of a single pass over the source, kept in memory until they reach the budget
+    # and then written to a spill file
+
+    def __init__(self, header, max_memory, spill, spill_dir):
+        self.header = header
+        self.max_memory = max_memory
+        self.spill = spill
+        self.spill_dir = spill_dir
+
+        self.rows = []
+        self.writer = None
+        self.abandoned = False
+        self.row_size = 0
+        self.sampled = 0
+
+    def add(self, row):
+        if self.writer is not None:
+            self.writer.write([row])
+            return
+
+        self.rows.append(row)
+
+        count = len(self.rows)
+        if count <= SAMPLE_ROWS or count % SAMPLE_EVERY == 0:
+            self.row_size += _row_size(row)
+            self.sampled += 1
+
+        if count * self.row_size / self.sampled * OVERHEAD < self.max_memory:
+            return
+
+        if not self.spill:
+            logger.info("Table is larger than the cache's memory limit; not caching it.")
+            self.abandoned = True
+            self.rows = []
+            return
+
+        # The memory buffer is full, so the rest of the rows go to disk. Blocks are read one at
+        # a time, so keep them a fraction of the memory budget.
+        fd, path = tempfile.mkstemp(prefix="parsons-cache-", suffix=".spill", dir=self.spill_dir)
+        os.close(fd)
+        self.writer = SpillWriter(path, self.header, block_rows=max(1, count // MERGE_FAN_IN))
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+    def discard(self):
+        self.close()
+        if self.writer is not None and os.path.exists(self.writer.path):
+            os.remove(self.writer.path)
+        self.rows = []
+
+
+class CacheView(petl.Table):
+    """
+    A petl table that records the rows of the first full pass over its source, so later passes
+    replay them rather than running the source (and every transformation and download behind
+    it) again.
+
+    Rows are kept in memory up to ``max_memory``, and the rest are written to a spill file,
+    which keeps values' types. Passes that stop before the end, such as reading the header or
+    the first row, don't record anything, but the header of the source is kept after the first
+    pass that reads it.
+
+    ``hits`` counts the passes served from the cache, and ``misses`` those that read the
+    source.
+
+    `Args:`
+        source: petl table
+            The table to cache
+        max_memory: int or str
+            The memory budget for cached rows, in bytes or as a string like ``"512MB"``
+        spill: bool
+            Write the rows beyond ``max_memory`` to a spill file. If ``False``, a table larger
+            than the budget isn't cached.
+        spill_dir: str
+            The directory for the spill file. Defaults to the system temp directory.
+        auto: bool
+            Whether the cache was added by the auto-cache policy rather than by
+            ``Table.cache``
+    """
+
+    def __init__(self, source, max_memory="256MB", spill=True, spill_dir=None, auto=False):
+        self.source = source
+        self.max_memory = parse_memory_limit(max_memory)
+        self.spill = spill
+        self.spill_dir = spill_dir
+        self.auto = auto
+
+        self.hits = 0
+        self.misses = 0
+
+        self._header = None
+        self._recording = None
+
+    def __del__(self):
+        self.clear()
+
+    @property
+    def complete(self):
+        """
+        Whether the rows of a full pass have been recorded.
+        """
+
+        return getattr(self, "_recording", None) is not None
+
+    def clear(self):
+        """
+        Delete the recorded rows, so the next pass reads the source again.
+        """
+
+        if self.complete:
+            self._recording.discard()
+        self._recording = None
+
+    def num_rows(self):
+        """
+        The number of recorded rows, or ``None`` if no full pass has been recorded.
+        """
+
+        if not self.complete:
+            return None
+
+        self.hits += 1
+        recording = self._recording
+        spilled = recording.writer.num_rows if recording.writer is not None else 0
+        return len(recording.rows) + spilled
+
+    def __len__(self):
+        if self.complete:
+            return self.num_rows() + 1
+
+        return super().__len__()
+
+    def __iter__(self):
+        if self.complete:
+            self.hits += 1
+            return self._replay(self._recording)
+
+        return self._record()
+
+    def _replay(self, recording):
+        yield self._header
+        yield from recording.rows
+        if recording.writer is not None:
+            yield from itertools.islice(SpillView(recording.writer.path), 1, None)
+
+    def _record(self):
+        from_cache = True
+        recording = None
+
+        try:
+            if self._header is not None:
+                yield self._header
+
+            # The rest of the pass needs the source
+            from_cache = False
+            it = iter(self.source)
+            header = tuple(next(it, ()))
+            if self._header is None:
+                self._header = header
+                yield header
+
+            recording = _Recording(header, self.max_memory, self.spill, self.spill_dir)
+            for row in it:
+                row = tuple(row)
+                if not recording.abandoned:
+                    recording.add(row)
+                yield row
+
+            recording.close()
+            if not recording.abandoned and not self.complete:
+                self._recording = recording
+                recording = None
+
+        finally:
+            if from_cache:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+            # Drop the rows of an unfinished pass, or of one finished while another pass
+            # was being recorded
+            if recording is not None:
+                recording.discard()
@@ -1,7 +1,13 @@
+import itertools
 import logging
 
 import petl
 
+from parsons.etl import arrow, plan, spill
+from parsons.etl.external_sort import ExternalSortView
+from parsons.etl.hash_dedup import HashDedupView
+from parsons.etl.predicate import Predicate, PredicateView
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,7 +26,11 @@ class ETL(object):
             `Parsons Table`
         """
 
-        self.table = petl.head(self.table, n)
+        if isinstance(self.table, spill.SpillView):
+            # Only read the blocks holding the first n rows
+            self.table = self.table.slice(0, n)
+        else:
+            self.table = petl.head(self.table, n)
 
         return self
 
@@ -65,7 +75,7 @@ class ETL(object):
             else:
                 raise ValueError(f"Column {column} already exists")
 
-        self.table = self.table.addfield(column, value, index)
+        self.table = plan.fuse(self.table, "add", column, value, index)
 
         return self
 
@@ -80,7 +90,7 @@ class ETL(object):
             `Parsons Table` and also updates self
         """
 
-        self.table = petl.cutout(self.table, *columns)
+        self.table = plan.fuse(self.table, "cutout", columns)
 
         return self
 
@@ -100,7 +110,7 @@ class ETL(object):
         if new_column_name in self.columns:
             raise ValueError(f"Column {new_column_name} already exists")
 
-        self.table = petl.rename(self.table, column_name, new_column_name)
+        self.table = plan.fuse(self.table, "rename", {column_name: new_column_name})
 
         return self
 
@@ -128,8 +138,7 @@ class ETL(object):
             if new_name in self.table.columns():
                 raise ValueError(f"Column name {new_name} already exists")
 
-        # Uses the underlying petl method
-        self.table = petl.rename(self.table, column_map)
+        self.table = plan.fuse(self.table, "rename", dict(column_map))
 
         return self
 
@@ -146,12 +155,7 @@ class ETL(object):
             `Parsons Table` and also updates self
         """
 
-        if callable(fill_value):
-            self.table = petl.convert(
-                self.table, column_name, lambda _, r: fill_value(r), pass_row=True
-            )
-        else:
-            self.table = petl.update(self.table, column_name, fill_value)
+        self.table = plan.fuse(self.table, "fill", column_name, fill_value)
 
         return self
 
@@ -199,7 +203,7 @@ class ETL(object):
             `Parsons Table` and also updates existing object.
         """
 
-        self.table = petl.movefield(self.table, column, index)
+        self.table = plan.fuse(self.table, "move", column, index)
 
         return self
 
@@ -218,7 +222,17 @@ class ETL(object):
             `Parsons Table` and also updates self
         """
 
-        self.table = petl.convert(self.table, *column, **kwargs)
+        if arrow.is_arrow(self.table):
+            converted = arrow.convert_column(self.table, column, kwargs)
+            if converted is not None:
+                self.table = converted
+                return self
+
+        step = plan.convert_step(column, kwargs)
+        if step is not None:
+            self.table = plan.fuse(self.table, "convert", *step)
+        else:
+            self.table = petl.convert(self.table, *column, **kwargs)
 
         return self
 
@@ -233,13 +247,11 @@ class ETL(object):
             int
         """
 
-        max_width = 0
-
-        for v in petl.values(self.table, column):
-            if len(str(v).encode("utf-8")) > max_width:
-                max_width = len(str(v).encode("utf-8"))
+        for col in self.profile()["columns"]:
+            if col["name"] == column:
+                return col["max_width"]
 
-        return max_width
+        raise petl.errors.FieldSelectionError(column)
 
     def convert_columns_to_str(self):
         """
@@ -417,21 +429,22 @@ class ETL(object):
                 A list of Python types
         """
 
+        for col in self.profile()["columns"]:
+            if col["name"] == column:
+                return col["type"]
+
         return list(petl.typeset(self.table, column))
 
     def get_columns_type_stats(self):
         """
         Return descriptive stats for all columns
 
-        `Returns:`
-            list
-                A list of dicts
         `Returns:`
             list
                 A list of dicts, each containing a column 'name' and a 'type' list
         """
 
-        return [{"name": col, "type": self.get_column_types(col)} for col in self.table.columns()]
+        return [{"name": col["name"], "type": col["type"]} for col in self.profile()["columns"]]
 
     def convert_table(self, *args):
         """
@@ -781,7 +794,19 @@ class ETL(object):
 
         from parsons.etl.table import Table
 
-        return Table(petl.cut(self.table, *columns))
+        if arrow.is_arrow(self.table):
+            cut = arrow.cut(self.table, columns)
+            if cut is not None:
+                return Table(cut)
+
+        if isinstance(self.table, spill.SpillView):
+            # Only deserialize the selected columns from the file
+            try:
+                return Table(self.table.project(columns))
+            except petl.errors.FieldSelectionError:
+                pass
+
+        return Table(plan.fuse(self.table, "cut", columns))
 
     def select_rows(self, *filters):
         """
@@ -809,6 +834,10 @@ class ETL(object):
             tbl3
             >>> {'foo': 'a', 'bar': 2, 'baz': 88.1}
 
+        An expression string is parsed once rather than evaluated against a record built for
+        each row. Tables using the arrow engine filter with a vectorized expression, and tables
+        materialized to a file only read the blocks of rows that match.
+
         `Args:`
             \*filters: function or str
         `Returns:`
@@ -817,6 +846,31 @@ class ETL(object):
 
         from parsons.etl.table import Table
 
+        if len(filters) == 1 and isinstance(filters[0], str):
+            predicate = Predicate(filters[0])
+
+            if arrow.is_arrow(self.table):
+                expression = predicate.to_arrow()
+                if expression is not None:
+                    pa = arrow.import_pyarrow()
+                    try:
+                        return Table(arrow.select_rows(self.table, [expression]))
+                    except (pa.ArrowNotImplementedError, pa.ArrowInvalid):
+                        # Arrow can't compare eg. a string column to a number, which Python
+                        # can (and finds unequal), so filter the rows one by one
+                        pass
+
+            if isinstance(self.table, spill.SpillView):
+                function = predicate.compile(predicate.columns)
+                return Table(spill.SpillSelectView(self.table, predicate.columns, function))
+
+            return Table(PredicateView(self.table, predicate))
+
+        if arrow.is_arrow(self.table):
+            selected = arrow.select_rows(self.table, filters)
+            if selected is not None:
+                return Table(selected)
+
         return Table(petl.select(self.table, *filters))
 
     def remove_null_rows(self, columns, null_value=None):
@@ -894,6 +948,12 @@ class ETL(object):
             tables = [tables]
         petl_tables = [tbl.table for tbl in tables]
 
+        if arrow.is_arrow(self.table):
+            combined = arrow.concat(self.table, petl_tables, missing=missing)
+            if combined is not None:
+                self.table = combined
+                return
+
         self.table = petl.cat(self.table, *petl_tables, missing=missing)
 
     def chunk(self, rows):
@@ -901,6 +961,9 @@ class ETL(object):
         Divides a Parsons table into smaller tables of a specified row count. If the table
         cannot be divided evenly, then the final table will only include the remainder.
 
+        Each chunk is a lazy slice of the table, so reading all of them reads the source once
+        per chunk. Use :meth:`iter_chunks` to read the source in a single pass.
+
         `Args:`
             rows: int
                 The number of rows of each new Parsons table
@@ -914,6 +977,38 @@ class ETL(object):
             Table(petl.rowslice(self.table, i, i + rows)) for i in range(0, self.num_rows, rows)
         ]
 
+    def iter_chunks(self, rows):
+        """
+        Lazily divides a Parsons table into smaller tables of a specified row count. If the
+        table cannot be divided evenly, then the final table will only include the remainder.
+
+        Unlike :meth:`chunk`, the source table is read once, from start to finish, as the
+        chunks are consumed, and only one chunk is held in memory at a time.
+
+        `Args:`
+            rows: int
+                The number of rows of each new Parsons table
+        `Returns:`
+            Generator of Parsons tables
+        """
+
+        from parsons.etl import Table
+
+        if rows < 1:
+            raise ValueError("rows must be a positive integer")
+
+        it = iter(self.table)
+        header = next(it, None)
+        if header is None:
+            return
+
+        while True:
+            data = list(itertools.islice(it, rows))
+            if not data:
+                return
+
+            yield Table([list(header)] + data)
+
     @staticmethod
     def get_normalized_column_name(column_name):
         """
@@ -1034,7 +1129,16 @@ class ETL(object):
 
         return self
 
-    def reduce_rows(self, columns, reduce_func, headers, presorted=False, **kwargs):
+    def reduce_rows(
+        self,
+        columns,
+        reduce_func,
+        headers,
+        presorted=False,
+        memory_limit=None,
+        spill_dir=None,
+        **kwargs,
+    ):
         """
         Group rows by a column or columns, then reduce the groups to a single row.
 
@@ -1097,11 +1201,22 @@ class ETL(object):
                 function.
             presorted: bool
                 If false, the row will be sorted.
+            memory_limit: int or str
+                Optional memory budget for sorting the rows, in bytes or as a string like
+                ``"512MB"``. Rows beyond the budget are sorted on disk.
+                See :meth:`~parsons.etl.etl.ETL.sort`.
+            spill_dir: str
+                The directory to sort on disk in, with ``memory_limit``. Defaults to the
+                system temp directory.
         `Returns:`
             `Parsons Table` and also updates self
 
         """
 
+        if memory_limit is not None and not presorted:
+            self.sort(columns, memory_limit=memory_limit, spill_dir=spill_dir)
+            presorted = True
+
         self.table = petl.rowreduce(
             self.table,
             columns,
@@ -1113,20 +1228,51 @@ class ETL(object):
 
         return self
 
-    def sort(self, columns=None, reverse=False):
+    def sort(self, columns=None, reverse=False, memory_limit=None, spill_dir=None):
         """
         Sort the rows a table.
 
+        By default, tables are sorted in memory, and petl sorts tables of more than
+        ``petl.config.sort_buffersize`` rows in pickled chunks. For large tables, set
+        ``memory_limit`` to keep the memory used by the sort within a budget. Rows beyond the
+        budget are sorted in runs written to disk and then merged, which keeps memory use
+        predictable whatever the width or number of rows.
+
+        .. code-block:: python
+
+            tbl.sort("van_id", memory_limit="1GB", spill_dir="/mnt/scratch")
+
         `Args:`
             sort_columns: list or str
                 Sort by a single column or a list of column. If ``None`` then
                 will sort columns from left to right.
             reverse: boolean
                 Sort rows in reverse order.
+            memory_limit: int or str
+                Optional memory budget for the sort, in bytes or as a string like ``"512MB"``
+            spill_dir: str
+                The directory to sort on disk in, with ``memory_limit``. Defaults to the
+                system temp directory.
         `Returns:`
             `Parsons Table` and also updates self
         """
 
+        if memory_limit is not None:
+            self.table = ExternalSortView(
+                self.table,
+                key=columns,
+                reverse=reverse,
+                memory_limit=memory_limit,
+                spill_dir=spill_dir,
+            )
+            return self
+
+        if arrow.is_arrow(self.table):
+            sorted_table = arrow.sort(self.table, columns, reverse=reverse)
+            if sorted_table is not None:
+                self.table = sorted_table
+                return self
+
         self.table = petl.sort(self.table, key=columns, reverse=reverse)
 
         return self
@@ -1141,7 +1287,16 @@ class ETL(object):
         `Returns:`
             `Parsons Table` and also updates self
         """
+        profile = self._cached_profile()
+
         self.table = petl.setheader(self.table, new_header)
+
+        # Renaming columns doesn't change the data, so any cached profile is still valid
+        if profile and len(new_header) == len(profile["columns"]):
+            for col, name in zip(profile["columns"], new_header):
+                col["name"] = name
+            self._profile = (self.table, profile)
+
         return self
 
     def use_petl(self, petl_method, *args, **kwargs):
@@ -1206,7 +1361,9 @@ class ETL(object):
 
         return Table(getattr(petl, petl_method)(self.table, *args, **kwargs))
 
-    def deduplicate(self, keys=None, presorted=False):
+    def deduplicate(
+        self, keys=None, presorted=False, memory_limit=None, spill_dir=None, method="sort"
+    ):
         """
         Deduplicates table based on an optional ``keys`` argument,
         which can contain any number of keys or None.
@@ -1284,11 +1441,42 @@ class ETL(object):
                 keys to deduplicate (and optionally sort) on.
             presorted: bool
                 If false, the row will be sorted.
+            memory_limit: int or str
+                Optional memory budget, in bytes or as a string like ``"512MB"``. With the
+                ``sort`` method, rows beyond the budget are sorted on disk
+                (see :meth:`~parsons.etl.etl.ETL.sort`). With the ``hash`` method, rows are
+                spilled to disk once the keys seen are over the budget.
+            spill_dir: str
+                The directory to spill to disk in, with ``memory_limit``. Defaults to the
+                system temp directory.
+            method: str
+                ``sort`` (the default) sorts the table by the keys, which also orders the
+                rows. ``hash`` reads the table once without sorting it, keeping the first row
+                for each key and the original order of the rows. It only keeps a fixed-size
+                digest of each key in memory, and ignores ``presorted``.
         `Returns`:
             `Parsons Table` and also updates self
 
         """
 
+        if method == "hash":
+            self.table = HashDedupView(
+                self.table, key=keys, memory_limit=memory_limit, spill_dir=spill_dir
+            )
+            return self
+        elif method != "sort":
+            raise ValueError(f"Unknown deduplicate method: {method}")
+
+        if memory_limit is not None and not presorted:
+            self.sort(keys, memory_limit=memory_limit, spill_dir=spill_dir)
+            presorted = True
+
+        if arrow.is_arrow(self.table) and not presorted:
+            deduped = arrow.deduplicate(self.table, keys)
+            if deduped is not None:
+                self.table = deduped
+                return self
+
         deduped = petl.transform.dedup.distinct(self.table, key=keys, presorted=presorted)
         self.table = deduped
 
@@ -0,0 +1,205 @@
+import heapq
+import itertools
+import os
+import re
+import shutil
+import sys
+import tempfile
+
+import petl
+from petl.comparison import comparable_itemgetter
+from petl.util.base import asindices
+
+from parsons.etl.spill import SpillView, SpillWriter
+
+# The number of runs merged at once. More runs than this are merged in several passes, so the
+# memory used by a merge doesn't grow with the size of the table.
+MERGE_FAN_IN = 16
+
+# Row sizes are measured for the first rows read, and for every SAMPLE_EVERY rows after that
+SAMPLE_ROWS = 1000
+SAMPLE_EVERY = 100
+
+# Python objects take more memory than their own size suggests once they are in a list and
+# being sorted (allocator overhead and list pointers), so the budget is spread over fewer rows
+OVERHEAD = 1.5
+
+_UNITS = {"": 1, "B": 1, "KB": 1024, "MB": 1024**2, "GB": 1024**3}
+
+
+def parse_memory_limit(memory_limit):
+    """
+    Convert a memory limit to a number of bytes.
+
+    `Args:`
+        memory_limit: int or str
+            A number of bytes, or a string such as ``"512MB"`` or ``"2GB"``
+    `Returns:`
+        int
+    """
+
+    if isinstance(memory_limit, (int, float)):
+        return int(memory_limit)
+
+    match = re.fullmatch(r"\s*([\d.]+)\s*([KMG]?B?)\s*", memory_limit.upper())
+    if not match:
+        raise ValueError(f"Invalid memory limit: {memory_limit}")
+
+    return int(float(match.group(1)) * _UNITS[match.group(2)])
+
+
+def _row_size(row, key):
+    return sys.getsizeof(row) + sum(map(sys.getsizeof, row)) + sys.getsizeof(key)
+
+
+class ExternalSortView(petl.Table):
+    """
+    A petl table that sorts its source within a memory budget.
+
+    Rows are read into a buffer until the buffer reaches ``memory_limit``. Each full buffer is
+    sorted and written to a run file in the spill file format, which keeps values' types and
+    is written and read in blocks. The runs are then combined with a k-way heap merge, in
+    several passes if there are more than ``MERGE_FAN_IN`` runs, so that memory stays within
+    the budget however large the table is. A table that fits within the budget is sorted in
+    memory without writing any files.
+
+    The sorted rows are kept, in memory or in run files, for later iterations.
+
+    `Args:`
+        source: petl table
+            The table to sort
+        key: str or list
+            The column(s) to sort on. ``None`` sorts on every column from left to right.
+        reverse: bool
+            Sort in descending order
+        memory_limit: int or str
+            The memory budget for rows being sorted, in bytes or as a string like ``"512MB"``
+        spill_dir: str
+            The directory for run files. Defaults to the system temp directory.
+    """
+
+    def __init__(self, source, key=None, reverse=False, memory_limit="256MB", spill_dir=None):
+        self.source = source
+        self.key = key
+        self.reverse = reverse
+        self.memory_limit = parse_memory_limit(memory_limit)
+        self.spill_dir = spill_dir
+
+        self._header = None
+        self._rows = None
+        self._runs = None
+        self._temp_dir = None
+
+    def __del__(self):
+        self.clear()
+
+    def clear(self):
+        """
+        Delete any sorted rows kept from an earlier iteration.
+        """
+
+        if getattr(self, "_temp_dir", None):
+            shutil.rmtree(self._temp_dir, ignore_errors=True)
+        self._header = self._rows = self._runs = self._temp_dir = None
+
+    def __iter__(self):
+        if self._header is None:
+            self._sort()
+
+        yield tuple(self._header)
+
+        if self._runs is None:
+            yield from self._rows
+        else:
+            yield from self._merge(self._header, [SpillView(path) for path in self._runs])
+
+    def _getkey(self, header):
+        indexes = range(len(header)) if self.key is None else asindices(header, self.key)
+        return comparable_itemgetter(*indexes)
+
+    def _merge(self, header, views):
+        getkey = self._getkey(header)
+        runs = [itertools.islice(view, 1, None) for view in views]
+
+        return heapq.merge(*runs, key=getkey, reverse=self.reverse)
+
+    def _write_run(self, header, rows, block_rows):
+        fd, path = tempfile.mkstemp(suffix=".run", dir=self._temp_dir)
+        os.close(fd)
+
+        rows = iter(rows)
+        with SpillWriter(path, header, block_rows=block_rows) as writer:
+            for block in iter(lambda: list(itertools.islice(rows, block_rows)), []):
+                writer.write_block(block)
+
+        return path
+
+    def _sort(self):
+        try:
+            self._sort_runs()
+        except BaseException:
+            self.clear()
+            raise
+
+    def _sort_runs(self):
+        it = iter(self.source)
+        header = tuple(next(it, ()))
+        getkey = self._getkey(header)
+
+        runs = []
+        rows = []
+        buffer_rows = None
+        row_size = 0
+        sampled = 0
+
+        for i, row in enumerate(it):
+            rows.append(row)
+
+            if i < SAMPLE_ROWS or i % SAMPLE_EVERY == 0:
+                row_size += _row_size(row, getkey(row))
+                sampled += 1
+
+            if len(rows) * row_size / sampled * OVERHEAD < self.memory_limit:
+                continue
+
+            # The buffer is full, so sort it and write it out as a run
+            if self._temp_dir is None:
+                self._temp_dir = tempfile.mkdtemp(prefix="parsons-sort-", dir=self.spill_dir)
+            if buffer_rows is None:
+                buffer_rows = len(rows)
+
+            rows.sort(key=getkey, reverse=self.reverse)
+            runs.append(self._write_run(header, rows, max(1, buffer_rows // MERGE_FAN_IN)))
+            rows = []
+
+        rows.sort(key=getkey, reverse=self.reverse)
+
+        if not runs:
+            self._rows = [tuple(row) for row in rows]
+            self._header = header
+            return
+
+        block_rows = max(1, buffer_rows // MERGE_FAN_IN)
+        if rows:
+            runs.append(self._write_run(header, rows, block_rows))
+        del rows
+
+        # Merge the runs in groups until few enough remain to merge as the table is read. Each
+        # merge reads a block of every run at once, so the blocks fit the budget together.
+        while len(runs) > MERGE_FAN_IN:
+            merged = []
+            for start in range(0, len(runs), MERGE_FAN_IN):
+                group = runs[start : start + MERGE_FAN_IN]
+                if len(group) == 1:
+                    merged.extend(group)
+                    continue
+
+                rows = self._merge(header, [SpillView(path) for path in group])
+                merged.append(self._write_run(header, rows, block_rows))
+                for run in group:
+                    os.remove(run)
+
+            runs = merged
+
+        self._runs = runs
+        self._header = header
@@ -0,0 +1,141 @@
+import hashlib
+import heapq
+import itertools
+import operator
+import os
+import shutil
+import tempfile
+
+import petl
+from petl.util.base import asindices
+
+from parsons.etl.external_sort import parse_memory_limit
+from parsons.etl.spill import SpillView, SpillWriter
+
+# The approximate memory taken by each key digest in the set of seen keys, including the set's
+# own overhead
+DIGEST_BYTES = 100
+
+# The number of partitions rows are spilled to once the set of seen keys is over its budget
+PARTITIONS = 64
+
+# The number of rows written to each block of a partition file
+PARTITION_BLOCK_ROWS = 1000
+
+
+def _digest(values):
+    # A fixed-width digest of a row's key, so the full key values aren't kept in memory
+    return hashlib.blake2b(repr(values).encode(), digest_size=16).digest()
+
+
+class HashDedupView(petl.Table):
+    """
+    A petl table that removes rows with duplicate keys in a single pass, keeping the first
+    occurrence of each key and the original order of the rows.
+
+    Only a 16 byte digest of each key is kept in memory. Keys are compared by the ``repr`` of
+    their values, so eg. ``1`` and ``1.0`` are different keys. If the digests grow beyond
+    ``memory_limit``, rows with new keys are spilled to partition files by digest. Each
+    partition is then deduplicated on its own, and the partitions are merged back into the
+    original order.
+
+    `Args:`
+        source: petl table
+            The table to deduplicate
+        key: str or list
+            The column(s) to deduplicate on. ``None`` compares every column.
+        memory_limit: int or str
+            Optional memory budget for the seen keys, in bytes or as a string like
+            ``"512MB"``. Defaults to no limit.
+        spill_dir: str
+            The directory for partition files. Defaults to the system temp directory.
+    """
+
+    def __init__(self, source, key=None, memory_limit=None, spill_dir=None):
+        self.source = source
+        self.key = key
+        self.memory_limit = None if memory_limit is None else parse_memory_limit(memory_limit)
+        self.spill_dir = spill_dir
+
+    def __iter__(self):
+        it = iter(self.source)
+        header = tuple(next(it, ()))
+        yield header
+
+        if self.key is None:
+            getkey = tuple
+        else:
+            getkey = operator.itemgetter(*asindices(header, self.key))
+
+        max_digests = None
+        if self.memory_limit is not None:
+            max_digests = max(1, self.memory_limit // DIGEST_BYTES)
+
+        seen = set()
+        for seq, row in enumerate(it):
+            digest = _digest(getkey(row))
+            if digest in seen:
+                continue
+
+            seen.add(digest)
+            yield tuple(row)
+
+            if max_digests is not None and len(seen) >= max_digests:
+                yield from self._spill(header, it, getkey, seen, seq + 1)
+                return
+
+    def _spill(self, header, it, getkey, seen, start):
+        # Rows whose keys weren't seen before the budget ran out go to a partition file picked
+        # by their digest, so every copy of a key lands in the same partition
+        temp_dir = tempfile.mkdtemp(prefix="parsons-dedup-", dir=self.spill_dir)
+        spill_header = ("seq", "digest") + header
+
+        writers = {}
+        try:
+            for seq, row in enumerate(it, start):
+                digest = _digest(getkey(row))
+                if digest in seen:
+                    continue
+
+                partition = digest[0] % PARTITIONS
+                if partition not in writers:
+                    writers[partition] = SpillWriter(
+                        os.path.join(temp_dir, f"{partition}.spill"),
+                        spill_header,
+                        block_rows=PARTITION_BLOCK_ROWS,
+                    )
+                writers[partition].write([(seq, digest) + tuple(row)])
+
+            for writer in writers.values():
+                writer.close()
+
+            seen.clear()
+
+            # Deduplicate each partition, keeping each key's first row, then merge the
+            # partitions back into the order of the source
+            deduped = [
+                self._dedup_partition(writer.path, spill_header) for writer in writers.values()
+            ]
+            runs = [itertools.islice(SpillView(path), 1, None) for path in deduped]
+
+            for row in heapq.merge(*runs, key=operator.itemgetter(0)):
+                yield tuple(row[2:])
+
+        finally:
+            for writer in writers.values():
+                writer.close()
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def _dedup_partition(self, path, header):
+        deduped_path = f"{path}.deduped"
+        seen = set()
+
+        with SpillWriter(deduped_path, header, block_rows=PARTITION_BLOCK_ROWS) as writer:
+            for row in itertools.islice(SpillView(path), 1, None):
+                if row[1] not in seen:
+                    seen.add(row[1])
+                    writer.write([row])
+
+        os.remove(path)
+
+        return deduped_path
@@ -0,0 +1,292 @@
+import petl
+from petl.errors import FieldSelectionError
+from petl.util.base import Record, asindices
+
+from parsons.etl.cache import CacheView
+
+# The keyword arguments of petl.convert that a fused conversion supports
+CONVERT_OPTIONS = ("pass_row", "failonerror", "errorvalue")
+
+
+def fuse(table, step, *args):
+    """
+    Add a column step to the plan of a table, starting a new plan if the table doesn't
+    have one.
+
+    `Args:`
+        table: petl table
+        step: str
+            One of the steps of :class:`FusedView`
+        \*args:
+            The step's arguments
+    `Returns:`
+        FusedView
+    """
+
+    # A cache added by the auto-cache policy moves to the end of the plan, unless it has
+    # already recorded the rows
+    if isinstance(table, CacheView) and table.auto and not table.complete:
+        table = table.source
+
+    if isinstance(table, FusedView):
+        return table.then(step, *args)
+
+    return FusedView(table, ((step, args),))
+
+
+def convert_step(column, kwargs):
+    """
+    The arguments of a ``convert`` step for arguments of ``Table.convert_column``, or
+    ``None`` if the conversion can't be fused, eg. a method name or a ``where`` condition.
+    """
+
+    if len(column) != 2 or not callable(column[1]):
+        return None
+    if any(option not in CONVERT_OPTIONS for option in kwargs):
+        return None
+
+    fields, function = column
+    if isinstance(fields, str):
+        fields = (fields,)
+    elif not (isinstance(fields, (list, tuple)) and all(isinstance(f, str) for f in fields)):
+        return None
+
+    failonerror = kwargs.get("failonerror")
+    if failonerror is None:
+        failonerror = petl.config.failonerror
+
+    return (
+        tuple(fields),
+        function,
+        kwargs.get("pass_row", False),
+        failonerror,
+        kwargs.get("errorvalue"),
+    )
+
+
+class FusedView(petl.Table):
+    """
+    A petl table that applies a plan of column steps to each row of its source in a single
+    function.
+
+    Chaining petl views stacks one generator per step, and each row passes through all of
+    them. Instead, the steps are recorded here and, when the table is read, compiled into one
+    row function that keeps each column in a local variable. Steps whose results are dropped
+    or overwritten before they are used are not run, and source columns that aren't used are
+    never read from the row.
+
+    The steps are:
+
+    * ``rename``: ``(mapping,)``
+    * ``convert``: ``(fields, function, pass_row, failonerror, errorvalue)``
+    * ``add``: ``(field, value, index)``
+    * ``fill``: ``(field, value)``
+    * ``cut``: ``(fields,)``
+    * ``cutout``: ``(fields,)``
+    * ``move``: ``(field, index)``
+
+    Each has the same result as the petl function of the same name (``addfield``,
+    ``update`` and ``movefield`` for ``add``, ``fill`` and ``move``), except that rows
+    shorter than the header are padded with ``None``. Values past the end of the header are
+    kept at the end of the row, as in petl, unless the plan has a ``cut``, ``cutout``,
+    ``move`` or ``add`` step, which drop them. A ``fill`` with a function is passed
+    the row, as in ``Table.fill_column``.
+
+    `Args:`
+        source: petl table
+        steps: tuple
+            ``(step, args)`` pairs
+    """
+
+    def __init__(self, source, steps=()):
+        self.source = source
+        self.steps = tuple(steps)
+
+    def then(self, step, *args):
+        """
+        Return a new view with a step added to the end of the plan.
+        """
+
+        return FusedView(self.source, self.steps + ((step, args),))
+
+    def __iter__(self):
+        it = iter(self.source)
+        header = tuple(next(it, ()))
+
+        out_header, function = self.compile(header)
+        yield out_header
+
+        for row in it:
+            yield function(row)
+
+    def compile(self, header):
+        """
+        Compile the plan for a source with the given header.
+
+        `Args:`
+            header: tuple
+                The source's column names
+        `Returns:`
+            tuple
+                The output header and a function from a source row to an output row
+        """
+
+        return _Compiler(header).compile(self.steps)
+
+
+class _Compiler(object):
+    # Builds the source of the row function. Every value a step computes is assigned to a new
+    # local variable, so the columns of the current header are a list of variable names.
+
+    def __init__(self, header):
+        self.width = len(header)
+        self.names = list(header)
+        self.columns = [f"s{i}" for i in range(self.width)]
+        self.statements = []
+        self.namespace = {"Record": Record}
+        self.count = 0
+        # Whether values past the end of the header are kept, as petl keeps them until a step
+        # selects or inserts columns by position
+        self.keep_extra = True
+
+    def variable(self, prefix="v"):
+        self.count += 1
+        return f"{prefix}{self.count}"
+
+    def constant(self, value, prefix="c"):
+        name = self.variable(prefix)
+        self.namespace[name] = value
+        return name
+
+    def assign(self, code, reads, error=None):
+        # error: the code of the value assigned if the expression raises an exception, or
+        # None to let the exception through
+        target = self.variable()
+        self.statements.append((target, code, reads, error))
+        return target
+
+    def record(self):
+        # A petl record of the current row, for functions that are passed the row
+        header = self.constant(list(map(str, self.names)), "h")
+        values = ", ".join(self.columns) + ("," if len(self.columns) == 1 else "")
+        return self.assign(f"Record(({values}), {header})", set(self.columns))
+
+    def index(self, field):
+        return asindices(self.names, [field])[0]
+
+    def compile(self, steps):
+        for step, args in steps:
+            getattr(self, f"_{step}")(*args)
+
+        return tuple(self.names), self.build()
+
+    def build(self):
+        # Drop the statements whose values are never used, working back from the output
+        live = set(self.columns)
+        statements = []
+        for target, code, reads, error in reversed(self.statements):
+            if target in live:
+                live.discard(target)
+                live |= reads
+                statements.append((target, code, error))
+        statements.reverse()
+
+        lines = ["def fused(row):"]
+        loads = sorted((c for c in live if c.startswith("s")), key=lambda c: int(c[1:]))
+        if loads:
+            lines.append(f"    if len(row) < {self.width}:")
+            lines.append(f"        row = tuple(row) + (None,) * ({self.width} - len(row))")
+        for column in loads:
+            lines.append(f"    {column} = row[{column[1:]}]")
+
+        for target, code, error in statements:
+            if error is None:
+                lines.append(f"    {target} = {code}")
+            else:
+                lines.append("    try:")
+                lines.append(f"        {target} = {code}")
+                lines.append("    except Exception as e:")
+                lines.append(f"        {target} = {error}")
+
+        values = ", ".join(self.columns) + ("," if len(self.columns) == 1 else "")
+        if self.keep_extra:
+            lines.append(f"    if len(row) > {self.width}:")
+            lines.append(f"        return ({values}) + tuple(row[{self.width}:])")
+        lines.append(f"    return ({values})")
+
+        # The source is generated here from variable names and indexes only; the steps'
+        # functions and values are passed in the namespace, never formatted into the code
+        code = compile("\n".join(lines), "<fused>", "exec")
+        exec(code, self.namespace)  # nosec B102
+        return self.namespace["fused"]
+
+    def _rename(self, mapping):
+        for field in mapping:
+            if field not in self.names:
+                raise FieldSelectionError(field)
+        self.names = [mapping.get(name, name) for name in self.names]
+
+    def _convert(self, fields, function, pass_row, failonerror, errorvalue):
+        indexes = [self.index(field) for field in fields]
+        function = self.constant(function, "f")
+
+        if failonerror == "inline":
+            error = "e"
+        elif failonerror:
+            error = None
+        else:
+            error = self.constant(errorvalue)
+
+        record = self.record() if pass_row else None
+        converted = list(self.columns)
+        for i in indexes:
+            value = self.columns[i]
+            if record is None:
+                converted[i] = self.assign(f"{function}({value})", {value}, error)
+            else:
+                converted[i] = self.assign(f"{function}({value}, {record})", {value, record}, error)
+        self.columns = converted
+
+    def _add(self, field, value, index):
+        self.keep_extra = False
+        if callable(value):
+            function = self.constant(value, "f")
+            record = self.record()
+            column = self.assign(f"{function}({record})", {record})
+        else:
+            column = self.assign(self.constant(value), set())
+
+        if index is None:
+            index = len(self.names)
+        self.names.insert(index, field)
+        self.columns.insert(index, column)
+
+    def _fill(self, field, value):
+        if callable(value):
+            self._convert((field,), lambda _, row: value(row), True, petl.config.failonerror, None)
+        else:
+            self.columns[self.index(field)] = self.assign(self.constant(value), set())
+
+    def _fields(self, fields):
+        # As in petl, the fields can also be given as a single list
+        if len(fields) == 1 and isinstance(fields[0], (list, tuple)):
+            fields = fields[0]
+        return asindices(self.names, fields)
+
+    def _cut(self, fields):
+        self.keep_extra = False
+        indexes = self._fields(fields)
+        self.names = [self.names[i] for i in indexes]
+        self.columns = [self.columns[i] for i in indexes]
+
+    def _cutout(self, fields):
+        dropped = set(self._fields(fields))
+        self._cut([i for i in range(len(self.names)) if i not in dropped])
+
+    def _move(self, field, index):
+        self.keep_extra = False
+        i = self.index(field)
+        column = self.columns.pop(i)
+        self.names.pop(i)
+        self.names.insert(index, field)
+        self.columns.insert(index, column)
@@ -0,0 +1,337 @@
+import itertools
+import os
+import pickle
+import struct
+
+import petl
+
+# Payloads are pickled. Spill files are scratch files, only read by the process that wrote
+# them with SpillWriter (to a private temp file, or the path passed to materialize_to_file),
+# so they are never loaded from an untrusted source; hence the "nosec" markers below.
+
+# Identifies a spill file and the version of its layout
+MAGIC = b"PARSONS-SPILL\x01"
+
+# Number of rows written to each block
+DEFAULT_BLOCK_ROWS = 10000
+
+# Each block starts with its row count and the byte size of each of its column payloads. A
+# block with a column count of zero holds a single row-oriented payload instead.
+_BLOCK = struct.Struct("<QI")
+_SIZE = struct.Struct("<Q")
+
+
+class SpillWriter(object):
+    """
+    Write rows to a spill file: a compact, typed, block-oriented format for caching query
+    results and materialized tables on disk.
+
+    Rows are buffered into blocks, and each column of a block is pickled as a single list, so
+    values keep their Python types and a block is written and read in one call rather than once
+    per row. A footer indexes the blocks, which lets :class:`SpillView` read a subset of the
+    columns and skip the blocks outside of a range of rows.
+
+    `Args:`
+        path: str
+            The path of the file to write
+        header: list
+            The column names
+        block_rows: int
+            The number of rows to write to each block
+    """
+
+    def __init__(self, path, header, block_rows=DEFAULT_BLOCK_ROWS):
+        self.path = path
+        self.header = tuple(header)
+        self.block_rows = block_rows
+        self.num_rows = 0
+
+        self._blocks = []
+        self._pending = []
+        self._file = open(path, "wb")
+        self._file.write(MAGIC)
+        self._write_payload(pickle.dumps(self.header, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _write_payload(self, payload):
+        self._file.write(_SIZE.pack(len(payload)))
+        self._file.write(payload)
+
+    def write(self, rows):
+        """
+        Buffer rows, writing a block each time ``block_rows`` rows have accumulated.
+        """
+
+        self._pending.extend(rows)
+
+        while len(self._pending) >= self.block_rows:
+            self.write_block(self._pending[: self.block_rows])
+            del self._pending[: self.block_rows]
+
+    def write_block(self, rows):
+        """
+        Write a list of rows as a single block.
+        """
+
+        if not rows:
+            return
+
+        width = len(self.header)
+        if width and all(len(row) == width for row in rows):
+            payloads = [
+                pickle.dumps(list(column), protocol=pickle.HIGHEST_PROTOCOL)
+                for column in zip(*rows)
+            ]
+        else:
+            # Ragged rows can't be split into columns, so they are stored as they are
+            width = 0
+            payloads = [pickle.dumps([tuple(r) for r in rows], protocol=pickle.HIGHEST_PROTOCOL)]
+
+        self._blocks.append((self._file.tell(), len(rows)))
+        self._file.write(_BLOCK.pack(len(rows), width))
+        for payload in payloads:
+            self._file.write(_SIZE.pack(len(payload)))
+        for payload in payloads:
+            self._file.write(payload)
+
+        self.num_rows += len(rows)
+
+    def close(self):
+        if self._file.closed:
+            return
+
+        self.write_block(self._pending)
+        self._pending = []
+
+        footer_offset = self._file.tell()
+        self._write_payload(pickle.dumps(self._blocks, protocol=pickle.HIGHEST_PROTOCOL))
+        self._file.write(_SIZE.pack(footer_offset))
+        self._file.close()
+
+
+def write_spill(tbl, path, block_rows=DEFAULT_BLOCK_ROWS):
+    """
+    Write a petl table to a spill file in a single pass.
+
+    `Args:`
+        tbl: petl table
+        path: str
+            The path of the file to write
+        block_rows: int
+            The number of rows to write to each block
+    `Returns:`
+        :class:`SpillView` of the file
+    """
+
+    it = iter(tbl)
+    header = next(it, [])
+
+    with SpillWriter(path, header, block_rows=block_rows) as writer:
+        while True:
+            rows = [row for _, row in zip(range(block_rows), it)]
+            if not rows:
+                break
+            writer.write_block(rows)
+
+    return SpillView(path)
+
+
+class SpillView(petl.Table):
+    """
+    A petl table that reads rows from a spill file written by :class:`SpillWriter`.
+
+    `Args:`
+        path: str
+            The path of the spill file
+        columns: list
+            Optional column names or indexes to read. Other columns are skipped on disk
+            without being deserialized.
+        start: int
+            Optional index of the first row to read
+        stop: int
+            Optional index to stop reading at. Blocks entirely outside of ``start`` and ``stop``
+            are skipped without being read.
+    """
+
+    def __init__(self, path, columns=None, start=0, stop=None):
+        self.path = path
+        self.start = start
+        self.stop = stop
+
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} is not a Parsons spill file")
+
+            self.source_header = pickle.loads(self._read_payload(f))  # nosec B301
+
+            f.seek(-_SIZE.size, os.SEEK_END)
+            (footer_offset,) = _SIZE.unpack(f.read(_SIZE.size))
+            f.seek(footer_offset)
+            self.blocks = pickle.loads(self._read_payload(f))  # nosec B301
+
+        self.total_rows = sum(rows for _, rows in self.blocks)
+
+        self.indexes = None
+        if columns is not None:
+            self.indexes = self.project(columns).indexes
+
+    @staticmethod
+    def _read_payload(f):
+        (size,) = _SIZE.unpack(f.read(_SIZE.size))
+        return f.read(size)
+
+    @property
+    def header(self):
+        if self.indexes is None:
+            return tuple(self.source_header)
+
+        return tuple(self.source_header[i] for i in self.indexes)
+
+    def _copy(self, **attributes):
+        view = SpillView.__new__(SpillView)
+        view.__dict__.update(self.__dict__)
+        view.__dict__.update(attributes)
+
+        return view
+
+    def project(self, columns):
+        """
+        Return a view of a subset of the columns of this view, by name or index.
+        """
+
+        current = self.indexes
+        if current is None:
+            current = list(range(len(self.source_header)))
+        names = [self.source_header[i] for i in current]
+
+        indexes = []
+        for column in columns:
+            if isinstance(column, int) and not isinstance(column, bool) and column < len(names):
+                indexes.append(current[column])
+            elif column in names:
+                indexes.append(current[names.index(column)])
+            else:
+                raise petl.errors.FieldSelectionError(column)
+
+        return self._copy(indexes=indexes)
+
+    def slice(self, start=0, stop=None):
+        """
+        Return a view of a range of rows, relative to this view.
+        """
+
+        first, last = self._row_range()
+        start = min(first + start, last)
+        stop = last if stop is None else min(first + stop, last)
+
+        return self._copy(start=start, stop=stop)
+
+    def _row_range(self):
+        start = min(self.start, self.total_rows)
+        stop = self.total_rows if self.stop is None else min(self.stop, self.total_rows)
+
+        return start, max(start, stop)
+
+    def __len__(self):
+        start, stop = self._row_range()
+
+        return stop - start + 1
+
+    def _read_block(self, f, offset):
+        f.seek(offset)
+        num_rows, width = _BLOCK.unpack(f.read(_BLOCK.size))
+
+        if width == 0:
+            rows = pickle.loads(self._read_payload(f))  # nosec B301
+            if self.indexes is None:
+                return rows
+            return [tuple(r[i] if i < len(r) else None for i in self.indexes) for r in rows]
+
+        sizes = [_SIZE.unpack(f.read(_SIZE.size))[0] for _ in range(width)]
+        data_offset = f.tell()
+        offsets = [data_offset + sum(sizes[:i]) for i in range(width)]
+
+        indexes = range(width) if self.indexes is None else self.indexes
+        if not indexes:
+            return [()] * num_rows
+
+        columns = {}
+        for i in indexes:
+            if i not in columns:
+                f.seek(offsets[i])
+                columns[i] = pickle.loads(f.read(sizes[i]))  # nosec B301
+
+        return list(zip(*[columns[i] for i in indexes]))
+
+    def __iter__(self):
+        yield self.header
+
+        start, stop = self._row_range()
+        position = 0
+
+        with open(self.path, "rb") as f:
+            for offset, num_rows in self.blocks:
+                block_start = position
+                position += num_rows
+
+                if position <= start:
+                    continue
+                if block_start >= stop:
+                    break
+
+                rows = self._read_block(f, offset)
+                yield from rows[max(0, start - block_start) : stop - block_start]
+
+
+class SpillSelectView(petl.Table):
+    """
+    A petl table of the rows of a :class:`SpillView` that match a filter.
+
+    The filter is first evaluated on just the columns it uses, one block at a time, and the
+    rest of a block's columns are only read when some of its rows match.
+
+    `Args:`
+        view: SpillView
+            The view to filter
+        columns: list
+            The columns the filter uses
+        function: function
+            Called with a tuple of the ``columns`` of each row, returning whether to keep it
+    """
+
+    def __init__(self, view, columns, function):
+        self.view = view
+        self.columns = columns
+        self.function = function
+
+    def __iter__(self):
+        view = self.view
+        yield view.header
+
+        keys_view = view.project(self.columns)
+        start, stop = view._row_range()
+        position = 0
+
+        with open(view.path, "rb") as f:
+            for offset, num_rows in view.blocks:
+                block_start = position
+                position += num_rows
+
+                if position <= start:
+                    continue
+                if block_start >= stop:
+                    break
+
+                first, last = max(0, start - block_start), stop - block_start
+                keys = keys_view._read_block(f, offset)[first:last]
+                mask = [bool(self.function(key)) for key in keys]
+                if not any(mask):
+                    continue
+
+                rows = view._read_block(f, offset)[first:last]
+                yield from itertools.compress(rows, mask)
@@ -0,0 +1,106 @@
+import csv
+import io
+import zlib
+
+# Rows are encoded in blocks of roughly this many characters
+DEFAULT_BLOCK_SIZE = 1024 * 1024
+
+
+class CSVStream(io.RawIOBase):
+    """
+    A read-only, file-like object that serializes a petl table to CSV bytes on demand.
+
+    Rows are pulled from the table lazily and encoded in blocks as the stream is read, so the
+    whole table never needs to be written to disk or held in memory, and the source pipeline
+    is only evaluated once. The number of data rows streamed so far is available as
+    ``num_rows``.
+
+    With ``compression="gzip"`` the blocks are compressed as they are encoded, and the stream
+    yields the bytes of a gzip file.
+
+    `Args:`
+        table: petl table
+            The table to serialize
+        encoding: str
+            The text encoding of the output. Defaults to ``utf-8``.
+        errors: str
+            How to handle encoding errors. Defaults to ``strict``.
+        write_header: bool
+            Include the header row. Defaults to ``True``.
+        block_size: int
+            The approximate number of characters to encode at a time.
+        compression: str
+            ``gzip`` to compress the output. Defaults to ``None``.
+        \\**csvargs: kwargs
+            ``csv.writer`` optional arguments
+    """
+
+    def __init__(
+        self,
+        table,
+        encoding="utf-8",
+        errors="strict",
+        write_header=True,
+        block_size=DEFAULT_BLOCK_SIZE,
+        compression=None,
+        **csvargs,
+    ):
+        if compression not in (None, "gzip"):
+            raise ValueError(f"Unsupported compression type: {compression}")
+
+        self._rows = iter(table)
+        self._encoding = encoding or "utf-8"
+        self._errors = errors
+        self._block_size = block_size
+        self._text = io.StringIO()
+        self._writer = csv.writer(self._text, **csvargs)
+        self._buffer = bytearray()
+        self._exhausted = False
+
+        # wbits=31 writes a gzip header and trailer around the deflate stream
+        self._compressor = zlib.compressobj(wbits=31) if compression == "gzip" else None
+
+        self.num_rows = 0
+
+        header = next(self._rows, None)
+        if header is not None and write_header:
+            self._writer.writerow(header)
+
+    def readable(self):
+        return True
+
+    def _fill(self):
+        # Serialize the next block of rows and append the encoded bytes to the buffer
+        rows = self._rows
+        writerow = self._writer.writerow
+        text = self._text
+
+        while text.tell() < self._block_size:
+            row = next(rows, None)
+            if row is None:
+                self._exhausted = True
+                break
+
+            writerow(row)
+            self.num_rows += 1
+
+        data = text.getvalue().encode(self._encoding, self._errors)
+        text.seek(0)
+        text.truncate()
+
+        if self._compressor:
+            data = self._compressor.compress(data)
+            if self._exhausted:
+                data += self._compressor.flush()
+
+        self._buffer += data
+
+    def readinto(self, b):
+        while len(self._buffer) < len(b) and not self._exhausted:
+            self._fill()
+
+        size = min(len(b), len(self._buffer))
+        b[:size] = self._buffer[:size]
+        del self._buffer[:size]
+
+        return size
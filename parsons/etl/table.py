@@ -1,13 +1,16 @@
+import copy
+import datetime
 import logging
-import pickle
 from enum import Enum
 from typing import Union
 
 import petl
 
+from parsons.etl import arrow, cache, plan, spill
 from parsons.etl.etl import ETL
 from parsons.etl.tofrom import ToFrom
 from parsons.utilities import files
+from parsons.utilities.sql_helpers import is_sql_number
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +47,9 @@ class Table(ETL, ToFrom):
             The name of the table (optional)
     """
 
+    # Options for the caches added by the auto-cache policy, or None if it is off
+    _auto_cache_options = None
+
     def __init__(
         self,
         lst: Union[list, tuple, petl.util.base.Table, _EmptyDefault] = _EMPTYDEFAULT,
@@ -81,6 +87,12 @@ class Table(ETL, ToFrom):
                 f"Got {type(lst)}, expected list, tuple, or petl Table"
             )
 
+        # Cached result of profile(), paired with the petl table it describes
+        self._profile = None
+
+        # The CacheView added by cache() or the auto-cache policy
+        self._cache = None
+
         if not self.is_valid_table():
             raise ValueError("Could not create Table")
 
@@ -89,12 +101,16 @@ class Table(ETL, ToFrom):
         self._index_count = 0
 
     def __repr__(self):
+        self._auto_cache()
         return repr(petl.dicts(self.table))
 
     def __iter__(self):
+        self._auto_cache()
         return iter(petl.dicts(self.table))
 
     def __getitem__(self, index):
+        self._auto_cache()
+
         if isinstance(index, int):
             return self.row_data(index)
 
@@ -109,6 +125,8 @@ class Table(ETL, ToFrom):
             raise TypeError("You must pass a string or an index as a value.")
 
     def __bool__(self):
+        self._auto_cache()
+
         # Try to get a single row from our table
         head_one = petl.head(self.table)
 
@@ -129,7 +147,25 @@ class Table(ETL, ToFrom):
             int
                 Number of rows in the table
         """
-        return petl.nrows(self.table)
+        self._auto_cache()
+
+        profile = self._cached_profile()
+        if profile:
+            return profile["num_rows"]
+
+        # Column steps don't change the number of rows, so count the plan's source rows
+        table = self.table
+        if isinstance(table, plan.FusedView):
+            table = table.source
+
+        if isinstance(table, cache.CacheView) and table.complete:
+            return table.num_rows()
+
+        # Arrow and spill file views know their row count without reading the rows
+        if isinstance(table, (arrow.ArrowView, spill.SpillView)):
+            return len(table) - 1
+
+        return petl.nrows(table)
 
     def __len__(self):
         return self.num_rows
@@ -140,6 +176,7 @@ class Table(ETL, ToFrom):
         Returns an iterable object for iterating over the raw data rows as tuples
         (without field names)
         """
+        self._auto_cache()
         return petl.data(self.table)
 
     @property
@@ -149,6 +186,7 @@ class Table(ETL, ToFrom):
             list
                 List of the table's column names
         """
+        self._auto_cache()
         return list(petl.header(self.table))
 
     @property
@@ -177,8 +215,12 @@ class Table(ETL, ToFrom):
                 as the value.
         """
 
+        self._auto_cache()
+
         self._index_count += 1
-        if self._index_count >= DIRECT_INDEX_WARNING_COUNT:
+        if self._index_count >= DIRECT_INDEX_WARNING_COUNT and not (
+            self._cache is not None and self._cache is self.table
+        ):
             logger.warning(
                 """
                 You have indexed directly into this Table multiple times. This can be inefficient,
@@ -186,6 +228,7 @@ class Table(ETL, ToFrom):
                 Table. If you are accessing many rows of data, consider switching to this style of
                 iteration, which is much more efficient:
                 `for row in table:`
+                or call `table.cache()` so the rows are only computed once.
                 """
             )
 
@@ -203,21 +246,47 @@ class Table(ETL, ToFrom):
                 A list of data in the column.
         """
 
+        self._auto_cache()
+
         if column_name in self.columns:
             return list(self.table[column_name])
 
         else:
             raise ValueError("Column name not found.")
 
-    def materialize(self):
+    def materialize(self, engine="petl"):
         """
         "Materializes" a Table, meaning all data is loaded into memory and all pending
         transformations are applied.
 
         Use this if petl's lazy-loading behavior is causing you problems, eg. if you want to read
         data from a file immediately.
+
+        With ``engine="arrow"`` the data is stored as typed Arrow column buffers rather than
+        Python tuples, which uses much less memory for large tables. ``cut``, ``select_rows``
+        (with ``pyarrow.compute`` expressions), ``sort``, ``deduplicate``, ``convert_column``
+        and ``concat`` then run as vectorized operations; all other methods work as usual
+        through petl. If a column holds values Arrow cannot store without changing them
+        (eg. mixed types or nested dicts), the table is materialized with petl instead.
+        Requires ``pyarrow``.
+
+        `Args:`
+            engine: str
+                Either ``petl`` (the default) or ``arrow``.
         """
 
+        if engine == "arrow":
+            arrow_table = arrow.to_arrow_table(self.table)
+
+            if arrow_table is not None:
+                self.table = arrow.ArrowView(arrow_table)
+                return
+
+            logger.info("Table cannot be stored in Arrow format; materializing with petl.")
+
+        elif engine != "petl":
+            raise ValueError(f"Invalid engine {engine}; expected 'petl' or 'arrow'")
+
         self.table = petl.wrap(petl.tupleoftuples(self.table))
 
     def materialize_to_file(self, file_path=None):
@@ -238,21 +307,237 @@ class Table(ETL, ToFrom):
                 Path to the temp file that now contains the table
         """
 
-        # Load the data in batches, and "pickle" the rows to a temp file.
-        # (We pickle rather than writing to, say, a CSV, so that we maintain
-        # all the type information for each field.)
+        # Write the data in blocks to a spill file, rather than to, say, a CSV, so that we
+        # maintain all the type information for each field.
 
         file_path = file_path or files.create_temp_file()
 
-        with open(file_path, "wb") as handle:
-            for row in self.table:
-                pickle.dump(list(row), handle)
-
         # Load a Table from the file
-        self.table = petl.frompickle(file_path)
+        self.table = spill.write_spill(self.table, file_path)
 
         return file_path
 
+    def cache(self, max_memory="256MB", spill=True, spill_dir=None):
+        """
+        Cache the table's rows the first time they are all read, so that later reads don't
+        apply the pending transformations (or download the source data) again.
+
+        Unlike ``materialize``, nothing is read until the table is used. The first full pass,
+        eg. ``num_rows`` or ``to_csv``, records the rows in memory up to ``max_memory``, and
+        the rest in a local temp file. Later passes replay the recording. Transformations made
+        after calling ``cache`` apply on top of the cached rows.
+
+        Use ``cache_stats`` to see how many reads the cache served.
+
+        `Args:`
+            max_memory: int or str
+                The memory budget for cached rows, in bytes or as a string like ``"512MB"``
+            spill: bool
+                Write the rows beyond ``max_memory`` to a temp file. If ``False``, a table
+                larger than the budget isn't cached.
+            spill_dir: str
+                The directory for the temp file. Defaults to the system temp directory.
+        `Returns:`
+            `Parsons Table` and also updates self
+        """
+
+        if isinstance(self.table, cache.CacheView):
+            # Replace a cache with different options, such as one added automatically
+            self.table.clear()
+            self.table = self.table.source
+
+        self._set_cache(
+            cache.CacheView(self.table, max_memory=max_memory, spill=spill, spill_dir=spill_dir)
+        )
+
+        return self
+
+    @property
+    def cache_stats(self):
+        """
+        `Returns:`
+            dict
+                The ``hits`` (reads served by the cache) and ``misses`` (reads that ran the
+                pending transformations) of the table's cache, and whether it is ``complete``.
+                ``None`` if the table isn't cached.
+        """
+
+        if self._cache is None:
+            return None
+
+        return {
+            "hits": self._cache.hits,
+            "misses": self._cache.misses,
+            "complete": self._cache.complete,
+        }
+
+    @classmethod
+    def set_auto_cache(cls, enabled=True, max_memory="256MB", spill=True, spill_dir=None):
+        """
+        Turn the auto-cache policy on or off for all tables.
+
+        With the policy on, reading a table, eg. with ``num_rows``, ``columns``, iteration or
+        ``to_csv``, calls ``cache`` on it first, unless its data is already in memory or in a
+        file. A table is only recorded during a full read, and the cache is dropped by the
+        next column transformation if it hasn't recorded anything yet.
+
+        `Args:`
+            enabled: bool
+                Whether to turn the policy on
+            max_memory: int or str
+                See ``cache``
+            spill: bool
+                See ``cache``
+            spill_dir: str
+                See ``cache``
+        """
+
+        if enabled:
+            cls._auto_cache_options = {
+                "max_memory": max_memory,
+                "spill": spill,
+                "spill_dir": spill_dir,
+            }
+        else:
+            cls._auto_cache_options = None
+
+    def _auto_cache(self):
+        options = self._auto_cache_options
+        if options is None:
+            return
+
+        # Tables that are already in memory or in a file are cheap to read again
+        table = self.table
+        if isinstance(table, (cache.CacheView, arrow.ArrowView, spill.SpillView)):
+            return
+        if isinstance(getattr(table, "inner", getattr(table, "dicts", None)), (list, tuple)):
+            return
+
+        self._set_cache(cache.CacheView(table, auto=True, **options))
+
+    def _set_cache(self, view):
+        # Caching doesn't change the rows, so keep the profile of the table
+        profile = self._cached_profile()
+        self.table = view
+        self._cache = view
+        if profile is not None:
+            self._profile = (view, profile)
+
+    def profile(self):
+        """
+        Collect statistics for every column of the table in a single pass over the data.
+
+        The result is cached on the Table, so repeated calls (and the methods that rely on it,
+        such as ``get_columns_type_stats``, ``get_column_max_width`` and the database create
+        statement generators) do not rescan the data. The cache is discarded as soon as a
+        transformation modifies the table.
+
+        Each column dict contains:
+
+        * ``name``: The column name
+        * ``type``: The names of the Python types found in the column
+        * ``null_count``: The number of ``None`` values
+        * ``blank_count``: The number of empty strings and ``'NA'`` placeholders
+        * ``text_count``: The number of values that are not numbers, booleans or ``None``
+          and do not parse as a SQL number (blanks included)
+        * ``bool_count``, ``int_count``, ``float_count``: The number of values of each type
+        * ``int_min``, ``int_max``: The range of the integer values, or ``None``
+        * ``min``, ``max``: The smallest and largest non-null values, or ``None`` if the
+          column is empty or its values cannot be compared with each other
+        * ``max_width``: The widest value in bytes when encoded as a UTF-8 string
+        * ``tz_aware_count``: The number of timezone-aware datetimes
+
+        `Returns:`
+            dict
+                ``num_rows`` and a list of ``columns`` stats
+        """
+
+        self._auto_cache()
+        profile = self._cached_profile()
+
+        if profile is None:
+            profile = self._scan_profile()
+            self._profile = (self.table, profile)
+
+        return copy.deepcopy(profile)
+
+    def _cached_profile(self):
+        # Only return the cached profile if the table hasn't been transformed since
+        if self._profile is not None and self._profile[0] is self.table:
+            return self._profile[1]
+
+        return None
+
+    def _scan_profile(self):
+        stats = [
+            {
+                "name": column,
+                "type": [],
+                "null_count": 0,
+                "blank_count": 0,
+                "text_count": 0,
+                "bool_count": 0,
+                "int_count": 0,
+                "float_count": 0,
+                "int_min": None,
+                "int_max": None,
+                "min": None,
+                "max": None,
+                "max_width": 0,
+                "tz_aware_count": 0,
+            }
+            for column in self.columns
+        ]
+        comparable = [True] * len(stats)
+        num_rows = 0
+
+        for row in petl.data(self.table):
+            num_rows += 1
+
+            for i, (col, value) in enumerate(zip(stats, row)):
+                value_type = type(value)
+                type_name = value_type.__name__
+                if type_name not in col["type"]:
+                    col["type"].append(type_name)
+
+                width = len(str(value).encode("utf-8"))
+                if width > col["max_width"]:
+                    col["max_width"] = width
+
+                if value is None:
+                    col["null_count"] += 1
+                    continue
+
+                if value_type is bool:
+                    col["bool_count"] += 1
+                elif value_type is int:
+                    col["int_count"] += 1
+                    if col["int_min"] is None or value < col["int_min"]:
+                        col["int_min"] = value
+                    if col["int_max"] is None or value > col["int_max"]:
+                        col["int_max"] = value
+                elif value_type is float:
+                    col["float_count"] += 1
+                elif not is_sql_number(value):
+                    col["text_count"] += 1
+                    if value in ("", "NA"):
+                        col["blank_count"] += 1
+
+                if isinstance(value, datetime.datetime) and value.tzinfo:
+                    col["tz_aware_count"] += 1
+
+                if comparable[i]:
+                    try:
+                        if col["min"] is None or value < col["min"]:
+                            col["min"] = value
+                        if col["max"] is None or value > col["max"]:
+                            col["max"] = value
+                    except TypeError:
+                        comparable[i] = False
+                        col["min"] = col["max"] = None
+
+        return {"num_rows": num_rows, "columns": stats}
+
     def is_valid_table(self):
         """
         Performs some simple checks on a Table. Specifically, verifies that we have a valid petl
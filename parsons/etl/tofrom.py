@@ -5,6 +5,9 @@ from typing import Optional
 
 import petl
 
+from parsons.etl import arrow
+from parsons.etl.predicate import Predicate
+from parsons.etl.stream import CSVStream
 from parsons.utilities import files, zip_archive
 
 
@@ -30,6 +33,7 @@ class ToFrom(object):
                 Pandas DataFrame object
         """
 
+        self._auto_cache()
         return petl.todataframe(
             self.table,
             index=index,
@@ -38,6 +42,22 @@ class ToFrom(object):
             coerce_float=coerce_float,
         )
 
+    def to_arrow(self):
+        """
+        Outputs table as a ``pyarrow.Table``. Requires ``pyarrow``.
+
+        `Returns:`
+            ``pyarrow.Table``
+        """
+
+        self._auto_cache()
+        arrow_table = arrow.to_arrow_table(self.table)
+
+        if arrow_table is None:
+            raise ValueError("Table contains values that cannot be converted to Arrow")
+
+        return arrow_table
+
     def to_html(
         self,
         local_path=None,
@@ -84,6 +104,7 @@ class ToFrom(object):
         if not local_path:
             local_path = files.create_temp_file(suffix=".html")
 
+        self._auto_cache()
         petl.tohtml(
             self.table,
             source=local_path,
@@ -160,6 +181,7 @@ class ToFrom(object):
             local_path = files.create_temp_file(suffix=suffix)
 
         # Create normal csv/.gzip
+        self._auto_cache()
         petl.tocsv(
             self.table,
             source=local_path,
@@ -171,6 +193,50 @@ class ToFrom(object):
 
         return local_path
 
+    def to_csv_stream(
+        self,
+        encoding="utf-8",
+        errors="strict",
+        write_header=True,
+        compression=None,
+        **csvargs,
+    ):
+        """
+        Outputs table as a readable, file-like stream of CSV bytes. Additional key word
+        arguments are passed to ``csv.writer()``.
+
+        Rows are serialized in blocks as the stream is read, rather than written to a file
+        first, so this is useful for loading large tables into APIs and databases that accept
+        file-like objects. The number of rows streamed so far is available from the stream's
+        ``num_rows`` attribute.
+
+        `Args:`
+            encoding: str
+                The CSV encoding type. Defaults to ``utf-8``.
+            errors: str
+                Raise an Error if encountered
+            write_header: boolean
+                Include header in output
+            compression: str
+                ``gzip`` to compress the stream as it is read. Defaults to ``None``.
+            \**csvargs: kwargs
+                ``csv_writer`` optional arguments
+
+        `Returns:`
+            CSVStream
+                A file-like object opened for reading in binary mode
+        """
+
+        self._auto_cache()
+        return CSVStream(
+            self.table,
+            encoding=encoding,
+            errors=errors,
+            write_header=write_header,
+            compression=compression,
+            **csvargs,
+        )
+
     def append_csv(self, local_path, encoding=None, errors="strict", **csvargs):
         """
         Appends table to an existing CSV.
@@ -319,6 +385,7 @@ class ToFrom(object):
             list
         """
 
+        self._auto_cache()
         return list(petl.dicts(self.table))
 
     def to_sftp_csv(
@@ -435,19 +502,6 @@ class ToFrom(object):
 
         compression = compression or files.compression_type_for_path(key)
 
-        csv_name = files.extract_file_name(key, include_suffix=False) + ".csv"
-
-        # Save the CSV as a temp file
-        local_path = self.to_csv(
-            temp_file_compression=compression,
-            encoding=encoding,
-            errors=errors,
-            write_header=write_header,
-            csv_name=csv_name,
-            **csvargs,
-        )
-
-        # Put the file on S3
         from parsons.aws import S3
 
         self.s3 = S3(
@@ -455,7 +509,33 @@ class ToFrom(object):
             aws_secret_access_key=aws_secret_access_key,
             use_env_token=use_env_token,
         )
-        self.s3.put_file(bucket, key, local_path, acl=acl)
+
+        if compression in (None, "gzip"):
+            # Stream the CSV to S3 as it is written, without a local file
+            stream = self.to_csv_stream(
+                encoding=encoding,
+                errors=errors,
+                write_header=write_header,
+                compression=compression,
+                **csvargs,
+            )
+            self.s3.put_stream(bucket, key, stream, acl=acl)
+
+        else:
+            csv_name = files.extract_file_name(key, include_suffix=False) + ".csv"
+
+            # Save the CSV as a temp file
+            local_path = self.to_csv(
+                temp_file_compression=compression,
+                encoding=encoding,
+                errors=errors,
+                write_header=write_header,
+                csv_name=csv_name,
+                **csvargs,
+            )
+
+            # Put the file on S3
+            self.s3.put_file(bucket, key, local_path, acl=acl)
 
         if public_url:
             return self.s3.get_url(bucket, key, expires_in=public_url_expires)
@@ -812,7 +892,9 @@ class ToFrom(object):
             return cls(petl.fromjson(local_path, header=header))
 
     @classmethod
-    def from_redshift(cls, sql, username=None, password=None, host=None, db=None, port=None):
+    def from_redshift(
+        cls, sql, username=None, password=None, host=None, db=None, port=None, where=None
+    ):
         """
         Create a ``parsons table`` from a Redshift query.
 
@@ -831,6 +913,11 @@ class ToFrom(object):
                 Required if env variable ``REDSHIFT_DB`` not populated
             port: int
                 Required if env variable ``REDSHIFT_PORT`` not populated. Port 5439 is typical.
+            where: str
+                Optional filter in the expression format of
+                :meth:`~parsons.etl.etl.ETL.select_rows`, eg. ``"{state} == 'NY'"``. It is
+                run as a ``WHERE`` clause around the query, so only matching rows are
+                downloaded.
 
         `Returns:`
             Parsons Table
@@ -840,10 +927,12 @@ class ToFrom(object):
         from parsons.databases.redshift import Redshift
 
         rs = Redshift(username=username, password=password, host=host, db=db, port=port)
-        return rs.query(sql)
+        return rs.query(*_filtered_query(sql, where))
 
     @classmethod
-    def from_postgres(cls, sql, username=None, password=None, host=None, db=None, port=None):
+    def from_postgres(
+        cls, sql, username=None, password=None, host=None, db=None, port=None, where=None
+    ):
         """
         Args:
             sql: str
@@ -858,12 +947,17 @@ class ToFrom(object):
                 Required if env variable ``PGDATABASE`` not populated
             port: int
                 Required if env variable ``PGPORT`` not populated.
+            where: str
+                Optional filter in the expression format of
+                :meth:`~parsons.etl.etl.ETL.select_rows`, eg. ``"{state} == 'NY'"``. It is
+                run as a ``WHERE`` clause around the query, so only matching rows are
+                downloaded.
         """
 
         from parsons.databases.postgres import Postgres
 
         pg = Postgres(username=username, password=password, host=host, db=db, port=port)
-        return pg.query(sql)
+        return pg.query(*_filtered_query(sql, where))
 
     @classmethod
     def from_s3_csv(
@@ -963,3 +1057,53 @@ class ToFrom(object):
         """
 
         return cls(petl.fromdataframe(dataframe, include_index=include_index))
+
+    @classmethod
+    def from_pages(cls, pages, header=None):
+        """
+        Create a ``parsons table`` that streams rows from an iterable of pages, such as the
+        pages of a paginated API response.
+
+        Pages are consumed only as their rows are read, so the table can be written to a file or
+        database while later pages are still being requested, without holding every page in
+        memory. Rows are cached in a temporary file as they are read, so the pages are only
+        consumed once.
+
+        `Args:`
+            pages: iterable
+                An iterable of pages, each a list of dicts
+            header: list
+                Optional column names. If not given, they are discovered from the keys of
+                the first 1,000 rows, which are read when the table is created.
+        """
+
+        def rows():
+            for page in pages:
+                yield from page
+
+        return cls(petl.fromdicts(rows(), header=header))
+
+    @classmethod
+    def from_arrow(cls, arrow_table):
+        """
+        Create a ``parsons table`` backed by a ``pyarrow.Table``. The data stays in Arrow column
+        buffers; see :meth:`Table.materialize` for the operations that run vectorized.
+
+        `Args:`
+            arrow_table: pyarrow.Table
+                A pyarrow Table
+        """
+
+        return cls(arrow.ArrowView(arrow_table))
+
+
+def _filtered_query(sql, where):
+    # Wrap a query in a WHERE clause translated from a select_rows expression string
+    if where is None:
+        return sql, None
+
+    clause, params = Predicate(where).to_sql()
+
+    # With parameters, a literal % in the query has to be escaped, eg. in LIKE 'A%'
+    sql = sql.strip().rstrip(";").replace("%", "%%")
+    return f"SELECT * FROM ({sql}) AS parsons_query WHERE {clause}", params
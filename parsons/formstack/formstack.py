@@ -68,20 +68,16 @@ class Formstack(object):
                 A table with the returned data.
         """
         data = Table()
-        page = 1
-        pages = None
 
-        while pages is None or page <= pages:
-            req_params = {**params, "page": page}
-            response_data = self.client.get_request(url, req_params)
-            pages = response_data["pages"]
+        def get_page(page):
+            return self.client.get_request(url, {**params, "page": page})
+
+        for response_data in self.client.get_pages(get_page, lambda r: r["pages"]):
             data.concat(Table(response_data[data_key]))
 
             if large_request:
                 data.materialize()
 
-            page += 1
-
         return data
 
     def get_folders(self) -> Table:
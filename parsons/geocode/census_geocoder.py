@@ -105,7 +105,8 @@ class CensusGeocoder(object):
             A Parsons table
         """
 
-        logger.info(f"Geocoding {table.num_rows} records.")
+        total_rows = table.num_rows
+        logger.info(f"Geocoding {total_rows} records.")
         if set(table.columns) != {"id", "street", "city", "state", "zip"}:
             msg = (
                 "Table must ONLY include `['id', 'street', 'city', 'state', 'zip']` as"
@@ -113,15 +114,14 @@ class CensusGeocoder(object):
             )
             raise ValueError(msg)
 
-        chunked_tables = table.chunk(BATCH_SIZE)
         batch_count = 1
         records_processed = 0
 
         geocoded_tbl = Table([[]])
-        for tbl in chunked_tables:
+        for tbl in table.iter_chunks(BATCH_SIZE):
             geocoded_tbl.concat(Table(petl.fromdicts(self.cg.addressbatch(tbl))))
             records_processed += tbl.num_rows
-            logger.info(f"{records_processed} of {table.num_rows} records processed.")
+            logger.info(f"{records_processed} of {total_rows} records processed.")
             batch_count += 1
 
         return geocoded_tbl
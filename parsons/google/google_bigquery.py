@@ -1,7 +1,6 @@
 import datetime
 import json
 import logging
-import pickle
 import random
 import uuid
 from contextlib import contextmanager
@@ -18,6 +17,7 @@ from google.oauth2.credentials import Credentials
 from parsons.databases.database_connector import DatabaseConnector
 from parsons.databases.table import BaseTable
 from parsons.etl import Table
+from parsons.etl.spill import SpillView, SpillWriter
 from parsons.google.google_cloud_storage import GoogleCloudStorage
 from parsons.google.utilities import (
     load_google_application_credentials,
@@ -1266,7 +1266,7 @@ class GoogleBigQuery(DatabaseConnector):
 
         Not usually necessary to use this. BigQuery is able to
         natively autodetect schema formats."""
-        stats = tbl.get_columns_type_stats()
+        stats = tbl.profile()["columns"]
         fields = []
         for stat in stats:
             petl_types = stat["type"]
@@ -1286,10 +1286,8 @@ class GoogleBigQuery(DatabaseConnector):
 
             # Python datetimes may be datetime or timestamp in BigQuery
             # BigQuery datetimes have no timezone, timestamps do
-            if best_type == "datetime":
-                for value in petl.util.base.values(tbl.table, stat["name"]):
-                    if isinstance(value, datetime.datetime) and value.tzinfo:
-                        best_type = "timestamp"
+            if best_type == "datetime" and stat["tz_aware_count"]:
+                best_type = "timestamp"
 
             try:
                 field_type = self._bigquery_type(best_type)
@@ -1396,25 +1394,20 @@ class GoogleBigQuery(DatabaseConnector):
 
     def _fetch_query_results(self, cursor) -> Table:
         # We will use a temp file to cache the results so that they are not all living
-        # in memory. We'll use pickle to serialize the results to file in order to maintain
-        # the proper data types (e.g. integer).
+        # in memory. We'll use a spill file to serialize the results to file in blocks in order
+        # to maintain the proper data types (e.g. integer).
         temp_filename = create_temp_file()
+        header = [i[0] for i in cursor.description]
 
-        with open(temp_filename, "wb") as temp_file:
-            header = [i[0] for i in cursor.description]
-            pickle.dump(header, temp_file)
-
+        with SpillWriter(temp_filename, header) as writer:
             while True:
                 batch = cursor.fetchmany(QUERY_BATCH_SIZE)
                 if len(batch) == 0:
                     break
 
-                for row in batch:
-                    row_data = list(row.values())
-                    pickle.dump(row_data, temp_file)
+                writer.write([list(row.values()) for row in batch])
 
-        ptable = petl.frompickle(temp_filename)
-        return Table(ptable)
+        return Table(SpillView(temp_filename))
 
     def _validate_copy_inputs(self, if_exists: str, data_type: str):
         if if_exists not in ["fail", "truncate", "append", "drop"]:
@@ -4,10 +4,12 @@ import os
 import re
 
 import petl
+import requests
 from requests import request as _request
 
 from parsons.etl.table import Table
 from parsons.utilities.datetime import date_to_timestamp
+from parsons.utilities.response_cache import mount_cache
 
 logger = logging.getLogger(__name__)
 
@@ -20,15 +22,22 @@ class MobilizeAmerica(object):
 
     api_key: str
         An api key issued by Mobilize America. This is required to access some private methods.
+    cache: ResponseCache
+        Optional :class:`~parsons.utilities.response_cache.ResponseCache` of ``GET``
+        responses, for reference data such as organizations that rarely changes.
 
     `Returns:`
         MobilizeAmerica Class
     """
 
-    def __init__(self, api_key=None):
+    def __init__(self, api_key=None, cache=None):
         self.uri = MA_URI
         self.api_key = api_key or os.environ.get("MOBILIZE_AMERICA_API_KEY")
 
+        self.session = None
+        if cache is not None:
+            self.session = mount_cache(requests.Session(), cache)
+
         if not self.api_key:
             logger.info(
                 "Mobilize America API Key missing. Calling methods that rely on private"
@@ -45,7 +54,8 @@ class MobilizeAmerica(object):
         else:
             header = None
 
-        r = _request(req_type, url, json=post_data, params=args, headers=header)
+        send = self.session.request if self.session else _request
+        r = send(req_type, url, json=post_data, params=args, headers=header)
 
         r.raise_for_status()
 
@@ -54,14 +64,21 @@ class MobilizeAmerica(object):
 
         return r
 
-    def _request_paginate(self, url, req_type="GET", args=None, auth=False):
+    def _iter_pages(self, url, req_type="GET", args=None, auth=False):
+        # Yield the data of each page as it arrives
         r = self._request(url, req_type=req_type, args=args, auth=auth)
-
-        json = r.json()["data"]
+        yield r.json()["data"]
 
         while r.json()["next"]:
             r = self._request(r.json()["next"], req_type=req_type, auth=auth)
-            json.extend(r.json()["data"])
+            yield r.json()["data"]
+
+    def _request_paginate(self, url, req_type="GET", args=None, auth=False):
+        pages = self._iter_pages(url, req_type=req_type, args=args, auth=auth)
+
+        json = next(pages)
+        for page in pages:
+            json.extend(page)
 
         return json
 
@@ -326,7 +343,7 @@ class MobilizeAmerica(object):
 
         return Table(self._request_paginate(self.uri + "events/deleted", args=args))
 
-    def get_people(self, organization_id, updated_since=None):
+    def get_people(self, organization_id, updated_since=None, stream=False):
         """
         Fetch all people (volunteers) who are affiliated with an organization(s).
 
@@ -338,6 +355,9 @@ class MobilizeAmerica(object):
                 Request people associated with a single or multiple organization ids
             updated_since: str
                 Filter to people updated since given date (ISO Date)
+            stream: bool
+                Return a Table that requests each page only as its rows are read, rather than
+                requesting every page up front. Defaults to ``False``.
         `Returns`
             Parsons Table
                 See :ref:`parsons-table` for output options.
@@ -345,14 +365,16 @@ class MobilizeAmerica(object):
         if isinstance(organization_id, collections.abc.Iterable):
             data = Table()
             for id in organization_id:
-                data.concat(self.get_people(id, updated_since))
+                data.concat(self.get_people(id, updated_since, stream=stream))
             return data
         else:
             url = self.uri + "organizations/" + str(organization_id) + "/people"
             args = {"updated_since": date_to_timestamp(updated_since)}
+            if stream:
+                return Table.from_pages(self._iter_pages(url, args=args, auth=True))
             return Table(self._request_paginate(url, args=args, auth=True))
 
-    def get_attendances(self, organization_id, updated_since=None):
+    def get_attendances(self, organization_id, updated_since=None, stream=False):
         """
         Fetch all attendances which were either promoted by the organization or
         were for events owned by the organization.
@@ -365,10 +387,15 @@ class MobilizeAmerica(object):
                 Filter attendances by an organization id
             updated_since: str
                 Filter to attendances updated since given date (ISO Date)
+            stream: bool
+                Return a Table that requests each page only as its rows are read, rather than
+                requesting every page up front. Defaults to ``False``.
         `Returns`
             Parsons Table
                 See :ref:`parsons-table` for output options.
         """
         url = self.uri + "organizations/" + str(organization_id) + "/attendances"
         args = {"updated_since": date_to_timestamp(updated_since)}
+        if stream:
+            return Table.from_pages(self._iter_pages(url, args=args, auth=True))
         return Table(self._request_paginate(url, args=args, auth=True))
@@ -34,6 +34,10 @@ class NationBuilder:
 
         self.client = APIConnector(NationBuilder.get_uri(slug), headers=headers)
 
+        # Pace requests to the X-RateLimit headers NationBuilder sends with each response, so
+        # paging through people doesn't run into the limit
+        self.client.rate_limit_adaptive = True
+
     @classmethod
     def get_uri(cls, slug: Optional[str]) -> str:
         if slug is None:
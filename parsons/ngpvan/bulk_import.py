@@ -2,13 +2,21 @@
 
 import csv
 import logging
+import time
 import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 from parsons.etl.table import Table
 from parsons.utilities import cloud_storage
 
 logger = logging.getLogger(__name__)
 
+# The number of chunks of a split bulk import to upload and submit at once
+BULK_IMPORT_WORKERS = 4
+
+# Bulk import job statuses for jobs that haven't finished
+PENDING_JOB_STATUSES = ("Pending", "InProgress")
+
 
 class BulkImport(object):
     def __init__(self):
@@ -68,6 +76,56 @@ class BulkImport(object):
 
         return None
 
+    def get_bulk_import_jobs_results(self, job_ids, poll_interval=30, timeout=None):
+        """
+        Wait for several bulk import jobs to finish, such as the jobs of a bulk import split
+        with ``max_rows_per_job``, and combine their result files into a single table.
+
+        `Args:`
+            job_ids: list
+                The bulk import job ids
+            poll_interval: int
+                The number of seconds to wait between checks of the jobs' statuses
+            timeout: int
+                Optional number of seconds to wait before raising a ``TimeoutError``
+        `Returns:`
+            Parsons Table
+                The results of every job, in the order of ``job_ids``, or an empty table if
+                there are no jobs. See :ref:`parsons-table` for output options.
+        """
+
+        if not job_ids:
+            return Table()
+
+        jobs = {}
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with ThreadPoolExecutor(max_workers=BULK_IMPORT_WORKERS) as executor:
+            while True:
+                # Check every unfinished job at once
+                pending = [job_id for job_id in job_ids if job_id not in jobs]
+                for job_id, job in zip(pending, executor.map(self.get_bulk_import_job, pending)):
+                    if job["status"] not in PENDING_JOB_STATUSES:
+                        jobs[job_id] = job
+
+                if len(jobs) == len(job_ids):
+                    break
+
+                logger.info(f"Waiting on {len(job_ids) - len(jobs)} bulk import jobs.")
+                if deadline is not None and time.monotonic() + poll_interval > deadline:
+                    raise TimeoutError("Bulk import jobs did not finish in time.")
+                time.sleep(poll_interval)
+
+        failed = [job_id for job_id in job_ids if jobs[job_id]["status"] != "Completed"]
+        if failed:
+            raise ValueError(f"Bulk import jobs {failed} did not complete.")
+
+        results = [Table.from_csv(jobs[job_id]["resultFiles"][0]["url"]) for job_id in job_ids]
+        tbl = results[0]
+        tbl.concat(*results[1:])
+
+        return tbl
+
     def get_bulk_import_mapping_types(self):
         """
         Get bulk import mapping types.
@@ -122,10 +180,23 @@ class BulkImport(object):
         mapping_types,
         description,
         result_fields=None,
+        max_rows_per_job=None,
         **url_kwargs,
     ):
         # Internal method to post bulk imports.
 
+        if max_rows_per_job:
+            return self._post_bulk_import_chunks(
+                tbl,
+                url_type,
+                resource_type,
+                mapping_types,
+                description,
+                result_fields,
+                max_rows_per_job,
+                **url_kwargs,
+            )
+
         # Move to cloud storage
         file_name = str(uuid.uuid1())
         url = cloud_storage.post_file(
@@ -166,7 +237,51 @@ class BulkImport(object):
         logger.info(f"Bulk upload {r['jobId']} created.")
         return r["jobId"]
 
-    def bulk_apply_activist_codes(self, tbl, url_type, **url_kwargs):
+    def _post_bulk_import_chunks(
+        self,
+        tbl,
+        url_type,
+        resource_type,
+        mapping_types,
+        description,
+        result_fields,
+        max_rows_per_job,
+        **url_kwargs,
+    ):
+        # Split a bulk import into a job for every max_rows_per_job rows, uploading and
+        # submitting the chunks concurrently. Returns the job ids in the order of the chunks.
+
+        futures = []
+        with ThreadPoolExecutor(max_workers=BULK_IMPORT_WORKERS) as executor:
+            pending = set()
+
+            # Chunks are read from the table in a single pass; only as many as are being
+            # uploaded are held in memory at once.
+            for i, chunk in enumerate(tbl.iter_chunks(max_rows_per_job)):
+                future = executor.submit(
+                    self.post_bulk_import,
+                    chunk,
+                    url_type,
+                    resource_type,
+                    mapping_types,
+                    f"{description} ({i + 1})",
+                    result_fields=result_fields,
+                    **url_kwargs,
+                )
+                futures.append(future)
+                pending.add(future)
+
+                if len(pending) >= BULK_IMPORT_WORKERS:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+
+        job_ids = [future.result() for future in futures]
+        logger.info(f"Created {len(job_ids)} bulk import jobs.")
+
+        return job_ids
+
+    def bulk_apply_activist_codes(self, tbl, url_type, max_rows_per_job=None, **url_kwargs):
         """
         Bulk apply activist codes.
 
@@ -202,12 +317,17 @@ class BulkImport(object):
             url_type: str
                 The cloud file storage to use to post the file (``S3`` or ``GCS``).
                 See :ref:`Cloud Storage <cloud-storage>` for more details.
+            max_rows_per_job: int
+                Optional number of rows to submit in each job. Larger tables are split into
+                several jobs, which are uploaded and submitted concurrently; pass their ids to
+                :meth:`get_bulk_import_jobs_results` to wait for and combine their results.
             **url_kwargs: kwargs
                 Arguments to configure your cloud storage url type. See
                 :ref:`Cloud Storage <cloud-storage>` for more details.
         `Returns:`
             int
-                The bulk import job id
+                The bulk import job id, or a list of the job ids if ``max_rows_per_job``
+                is set
         """
 
         return self.post_bulk_import(
@@ -216,10 +336,13 @@ class BulkImport(object):
             "ContactsActivistCodes",
             [{"name": "ActivistCode"}],
             "Activist Code Upload",
+            max_rows_per_job=max_rows_per_job,
             **url_kwargs,
         )
 
-    def bulk_upsert_contacts(self, tbl, url_type, result_fields=None, **url_kwargs):
+    def bulk_upsert_contacts(
+        self, tbl, url_type, result_fields=None, max_rows_per_job=None, **url_kwargs
+    ):
         """
         Bulk create or update contact records. Provide a Parsons table of contact data to
         create or update records.
@@ -326,12 +449,17 @@ class BulkImport(object):
               The cloud file storage to use to post the file. Currently only ``S3``.
             results_fields: list
               A list of fields to include in the results file.
+            max_rows_per_job: int
+                Optional number of rows to submit in each job. Larger tables are split into
+                several jobs, which are uploaded and submitted concurrently; pass their ids to
+                :meth:`get_bulk_import_jobs_results` to wait for and combine their results.
             **url_kwargs: kwargs
                 Arguments to configure your cloud storage url type. See
                 :ref:`Cloud Storage <cloud-storage>` for more details.
         `Returns:`
             int
-                The bulk import job id
+                The bulk import job id, or a list of the job ids if ``max_rows_per_job``
+                is set
         """
 
         tbl = tbl.map_columns(CONTACTS_COLUMN_MAP, exact_match=False)
@@ -343,10 +471,11 @@ class BulkImport(object):
             [{"name": "CreateOrUpdateContact"}],
             "Create Or Update Contact Records",
             result_fields=result_fields,
+            max_rows_per_job=max_rows_per_job,
             **url_kwargs,
         )
 
-    def bulk_apply_suppressions(self, tbl, url_type, **url_kwargs):
+    def bulk_apply_suppressions(self, tbl, url_type, max_rows_per_job=None, **url_kwargs):
         """
         Bulk apply contact suppression codes.
 
@@ -373,12 +502,17 @@ class BulkImport(object):
             url_type: str
                 The cloud file storage to use to post the file (``S3`` or ``GCS``).
                 See :ref:`Cloud Storage <cloud-storage>` for more details.
+            max_rows_per_job: int
+                Optional number of rows to submit in each job. Larger tables are split into
+                several jobs, which are uploaded and submitted concurrently; pass their ids to
+                :meth:`get_bulk_import_jobs_results` to wait for and combine their results.
             **url_kwargs: kwargs
                 Arguments to configure your cloud storage url type. See
                 :ref:`Cloud Storage <cloud-storage>` for more details.
         `Returns:`
             int
-                The bulk import job id
+                The bulk import job id, or a list of the job ids if ``max_rows_per_job``
+                is set
         """
 
         return self.post_bulk_import(
@@ -387,10 +521,11 @@ class BulkImport(object):
             "Contacts",
             [{"name": "Suppressions"}],
             "Apply Suppressions",
+            max_rows_per_job=max_rows_per_job,
             **url_kwargs,
         )
 
-    def bulk_apply_canvass_results(self, tbl, url_type, **url_kwargs):
+    def bulk_apply_canvass_results(self, tbl, url_type, max_rows_per_job=None, **url_kwargs):
         """
         Bulk apply contact canvass results.
 
@@ -441,12 +576,17 @@ class BulkImport(object):
             url_type: str
                 The cloud file storage to use to post the file (``S3`` or ``GCS``).
                 See :ref:`Cloud Storage <cloud-storage>` for more details.
+            max_rows_per_job: int
+                Optional number of rows to submit in each job. Larger tables are split into
+                several jobs, which are uploaded and submitted concurrently; pass their ids to
+                :meth:`get_bulk_import_jobs_results` to wait for and combine their results.
             **url_kwargs: kwargs
                 Arguments to configure your cloud storage url type. See
                 :ref:`Cloud Storage <cloud-storage>` for more details.
         `Returns:`
             int
-                The bulk import job id
+                The bulk import job id, or a list of the job ids if ``max_rows_per_job``
+                is set
         """
 
         return self.post_bulk_import(
@@ -455,10 +595,13 @@ class BulkImport(object):
             "Contacts",
             [{"name": "CanvassResults"}],
             "Apply Canvass Results",
+            max_rows_per_job=max_rows_per_job,
             **url_kwargs,
         )
 
-    def bulk_apply_contact_custom_fields(self, custom_field_group_id, tbl, url_type, **url_kwargs):
+    def bulk_apply_contact_custom_fields(
+        self, custom_field_group_id, tbl, url_type, max_rows_per_job=None, **url_kwargs
+    ):
         """
         Bulk apply contact custom fields.
 
@@ -490,12 +633,17 @@ class BulkImport(object):
             url_type: str
                 The cloud file storage to use to post the file (``S3`` or ``GCS``).
                 See :ref:`Cloud Storage <cloud-storage>` for more details.
+            max_rows_per_job: int
+                Optional number of rows to submit in each job. Larger tables are split into
+                several jobs, which are uploaded and submitted concurrently; pass their ids to
+                :meth:`get_bulk_import_jobs_results` to wait for and combine their results.
             **url_kwargs: kwargs
                 Arguments to configure your cloud storage url type. See
                 :ref:`Cloud Storage <cloud-storage>` for more details.
         `Returns:`
             int
-                The bulk import job id
+                The bulk import job id, or a list of the job ids if ``max_rows_per_job``
+                is set
         """
 
         mapping_types = [
@@ -516,6 +664,7 @@ class BulkImport(object):
             "Contacts",
             mapping_types,
             "Apply Contact Custom Fields",
+            max_rows_per_job=max_rows_per_job,
             **url_kwargs,
         )
 
@@ -1,13 +1,36 @@
 """NGPVAN Changed Entities"""
 
+import datetime
 import logging
+import operator
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+import petl
+import requests
 
 from parsons.etl.table import Table
+from parsons.utilities import files
 
 logger = logging.getLogger(__name__)
 
+# The initial number of seconds between checks of an export job's status. The wait doubles
+# after each check, up to MAX_RETRY_RATE.
 RETRY_RATE = 10
+MAX_RETRY_RATE = 120
+
+# The number of export jobs to create, check or download at once
+CHANGED_ENTITY_WORKERS = 4
+
+# Export job statuses for jobs that haven't finished
+PENDING_JOB_STATUSES = ("Pending", "InProcess")
+
+# The number of seconds to wait to connect to the file host, and between bytes of a download
+DOWNLOAD_TIMEOUT = 60
+
+# Columns holding when a record changed, in order of preference. Exports start with the
+# record's id column.
+CHANGE_TIME_FIELDS = ("DateChanged", "DateModified", "DateCreated")
 
 
 class ChangedEntities(object):
@@ -49,10 +72,15 @@ class ChangedEntities(object):
         include_inactive=False,
         requested_fields=None,
         custom_fields=None,
+        window_days=None,
     ):
         """
         Get modified records for VAN from up to 90 days in the past.
 
+        A long date range can be split into windows of ``window_days`` days, each exported by
+        its own job. The jobs are created and run at once, and their files are downloaded in
+        parallel, which is usually much faster than a single export of the full range.
+
         `Args:`
             resource_type: str
                 The type of resource to export. Use the :py:meth:`~parsons.ngpvan.changed_entities.ChangedEntities.get_changed_entity_resources`
@@ -71,34 +99,139 @@ class ChangedEntities(object):
                 method.
             custom_fields: list
                 A list of ids of custom fields to include in the export.
+            window_days: int
+                Optional number of days in each export job. Defaults to a single job for the
+                full date range.
 
         `Returns:`
             Parsons Table
                 See :ref:`parsons-table` for output options.
         """
 
-        json = {
-            "dateChangedFrom": date_from,
-            "dateChangedTo": date_to,
-            "resourceType": resource_type,
-            "requestedFields": requested_fields,
-            "requestedCustomFieldIds": custom_fields,
-            "fileSizeKbLimit": 100000,
-            "includeInactive": include_inactive,
-        }
+        windows = _date_windows(date_from, date_to, window_days)
+
+        def create_job(window):
+            json = {
+                "dateChangedFrom": window[0],
+                "dateChangedTo": window[1],
+                "resourceType": resource_type,
+                "requestedFields": requested_fields,
+                "requestedCustomFieldIds": custom_fields,
+                "fileSizeKbLimit": 100000,
+                "includeInactive": include_inactive,
+            }
+            return self.connection.post_request("changedEntityExportJobs", json=json)
+
+        with ThreadPoolExecutor(max_workers=CHANGED_ENTITY_WORKERS) as executor:
+            job_ids = [r["exportJobId"] for r in executor.map(create_job, windows)]
+            if len(job_ids) > 1:
+                logger.info(f"Created {len(job_ids)} changed entity export jobs.")
+
+            jobs = self._wait_for_changed_entity_jobs(job_ids, executor)
+
+            # Download every file of every job, keeping the order of the windows
+            urls = [[f["downloadUrl"] for f in jobs[job_id]["files"]] for job_id in job_ids]
+            paths = [list(executor.map(_download_file, window_urls)) for window_urls in urls]
 
-        r = self.connection.post_request("changedEntityExportJobs", json=json)
+        window_tbls = []
+        for window_paths in paths:
+            tbls = [Table.from_csv(path) for path in window_paths if files.has_data(path)]
+            if tbls:
+                tbls[0].concat(*tbls[1:])
+                window_tbls.append(tbls[0])
+
+        if not window_tbls:
+            return Table()
+
+        tbl = window_tbls[0]
+        tbl.concat(*_drop_boundary_duplicates(window_tbls[1:], window_tbls[:-1]))
+
+        return tbl
+
+    def _wait_for_changed_entity_jobs(self, job_ids, executor):
+        # Check the unfinished jobs at once, backing off between checks, until every job is
+        # complete. Returns the final status of each job by id.
+
+        jobs = {}
+        retry_rate = RETRY_RATE
 
         while True:
-            status = self._get_changed_entity_job(r["exportJobId"])
-            if status["jobStatus"] in ["Pending", "InProcess"]:
-                logger.info("Waiting on export file.")
-                time.sleep(RETRY_RATE)
-            elif status["jobStatus"] == "Complete":
-                return Table.from_csv(status["files"][0]["downloadUrl"])
-            else:
-                raise ValueError(status["message"])
+            pending = [job_id for job_id in job_ids if job_id not in jobs]
+            for job_id, status in zip(pending, executor.map(self._get_changed_entity_job, pending)):
+                if status["jobStatus"] == "Complete":
+                    jobs[job_id] = status
+                elif status["jobStatus"] not in PENDING_JOB_STATUSES:
+                    raise ValueError(status["message"])
+
+            if len(jobs) == len(job_ids):
+                return jobs
+
+            logger.info(f"Waiting on {len(job_ids) - len(jobs)} export files.")
+            time.sleep(retry_rate)
+            retry_rate = min(retry_rate * 2, MAX_RETRY_RATE)
 
     def _get_changed_entity_job(self, job_id):
         r = self.connection.get_request(f"changedEntityExportJobs/{job_id}")
         return r
+
+
+def _date_windows(date_from, date_to, window_days):
+    # Split a date range into consecutive (from, to) windows of window_days days. The first
+    # and last windows keep the original bounds, so a time of day or an open end is kept.
+    # Each window's end is the next window's start.
+
+    if not window_days:
+        return [(date_from, date_to)]
+
+    start = datetime.date.fromisoformat(date_from[:10])
+    end = datetime.date.fromisoformat(date_to[:10]) if date_to else datetime.date.today()
+
+    bounds = [date_from]
+    day = start + datetime.timedelta(days=window_days)
+    while day < end:
+        bounds.append(day.isoformat())
+        day += datetime.timedelta(days=window_days)
+    bounds.append(date_to)
+
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _change_key(columns):
+    # The indexes of the columns identifying a change: the record's id and the time it
+    # changed, or every column if the export has no change time
+    for field in CHANGE_TIME_FIELDS:
+        if field in columns:
+            return operator.itemgetter(0, columns.index(field))
+
+    return tuple
+
+
+def _drop_boundary_duplicates(window_tbls, previous_tbls):
+    # Adjacent windows share a boundary date, and both include it, so a record changed on
+    # that date is exported by both. Drop the rows of each window whose record id and change
+    # time were exported by the previous window; rows within a window are all kept.
+
+    tbls = []
+    for tbl, previous in zip(window_tbls, previous_tbls):
+        previous_key = _change_key(previous.columns)
+        exported = {previous_key(row) for row in previous.data}
+
+        def new(row, key=_change_key(tbl.columns), exported=exported):
+            return key(row) not in exported
+
+        tbls.append(Table(petl.select(tbl.table, new)))
+
+    return tbls
+
+
+def _download_file(url):
+    # Stream an export file to a temp file, so that it is only downloaded once
+    path = files.create_temp_file(suffix=".csv")
+
+    with requests.get(url, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+        response.raise_for_status()
+        with open(path, "wb") as f:
+            for chunk in response.iter_content(chunk_size=8192):
+                f.write(chunk)
+
+    return path
@@ -60,12 +60,18 @@ class VAN(
             Base uri to make api calls.
         raise_for_status: boolean
             Raise excection when encountering a 4XX or 500 error.
+        cache: ResponseCache
+            Optional :class:`~parsons.utilities.response_cache.ResponseCache` of ``GET``
+            responses, for reference data such as activist codes and custom fields that
+            rarely changes.
     `Returns:`
         VAN object
     """
 
-    def __init__(self, api_key=None, auth_name="default", db=None, raise_for_status=True):
-        self.connection = VANConnector(api_key=api_key, db=db)
+    def __init__(
+        self, api_key=None, auth_name="default", db=None, raise_for_status=True, cache=None
+    ):
+        self.connection = VANConnector(api_key=api_key, db=db, cache=cache)
         self.api_key = api_key
         self.db = db
 
@@ -2,6 +2,7 @@ import logging
 
 from suds.client import Client
 
+from parsons import Table
 from parsons.utilities import check_env
 from parsons.utilities.api_connector import APIConnector
 
@@ -12,7 +13,7 @@ SOAP_URI = "https://api.securevan.com/Services/V3/ListService.asmx?WSDL"
 
 
 class VANConnector(object):
-    def __init__(self, api_key=None, auth_name="default", db=None):
+    def __init__(self, api_key=None, auth_name="default", db=None, cache=None):
         self.api_key = check_env.check("VAN_API_KEY", api_key)
 
         if db == "MyVoters":
@@ -35,6 +36,7 @@ class VANConnector(object):
             auth=self.auth,
             data_key="items",
             pagination_key=self.pagination_key,
+            cache=cache,
         )
 
         # We will not create the SOAP client unless we need to as this triggers checking for
@@ -76,9 +78,14 @@ class VANConnector(object):
         else:
             return self.db
 
-    def get_request(self, endpoint, **kwargs):
+    def get_pages(self, endpoint, **kwargs):
+        """
+        Request the pages of a paginated endpoint, yielding the items of each page as it
+        arrives.
+        """
+
         r = self.api.get_request(self.uri + endpoint, **kwargs)
-        data = self.api.data_parse(r)
+        yield self.api.data_parse(r)
 
         # Paginate
         while isinstance(r, dict) and self.api.next_page_check_url(r):
@@ -87,9 +94,23 @@ class VANConnector(object):
             if endpoint == "printedLists" and not r["items"]:
                 break
             r = self.api.get_request(r[self.pagination_key], **kwargs)
-            data.extend(self.api.data_parse(r))
+            yield self.api.data_parse(r)
+
+    def get_request(self, endpoint, **kwargs):
+        pages = self.get_pages(endpoint, **kwargs)
+        data = next(pages)
+        for page in pages:
+            data.extend(page)
         return data
 
+    def get_table(self, endpoint, **kwargs):
+        """
+        Return a Table that streams the items of a paginated endpoint, requesting each page
+        only as its rows are read.
+        """
+
+        return Table.from_pages(self.get_pages(endpoint, **kwargs))
+
     def post_request(self, endpoint, **kwargs):
         return self.api.post_request(endpoint, **kwargs)
 
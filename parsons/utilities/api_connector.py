@@ -1,14 +1,81 @@
+import concurrent.futures
+import hashlib
 import logging
+import threading
 import urllib.parse
 
-from requests import request as _request
+import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError
 from simplejson.errors import JSONDecodeError
+from urllib3.util.retry import Retry
 
 from parsons import Table
+from parsons.utilities.rate_limiter import shared_limiter
+from parsons.utilities.response_cache import mount_cache
 
 logger = logging.getLogger(__name__)
 
+_session_lock = threading.Lock()
+
+
+def mount_pool(session, connector):
+    """
+    Mount a pooled, retrying transport adapter on a requests session, configured from the
+    pool and retry attributes of an ``APIConnector``.
+
+    `Args:`
+        session: requests.Session
+            The session to configure
+        connector: APIConnector
+            The connector whose settings to use
+    `Returns:`
+        The session
+    """
+
+    retry = Retry(
+        total=connector.max_retries,
+        connect=connector.max_retries,
+        read=connector.max_retries,
+        status=connector.max_retries,
+        status_forcelist=connector.retry_status_codes,
+        backoff_factor=connector.backoff_factor,
+        respect_retry_after_header=True,
+        # Return the final response so that validate_response can raise a useful error
+        raise_on_status=False,
+    )
+    adapter_args = dict(
+        pool_connections=connector.pool_connections,
+        pool_maxsize=connector.pool_maxsize,
+        pool_block=connector.pool_block,
+        max_retries=retry,
+    )
+    if connector.cache is not None:
+        mount_cache(session, connector.cache, **adapter_args)
+    else:
+        adapter = HTTPAdapter(**adapter_args)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+    return session
+
+
+def _credentials_key(auth, headers):
+    # A digest of the credentials a connector sends, so that connectors with equal credentials
+    # share a rate limit without the credentials being kept as a key
+    if hasattr(auth, "username") and hasattr(auth, "password"):
+        # Auth objects like HTTPBasicAuth, whose repr includes the object's address
+        auth = (type(auth).__qualname__, auth.username, auth.password)
+    elif isinstance(auth, requests.auth.AuthBase):
+        attributes = vars(auth).items()
+        auth = (
+            type(auth).__qualname__,
+            sorted((k, v) for k, v in attributes if isinstance(v, str)),
+        )
+
+    credentials = repr((auth, sorted((headers or {}).items())))
+    return hashlib.sha256(credentials.encode("utf-8")).hexdigest()
+
 
 class APIConnector(object):
     """
@@ -31,11 +98,62 @@ class APIConnector(object):
         data_key: str
             The name of the key in the response json where the data is contained. Required
             if the data is nested in the response json
+        cache: ResponseCache
+            Optional cache of ``GET`` responses
+
+    Requests are sent through a session with a pool of keep-alive connections, so repeated
+    calls (eg. paginating) reuse connections rather than opening a new one each time. Failed
+    connections and ``429``/``5xx`` responses are retried with exponential backoff, honoring the
+    ``Retry-After`` header; ``POST`` and ``PATCH`` requests are not retried on a response status.
+    The pool and retry behavior are set by class attributes, which subclasses or instances may
+    override before the first request:
+
+    * ``pool_connections``: the number of hosts to keep connection pools for
+    * ``pool_maxsize``: the maximum number of connections kept open to each host
+    * ``pool_block``: whether to wait for a free connection when a host's pool is exhausted
+    * ``max_retries``: the maximum number of retries for each request
+    * ``backoff_factor``: the base of the exponential backoff between retries, in seconds
+    * ``retry_status_codes``: the response statuses to retry
+
+    Requests can also be paced by a client-side rate limit, which is shared by every connector
+    of the same class with the same ``uri`` and credentials, in any thread, so that jobs sharing
+    an API key don't exceed its limit together:
+
+    * ``rate_limit``: the number of requests allowed per second, or ``None`` for no limit
+    * ``rate_limit_burst``: the number of requests allowed at once
+    * ``rate_limit_adaptive``: also slow down to fit the ``X-RateLimit-Remaining`` and
+      ``X-RateLimit-Reset`` headers of each response
+    * ``rate_limit_key``: the credentials the rate limit is counted against, for APIs that
+      aren't authenticated with ``auth`` or ``headers``
+
+    The maximum number of pages that :meth:`get_pages` requests at once is set by
+    ``page_workers``.
+
+    ``GET`` responses can be cached by passing a
+    :class:`~parsons.utilities.response_cache.ResponseCache` as ``cache``, which skips the
+    request while a response is fresh and revalidates it with its ``ETag`` or
+    ``Last-Modified`` header once it expires.
+
     `Returns`:
         APIConnector class
     """
 
-    def __init__(self, uri, headers=None, auth=None, pagination_key=None, data_key=None):
+    pool_connections = 10
+    pool_maxsize = 10
+    pool_block = False
+    max_retries = 3
+    backoff_factor = 0.5
+    retry_status_codes = (429, 500, 502, 503, 504)
+    rate_limit = None
+    rate_limit_burst = 1
+    rate_limit_adaptive = False
+    rate_limit_key = None
+    page_workers = 4
+    cache = None
+
+    def __init__(
+        self, uri, headers=None, auth=None, pagination_key=None, data_key=None, cache=None
+    ):
         # Add a trailing slash if its missing
         if not uri.endswith("/"):
             uri = uri + "/"
@@ -46,6 +164,9 @@ class APIConnector(object):
         self.pagination_key = pagination_key
         self.data_key = data_key
 
+        if cache is not None:
+            self.cache = cache
+
     def request(self, url, req_type, json=None, data=None, params=None):
         """
         Base request using requests libary.
@@ -74,7 +195,11 @@ class APIConnector(object):
         """
         full_url = urllib.parse.urljoin(self.uri, url)
 
-        return _request(
+        rate_limiter = self.rate_limiter
+        if rate_limiter:
+            rate_limiter.acquire()
+
+        response = self.session.request(
             req_type,
             full_url,
             headers=self.headers,
@@ -84,6 +209,44 @@ class APIConnector(object):
             params=params,
         )
 
+        if rate_limiter and self.rate_limit_adaptive:
+            rate_limiter.update(response.headers)
+
+        return response
+
+    @property
+    def rate_limiter(self):
+        """
+        The :class:`~parsons.utilities.rate_limiter.TokenBucket` that paces this connector's
+        requests, shared with every connector with the same rate limit key, or ``None`` if
+        requests aren't rate limited.
+        """
+
+        if self.rate_limit is None and not self.rate_limit_adaptive:
+            return None
+
+        return shared_limiter(self._rate_limit_key(), self.rate_limit, burst=self.rate_limit_burst)
+
+    def _rate_limit_key(self):
+        credentials = self.rate_limit_key
+        if credentials is None:
+            credentials = _credentials_key(self.auth, self.headers)
+
+        return (type(self).__qualname__, self.uri, credentials)
+
+    @property
+    def session(self):
+        """
+        The pooled ``requests.Session`` used to send requests. It is created on first use.
+        """
+
+        if "_session" not in self.__dict__:
+            with _session_lock:
+                if "_session" not in self.__dict__:
+                    self._session = mount_pool(requests.Session(), self)
+
+        return self._session
+
     def get_request(self, url, params=None, return_format="json"):
         """
         Make a GET request.
@@ -299,6 +462,57 @@ class APIConnector(object):
         else:
             return False
 
+    def get_pages(self, get_page, page_count, first_page=1, max_workers=None, rate_limiter=None):
+        """
+        Fetch every page of a page-numbered result, for APIs that report the number of pages
+        in their first response.
+
+        The first page is requested on its own to learn the number of pages, and the remaining
+        pages are then requested concurrently by a bounded pool of workers.
+
+        `Args:`
+            get_page: callable
+                A function that takes a page number and returns that page's response
+            page_count: callable
+                A function that takes the first page's response and returns the total number
+                of pages to fetch, counting the first. ``None`` fetches only the first page.
+            first_page: int
+                The number of the first page. Defaults to ``1``.
+            max_workers: int
+                The maximum number of pages to request at once. Defaults to ``page_workers``.
+            rate_limiter: TokenBucket
+                Optional rate limiter that each page request waits on, in addition to the
+                connector's ``rate_limit``
+        `Returns:`
+            list
+                The responses, in page order
+        """
+
+        max_workers = max_workers or self.page_workers
+
+        def fetch(page):
+            if rate_limiter:
+                rate_limiter.acquire()
+            return get_page(page)
+
+        first = fetch(first_page)
+        pages = range(first_page + 1, first_page + (page_count(first) or 1))
+        logger.debug(f"Fetching {len(pages) + 1} pages with {max_workers} workers.")
+
+        if not pages:
+            return [first]
+
+        if max_workers == 1:
+            return [first] + [fetch(page) for page in pages]
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(pages)))
+        try:
+            # map returns the results in the order of the pages, whatever order they finish in
+            return [first] + list(executor.map(fetch, pages))
+        finally:
+            # Don't request the rest of the pages if one of them failed
+            executor.shutdown(cancel_futures=True)
+
     def json_check(self, resp):
         """
         Check to see if a response has a json included in it.
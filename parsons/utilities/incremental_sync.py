@@ -0,0 +1,301 @@
+import datetime
+import json
+import logging
+import os
+import sqlite3
+import threading
+
+from parsons.etl.table import Table
+
+logger = logging.getLogger(__name__)
+
+
+def _dumps(cursor):
+    # Cursors are usually dates, ids or page tokens; anything else is stored as a string
+    return json.dumps(cursor, default=str)
+
+
+class JSONStateStore(object):
+    """
+    A state store for :class:`IncrementalSync` that keeps cursors in a local json file.
+
+    `Args:`
+        path: str
+            The path of the json file. It is created on the first update.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _read(self):
+        if not os.path.exists(self.path):
+            return {}
+
+        with open(self.path) as f:
+            return json.load(f)
+
+    def get(self, key):
+        with self._lock:
+            return self._read().get(key)
+
+    def set(self, key, cursor):
+        with self._lock:
+            state = self._read()
+            state[key] = json.loads(_dumps(cursor))
+
+            # Replace the file in one step, so an interrupted write doesn't lose every cursor
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "w") as f:
+                json.dump(state, f, indent=2)
+            os.replace(temp_path, self.path)
+
+
+class SQLiteStateStore(object):
+    """
+    A state store for :class:`IncrementalSync` that keeps cursors in a local sqlite database.
+
+    `Args:`
+        path: str
+            The path of the database file
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS sync_state (key TEXT PRIMARY KEY, cursor_value TEXT)"
+        )
+        self._db.commit()
+
+    def get(self, key):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT cursor_value FROM sync_state WHERE key = ?", (key,)
+            ).fetchone()
+
+        return json.loads(row[0]) if row else None
+
+    def set(self, key, cursor):
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO sync_state VALUES (?, ?)", (key, _dumps(cursor))
+            )
+            self._db.commit()
+
+    def close(self):
+        self._db.close()
+
+
+class DatabaseStateStore(object):
+    """
+    A state store for :class:`IncrementalSync` that keeps cursors in a table of any Parsons
+    database connector, eg. ``Redshift`` or ``Postgres``. Each update appends a row, so the
+    table is also a log of every sync. The columns are ``sync_key``, ``cursor_value`` (as
+    json) and ``updated_at``.
+
+    `Args:`
+        db: Database connector
+            The database to use
+        table_name: str
+            The state table, created on the first update. Defaults to ``parsons_sync_state``.
+    """
+
+    def __init__(self, db, table_name="parsons_sync_state"):
+        self.db = db
+        self.table_name = table_name
+
+    def get(self, key):
+        if not self.db.table_exists(self.table_name):
+            return None
+
+        # The timestamps are ISO 8601 strings in UTC, so they sort in time order
+        tbl = self.db.query(
+            f"SELECT cursor_value FROM {self.table_name} WHERE sync_key = %s "
+            "ORDER BY updated_at DESC LIMIT 1",
+            [key],
+        )
+        if tbl is None or tbl.num_rows == 0:
+            return None
+
+        return json.loads(tbl.first)
+
+    def set(self, key, cursor):
+        row = {
+            "sync_key": key,
+            "cursor_value": _dumps(cursor),
+            "updated_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        }
+        self.db.copy(Table([row]), self.table_name, if_exists="append")
+
+
+class IncrementalSync(object):
+    """
+    Fetch only the records that changed since the last run, by keeping a cursor for each
+    resource, eg. the latest ``modified_date`` seen, in a state store.
+
+    Each :meth:`pull` passes the stored cursor to a fetch function and remembers the new one.
+    New cursors are only saved by :meth:`commit`, so that if loading the records fails they
+    are fetched again on the next run. Used as a context manager, the cursors are committed
+    when the block finishes without an error.
+
+    .. code-block:: python
+
+        from parsons.utilities.incremental_sync import (
+            IncrementalSync, SQLiteStateStore, action_network_fetch
+        )
+
+        sync = IncrementalSync(SQLiteStateStore("sync_state.sqlite"))
+
+        with sync:
+            people = sync.pull("an_people", action_network_fetch(an.get_people), "modified_date")
+            rs.copy(people, "actionnetwork.people", if_exists="append")
+
+    `Args:`
+        store: JSONStateStore, SQLiteStateStore or DatabaseStateStore
+            Where to keep the cursors
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self._pending = {}
+
+    def cursor(self, key):
+        """
+        Return the cursor of a resource, including one not yet committed.
+        """
+
+        if key in self._pending:
+            return self._pending[key]
+
+        return self.store.get(key)
+
+    def pull(self, key, fetch, cursor_field=None, start=None):
+        """
+        Fetch the records of a resource that changed since its cursor.
+
+        `Args:`
+            key: str
+                Identifies the resource in the state store
+            fetch: function
+                Called with the cursor, or ``None`` the first time, and returns a Parsons
+                Table. To use a cursor that isn't a column, such as a next page token, it can
+                instead return a ``(table, cursor)`` tuple.
+            cursor_field: str
+                The column whose largest value is the new cursor. Not needed when ``fetch``
+                returns the cursor.
+            start: str
+                Optional cursor to use the first time, eg. a date to start from
+        `Returns:`
+            Parsons Table
+                See :ref:`parsons-table` for output options.
+        """
+
+        cursor = self.cursor(key)
+        if cursor is None:
+            cursor = start
+
+        result = fetch(cursor)
+        if isinstance(result, tuple):
+            tbl, new_cursor = result
+        else:
+            tbl = result
+            values = [v for v in tbl[cursor_field] if v is not None] if tbl.num_rows else []
+            new_cursor = max(values) if values else None
+
+        logger.info(f"Fetched {tbl.num_rows} rows for {key} since {cursor}.")
+
+        if new_cursor is not None and new_cursor != cursor:
+            self._pending[key] = new_cursor
+
+        return tbl
+
+    def commit(self):
+        """
+        Save the cursors of every pull since the last commit.
+        """
+
+        for key, cursor in self._pending.items():
+            self.store.set(key, cursor)
+            logger.debug(f"Saved cursor {cursor} for {key}.")
+
+        self._pending = {}
+
+    def rollback(self):
+        """
+        Discard the cursors of every pull since the last commit.
+        """
+
+        self._pending = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+
+def action_network_fetch(method, field="modified_date", **kwargs):
+    """
+    Return a fetch function for :meth:`IncrementalSync.pull` from an ``ActionNetwork``
+    method that accepts a ``filter``, eg. ``ActionNetwork.get_people``.
+
+    `Args:`
+        method: function
+            The connector method
+        field: str
+            The date field to filter on. Defaults to ``modified_date``.
+        **kwargs:
+            Other arguments to pass to the method
+    """
+
+    def fetch(cursor):
+        return method(filter=f"{field} gt '{cursor}'" if cursor else None, **kwargs)
+
+    return fetch
+
+
+def mobilize_fetch(method, **kwargs):
+    """
+    Return a fetch function for :meth:`IncrementalSync.pull` from a ``MobilizeAmerica``
+    method that accepts ``updated_since``, eg. ``MobilizeAmerica.get_events``. Use
+    ``modified_date`` as the cursor field.
+
+    `Args:`
+        method: function
+            The connector method
+        **kwargs:
+            Other arguments to pass to the method
+    """
+
+    def fetch(cursor):
+        return method(updated_since=cursor, **kwargs)
+
+    return fetch
+
+
+def action_kit_fetch(action_kit, object_type, field="updated_at", **kwargs):
+    """
+    Return a fetch function for :meth:`IncrementalSync.pull` of an ActionKit object type,
+    eg. ``order``, using ``ActionKit.paginated_get``.
+
+    `Args:`
+        action_kit: ActionKit
+            The connector
+        object_type: str
+            The type of object to fetch
+        field: str
+            The date field to filter and order on. Defaults to ``updated_at``.
+        **kwargs:
+            Other arguments to pass to ``paginated_get``
+    """
+
+    def fetch(cursor):
+        filters = {f"{field}__gt": cursor} if cursor else {}
+        return action_kit.paginated_get(object_type, order_by=field, **filters, **kwargs)
+
+    return fetch
@@ -4,7 +4,7 @@ from typing import Dict, Optional
 from oauthlib.oauth2 import BackendApplicationClient
 from requests_oauthlib import OAuth2Session
 
-from parsons.utilities.api_connector import APIConnector
+from parsons.utilities.api_connector import APIConnector, mount_pool
 
 
 class OAuth2APIConnector(APIConnector):
@@ -32,6 +32,9 @@ class OAuth2APIConnector(APIConnector):
         data_key: str
             The name of the key in the response json where the data is contained. Required
             if the data is nested in the response json
+
+    Requests share the connection pool and retry behavior of ``APIConnector``.
+
     `Returns`:
         OAuthAPIConnector class
     """
@@ -75,6 +78,15 @@ class OAuth2APIConnector(APIConnector):
             token_updater=self.token_saver,
             auto_refresh_kwargs=authorization_kwargs,
         )
+        mount_pool(self.client, self)
+
+    @property
+    def session(self):
+        """
+        The pooled OAuth2 session used to send requests.
+        """
+
+        return self.client
 
     def request(self, url, req_type, json=None, data=None, params=None):
         """
@@ -99,7 +111,7 @@ class OAuth2APIConnector(APIConnector):
             requests response
         """
         full_url = urllib.parse.urljoin(self.uri, url)
-        return self.client.request(
+        return self.session.request(
             req_type,
             full_url,
             headers=self.headers,
@@ -0,0 +1,173 @@
+import email.utils
+import threading
+import time
+
+# Rate limiters shared by key, so that every connector using the same credentials is paced
+# together
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+# X-RateLimit-Reset values above this are epoch timestamps rather than a number of seconds
+_EPOCH_THRESHOLD = 10**9
+
+
+class TokenBucket(object):
+    """
+    A thread-safe token bucket rate limiter.
+
+    Tokens are added at ``rate`` per second, up to ``burst`` tokens. Each call to
+    :meth:`acquire` takes a token, waiting until one is available, so at most ``burst``
+    requests are made at once and ``rate`` requests per second are made on average. Tokens are
+    reserved in the order they are requested, so each caller sleeps exactly as long as it needs
+    to and no longer.
+
+    The rate can also be tuned from the rate limit headers that many APIs send, by passing
+    each response's headers to :meth:`update`.
+
+    `Args:`
+        rate: float
+            The number of tokens added per second. ``None`` doesn't limit the rate until it is
+            tuned by :meth:`update`.
+        burst: int
+            The maximum number of tokens held at once. Defaults to ``1``.
+    """
+
+    def __init__(self, rate, burst=1):
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.rate = rate
+        self.burst = burst
+
+        # The rate allowed by the most recent rate limit headers
+        self.header_rate = None
+
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def current_rate(self):
+        """
+        The rate currently in effect: the lower of ``rate`` and the rate allowed by the most
+        recent rate limit headers, or ``None`` if neither is set.
+        """
+
+        rates = [r for r in (self.rate, self.header_rate) if r is not None]
+
+        return min(rates) if rates else None
+
+    def _refill(self, now, rate):
+        if rate is not None:
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * rate)
+        self._updated = now
+
+    def acquire(self):
+        """
+        Take a token, waiting until one is available.
+
+        `Returns:`
+            float
+                The number of seconds spent waiting
+        """
+
+        with self._lock:
+            rate = self.current_rate
+            if rate is None:
+                return 0.0
+
+            self._refill(time.monotonic(), rate)
+            self._tokens -= 1
+
+            # A negative balance is the time until this caller's reserved token is added
+            wait = -self._tokens / rate if self._tokens < 0 else 0.0
+
+        if wait:
+            time.sleep(wait)
+
+        return wait
+
+    def update(self, headers):
+        """
+        Tune the rate from a response's ``X-RateLimit-Remaining`` and ``X-RateLimit-Reset``
+        headers, spreading the remaining requests over the time until the limit resets. When
+        no requests remain, callers wait until the reset.
+
+        `Args:`
+            headers: dict
+                The response headers. Lookups are expected to be case insensitive, as with
+                ``requests`` responses.
+        """
+
+        remaining = _header_number(headers, "X-RateLimit-Remaining")
+        reset = _reset_seconds(headers)
+
+        if remaining is None or reset is None:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now, self.current_rate)
+
+            if remaining < 1:
+                # Hold every caller until the limit resets
+                self.header_rate = 1 / max(reset, 0.001)
+                self._tokens = min(self._tokens, 0)
+            else:
+                self.header_rate = remaining / max(reset, 0.001)
+                self._tokens = min(self._tokens, remaining)
+
+
+def _header_number(headers, name):
+    value = headers.get(name)
+    if value is None:
+        return None
+
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _reset_seconds(headers):
+    # The reset is sent as seconds until the reset, an epoch timestamp or an HTTP date
+    value = headers.get("X-RateLimit-Reset")
+    if value is None:
+        return None
+
+    number = _header_number(headers, "X-RateLimit-Reset")
+    if number is None:
+        try:
+            number = email.utils.parsedate_to_datetime(value).timestamp()
+        except (TypeError, ValueError):
+            return None
+
+    if number > _EPOCH_THRESHOLD:
+        number -= time.time()
+
+    return max(number, 0)
+
+
+def shared_limiter(key, rate, burst=1):
+    """
+    Return the rate limiter for a key, creating it the first time the key is used. Every caller
+    with the same key shares one limiter, whichever thread or connector instance it is in.
+
+    `Args:`
+        key: hashable
+            Identifies the rate limit, eg. the API and the credentials it is counted against
+        rate: float
+            The number of requests allowed per second, if the limiter is created
+        burst: int
+            The number of requests allowed at once, if the limiter is created
+    `Returns:`
+        :class:`TokenBucket`
+    """
+
+    with _limiters_lock:
+        if key not in _limiters:
+            _limiters[key] = TokenBucket(rate, burst=burst)
+
+        return _limiters[key]
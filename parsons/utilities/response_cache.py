@@ -0,0 +1,313 @@
+import collections
+import fnmatch
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import urllib.parse
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+# The default time to keep a response before revalidating it, in seconds. Responses are
+# revalidated on every request unless their url is given a TTL, so that polling an endpoint
+# (eg. a job's status) always reaches the server.
+DEFAULT_TTL = 0
+
+# Request headers that don't change the response, and so aren't part of the cache key
+_UNKEYED_HEADERS = {
+    "accept-encoding",
+    "connection",
+    "content-length",
+    "if-modified-since",
+    "if-none-match",
+    "user-agent",
+}
+
+
+class MemoryCache(object):
+    """
+    An in-memory, least recently used cache backend for :class:`ResponseCache`.
+
+    `Args:`
+        max_entries: int
+            The number of responses to keep. Defaults to ``256``.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCache(object):
+    """
+    A cache backend for :class:`ResponseCache` that stores responses in a local sqlite
+    database, so they are kept between runs.
+
+    `Args:`
+        path: str
+            The path of the database file. Defaults to ``~/.cache/parsons/responses.sqlite``.
+    """
+
+    def __init__(self, path=None):
+        if path is None:
+            path = os.path.join(os.path.expanduser("~"), ".cache", "parsons", "responses.sqlite")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS cached_responses ("
+            "key TEXT PRIMARY KEY, url TEXT, status_code INTEGER, headers TEXT, content BLOB, "
+            "encoding TEXT, expires REAL)"
+        )
+        self._db.commit()
+
+    def get(self, key):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT url, status_code, headers, content, encoding, expires "
+                "FROM cached_responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        url, status_code, headers, content, encoding, expires = row
+        return {
+            "url": url,
+            "status_code": status_code,
+            "headers": json.loads(headers),
+            "content": content,
+            "encoding": encoding,
+            "expires": expires,
+        }
+
+    def set(self, key, entry):
+        values = (
+            key,
+            entry["url"],
+            entry["status_code"],
+            json.dumps(entry["headers"]),
+            entry["content"],
+            entry["encoding"],
+            entry["expires"],
+        )
+
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO cached_responses VALUES (?, ?, ?, ?, ?, ?, ?)", values
+            )
+            self._db.commit()
+
+    def clear(self):
+        with self._lock:
+            self._db.execute("DELETE FROM cached_responses")
+            self._db.commit()
+
+    def close(self):
+        self._db.close()
+
+
+class ResponseCache(object):
+    """
+    A cache of ``GET`` responses, for endpoints whose data rarely changes, such as lists of
+    activist codes or custom fields.
+
+    A cached response is returned without a request until its TTL expires. After that, if the
+    response had an ``ETag`` or ``Last-Modified`` header, the request is sent with
+    ``If-None-Match`` or ``If-Modified-Since`` and a ``304 Not Modified`` response renews the
+    cached one. Only ``200`` responses are cached, and never ones marked
+    ``Cache-Control: no-store``. Responses are cached separately for each set of credentials.
+
+    .. code-block:: python
+
+        from parsons.utilities.response_cache import ResponseCache, SQLiteCache
+
+        cache = ResponseCache(SQLiteCache(), ttls={"*/activistCodes*": 24 * 60 * 60})
+        van = VAN(db="MyVoters", cache=cache)
+
+    `Args:`
+        backend: MemoryCache or SQLiteCache
+            Where to store responses. Defaults to a :class:`MemoryCache`.
+        ttl: int
+            The number of seconds before a response is revalidated. Defaults to ``0``, which
+            sends every request, with ``If-None-Match`` or ``If-Modified-Since`` if the cached
+            response has a validator.
+        ttls: dict
+            Optional TTLs for specific endpoints, keyed by a glob pattern matched against the
+            url's path. The first matching pattern is used.
+    """
+
+    def __init__(self, backend=None, ttl=DEFAULT_TTL, ttls=None):
+        self.backend = backend if backend is not None else MemoryCache()
+        self.ttl = ttl
+        self.ttls = ttls or {}
+
+    def ttl_for(self, url):
+        """
+        Return the TTL of the responses of a url.
+        """
+
+        path = urllib.parse.urlsplit(url).path
+        for pattern, ttl in self.ttls.items():
+            if fnmatch.fnmatchcase(path, pattern):
+                return ttl
+
+        return self.ttl
+
+    @staticmethod
+    def key(request):
+        """
+        Return the cache key of a prepared request. Credentials are part of the key but are
+        hashed, so they aren't stored.
+        """
+
+        headers = sorted(
+            (name.lower(), value)
+            for name, value in request.headers.items()
+            if name.lower() not in _UNKEYED_HEADERS
+        )
+
+        return hashlib.sha256(repr((request.method, request.url, headers)).encode()).hexdigest()
+
+    def get(self, key):
+        return self.backend.get(key)
+
+    def store(self, key, response, entry=None):
+        """
+        Cache a response, or renew a cached entry from a ``304`` response.
+        """
+
+        if "no-store" in response.headers.get("Cache-Control", ""):
+            return
+
+        if entry is None:
+            entry = {
+                "url": response.url,
+                "status_code": response.status_code,
+                "headers": dict(response.headers),
+                "content": response.content,
+                "encoding": response.encoding,
+            }
+        else:
+            # Take any updated validators from the 304 response
+            for name in ("ETag", "Last-Modified"):
+                if name in response.headers:
+                    entry["headers"][name] = response.headers[name]
+
+        entry["expires"] = time.time() + self.ttl_for(response.url)
+        self.backend.set(key, entry)
+
+    def clear(self):
+        self.backend.clear()
+
+
+def _response(entry, request):
+    # Rebuild a requests response from a cache entry
+    response = requests.Response()
+    response.status_code = entry["status_code"]
+    response.headers = CaseInsensitiveDict(entry["headers"])
+    response._content = entry["content"]
+    response.encoding = entry["encoding"]
+    response.url = entry["url"]
+    response.request = request
+    response.reason = "OK"
+    response.from_cache = True
+
+    return response
+
+
+class CachingAdapter(HTTPAdapter):
+    """
+    A transport adapter that answers ``GET`` requests from a :class:`ResponseCache`. It accepts
+    the same arguments as ``requests.adapters.HTTPAdapter``.
+
+    `Args:`
+        cache: ResponseCache
+            The cache to use
+    """
+
+    def __init__(self, cache, **kwargs):
+        self.cache = cache
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        if request.method != "GET":
+            return super().send(request, **kwargs)
+
+        key = self.cache.key(request)
+        entry = self.cache.get(key)
+
+        if entry is not None:
+            if entry["expires"] > time.time():
+                logger.debug(f"Using cached response for {request.url}")
+                return _response(entry, request)
+
+            # Ask the server whether the cached response is still current
+            headers = CaseInsensitiveDict(entry["headers"])
+            if "ETag" in headers:
+                request.headers["If-None-Match"] = headers["ETag"]
+            if "Last-Modified" in headers:
+                request.headers["If-Modified-Since"] = headers["Last-Modified"]
+
+        response = super().send(request, **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            logger.debug(f"Cached response for {request.url} is still current")
+            self.cache.store(key, response, entry)
+            return _response(entry, request)
+
+        if response.status_code == 200:
+            self.cache.store(key, response)
+
+        return response
+
+
+def mount_cache(session, cache, **kwargs):
+    """
+    Mount a :class:`CachingAdapter` on a requests session.
+
+    `Args:`
+        session: requests.Session
+            The session to configure
+        cache: ResponseCache
+            The cache to use
+        **kwargs:
+            Other ``HTTPAdapter`` arguments
+    `Returns:`
+        The session
+    """
+
+    adapter = CachingAdapter(cache, **kwargs)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
@@ -1,6 +1,6 @@
 import re
 
-__all__ = ["redact_credentials"]
+__all__ = ["redact_credentials", "is_sql_number"]
 
 
 def redact_credentials(sql):
@@ -12,3 +12,22 @@ def redact_credentials(sql):
     sql_censored = re.sub(pattern, "CREDENTIALS REDACTED", sql, flags=re.IGNORECASE)
 
     return sql_censored
+
+
+def is_sql_number(val):
+    """
+    Check whether a value can be loaded into a SQL numeric column.
+
+    Python accepts numbers with single-underscore separators such as ``100_000`` and numbers
+    with leading zeros, but SQL engines may not, so strings like ``"1_000"`` or ``"01"`` are
+    not considered numbers. Python ints and floats always are (but not bools).
+    """
+
+    # not using `isinstance` b/c isinstance(bool. (int, float)) == True
+    if type(val) in (int, float):
+        return True
+
+    try:
+        return bool((float(val) or 1) and "_" not in val and (val in ("0", "0.0") or val[0] != "0"))
+    except (TypeError, ValueError):
+        return False
@@ -505,6 +505,30 @@ class TestActionKit(unittest.TestCase):
         ]
         self.actionkit.conn.get.assert_has_calls(calls)
 
+    def test_paginated_get_stream(self):
+        first_mock = mock.MagicMock()
+        first_mock.status_code = 201
+        first_mock.json = lambda: {
+            "meta": {"next": "/rest/v1/user/abc"},
+            "objects": [{"value": x} for x in range(1000)],
+        }
+        second_mock = mock.MagicMock()
+        second_mock.json = lambda: {
+            "meta": {"next": None},
+            "objects": [{"value": x} for x in range(1000, 1050)],
+        }
+        self.actionkit.conn = mock.MagicMock()
+        self.actionkit.conn.get.side_effect = [first_mock, second_mock]
+
+        results = self.actionkit.paginated_get("user", stream=True)
+
+        # The second page isn't requested until its rows are read
+        self.assertEqual(results[0], {"value": 0})
+        self.assertEqual(self.actionkit.conn.get.call_count, 1)
+
+        self.assertEqual(results.num_rows, 1050)
+        self.assertEqual(self.actionkit.conn.get.call_count, 2)
+
     def test_paginated_get_custom_limit(self):
         # Test paginated_get
         resp_mock = mock.MagicMock()
@@ -815,26 +839,68 @@ class TestActionKit(unittest.TestCase):
             "user_id,user_customfield1\r\n5,yes\r\n",
         )
 
+    def split_tables(self, table, no_overwrite_on_empty, set_only_columns):
+        return [
+            Table.from_csv(path)
+            for _, path in self.actionkit._split_files_no_empties(
+                table, no_overwrite_on_empty, set_only_columns
+            )
+        ]
+
     def test_table_split(self):
         test1 = Table([("x", "y", "z"), ("a", "b", ""), ("1", "", "3"), ("4", "", "6")])
-        tables = self.actionkit._split_tables_no_empties(test1, True, [])
+        tables = self.split_tables(test1, True, [])
         self.assertEqual(len(tables), 2)
         assert_matching_tables(tables[0], Table([("x", "y"), ("a", "b")]))
         assert_matching_tables(tables[1], Table([("x", "z"), ("1", "3"), ("4", "6")]))
 
         test2 = Table([("x", "y", "z"), ("a", "b", "c"), ("1", "2", "3"), ("4", "5", "6")])
-        tables2 = self.actionkit._split_tables_no_empties(test2, True, [])
+        tables2 = self.split_tables(test2, True, [])
         self.assertEqual(len(tables2), 1)
         assert_matching_tables(tables2[0], test2)
 
         test3 = Table([("x", "y", "z"), ("a", "b", ""), ("1", "2", "3"), ("4", "5", "6")])
-        tables3 = self.actionkit._split_tables_no_empties(test3, False, ["z"])
+        tables3 = self.split_tables(test3, False, ["z"])
         self.assertEqual(len(tables3), 2)
         assert_matching_tables(tables3[0], Table([("x", "y"), ("a", "b")]))
         assert_matching_tables(
             tables3[1], Table([("x", "y", "z"), ("1", "2", "3"), ("4", "5", "6")])
         )
 
+    def test_table_split_open_file_limit(self):
+        # Groups whose files were closed to stay under the limit are reopened and appended to
+        tbl = Table(
+            [("x", "y", "z"), ("a", "b", ""), ("1", "", "3"), ("c", "d", ""), ("4", "", "6")]
+        )
+
+        with mock.patch("parsons.action_kit.action_kit.MAX_OPEN_UPLOAD_FILES", 1):
+            tables = self.split_tables(tbl, True, [])
+
+        assert_matching_tables(tables[0], Table([("x", "y"), ("a", "b"), ("c", "d")]))
+        assert_matching_tables(tables[1], Table([("x", "z"), ("1", "3"), ("4", "6")]))
+
+    def test_bulk_upload_table_concurrent(self):
+        uploaded = []
+
+        def bulk_upload_csv(path, import_page, **kwargs):
+            with open(path, "rb") as f:
+                uploaded.append(f.read().decode())
+            return {"success": True, "id": str(len(uploaded))}
+
+        self.actionkit.bulk_upload_csv = bulk_upload_csv
+        tbl = Table([("email", "x", "y"), ("a@example.com", "1", ""), ("b@example.com", "", "2")])
+
+        result = self.actionkit.bulk_upload_table(
+            tbl, "fake_page", no_overwrite_on_empty=True, max_workers=2
+        )
+
+        self.assertTrue(result["success"])
+        self.assertEqual(len(result["results"]), 2)
+        self.assertEqual(
+            sorted(uploaded),
+            ["email,x\r\na@example.com,1\r\n", "email,y\r\nb@example.com,2\r\n"],
+        )
+
     def test_collect_errors(self):
         resp_mock = mock.MagicMock()
         type(resp_mock.get()).json = lambda x: {"is_completed": True, "has_errors": 25}
@@ -864,3 +930,16 @@ class TestActionKit(unittest.TestCase):
             )
             not in self.actionkit.conn.get.call_args_list
         ), "Called with invalid arguments."
+
+    def test_collect_errors_multiple_uploads(self):
+        def base_get(endpoint, entity_id=None, params=None):
+            if endpoint == "upload":
+                return {"is_completed": True, "has_errors": 1}
+            return {"objects": [{"upload": params["upload"]}]}
+
+        self.actionkit._base_get = base_get
+
+        errors = self.actionkit.collect_upload_errors([{"id": "1"}, {"id": None}, {"id": "2"}])
+
+        # Errors are returned in the order of the uploads
+        self.assertEqual(errors, [{"upload": "1"}, {"upload": "2"}])
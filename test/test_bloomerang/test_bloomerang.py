@@ -165,3 +165,18 @@ class TestBloomerang(unittest.TestCase):
         assert_matching_tables(
             self.bloomerang.get_interactions(), Table(TEST_GET_INTERACTIONS["Results"])
         )
+
+    @requests_mock.Mocker()
+    def test_get_all_constituent_pages(self, m):
+        results = [{"Id": i} for i in range(5)]
+        for skip in (0, 2, 4):
+            m.get(
+                f"{self.bloomerang.uri}constituents/?skip={skip}&take=2&orderBy=Id",
+                json={"Total": 5, "TotalFiltered": 5, "Results": results[skip : skip + 2]},
+            )
+
+        assert_matching_tables(
+            self.bloomerang.get_constituents(page_number=None, page_size=2, order_by="Id"),
+            Table(results),
+        )
+        self.assertEqual(m.call_count, 3)
@@ -1,4 +1,5 @@
 import unittest
+from unittest import mock
 
 import requests_mock
 
@@ -15,6 +16,11 @@ class TestCrowdTangle(unittest.TestCase):
     def setUp(self):
         self.ct = CrowdTangle(CT_API_KEY)
 
+        # Requests with the same key are paced together, so don't wait between tests
+        patcher = mock.patch("parsons.utilities.rate_limiter.time.sleep")
+        self.sleep = patcher.start()
+        self.addCleanup(patcher.stop)
+
     @requests_mock.Mocker()
     def test_get_posts(self, m):
         m.get(self.ct.uri + "/posts", json=expected_posts)
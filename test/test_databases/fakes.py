@@ -1,4 +1,5 @@
 import logging
+import threading
 from typing import Optional, Union
 
 from parsons.databases.database_connector import DatabaseConnector
@@ -11,6 +12,7 @@ class FakeDatabase(DatabaseConnector):
     def __init__(self):
         self.table_map = {}
         self.copy_call_args = []
+        self.copy_lock = threading.Lock()
 
     def query(self, sql: str, parameters: Optional[Union[list, dict]] = None) -> Table:
         return Table()
@@ -32,6 +34,11 @@ class FakeDatabase(DatabaseConnector):
         return self.table_map[table_name]["table"]
 
     def copy(self, data, table_name, **kwargs):
+        # DBSync may copy from several threads at once
+        with self.copy_lock:
+            self._copy(data, table_name, **kwargs)
+
+    def _copy(self, data, table_name, **kwargs):
         logger.info("Copying %s rows", data.num_rows)
         if table_name not in self.table_map:
             self.setup_table(table_name, Table())
@@ -119,8 +126,17 @@ class FakeTable:
         data = self.data.select_rows(lambda row: row[primary_key_col] > start_value)
         return data.num_rows
 
-    def get_new_rows(self, primary_key, cutoff_value, offset=0, chunk_size=None):
-        data = self.data.select_rows(lambda row: row[primary_key] > cutoff_value)
+    def min_primary_key(self, primary_key):
+        if primary_key not in self.data.columns:
+            return None
+
+        return min(self.data[primary_key])
+
+    def get_new_rows(self, primary_key, cutoff_value, offset=0, chunk_size=None, upper_bound=None):
+        data = self.data.select_rows(
+            lambda row: (cutoff_value is None or row[primary_key] > cutoff_value)
+            and (upper_bound is None or row[primary_key] <= upper_bound)
+        )
         data.sort(primary_key)
 
         return Table(data[offset : chunk_size + offset])
@@ -1,4 +1,5 @@
 import os
+import time
 import unittest
 from abc import ABC
 from typing import Optional, Type
@@ -182,6 +183,145 @@ class TestFakeDBSync(TestDBSync):
             self.destination_db.copy_call_args[0],
         )
 
+    def test_table_sync_incremental_keyset(self):
+        self.set_up_db_sync(read_chunk_size=2, pagination="keyset")
+        self.destination_db.copy(self.table1, self.destination_table)
+        self.source_db.copy(self.table2, self.source_table, if_exists="append")
+        self.db_sync.table_sync_incremental(self.source_table, self.destination_table, "pk")
+
+        self.assert_matching_tables()
+        # The string key can't be sliced, so it is copied as a single slice
+        self.assertEqual(len(self.db_sync.slice_progress), 1)
+
+    def test_table_sync_full_keyset_requires_order_by(self):
+        self.set_up_db_sync(pagination="keyset")
+        self.assertRaises(ValueError, lambda: self.table_sync_full(if_exists="drop"))
+
+    def test_table_sync_full_keyset_requires_unique_order_by(self):
+        self.set_up_db_sync(pagination="keyset")
+        self.source_db.copy(Table([{"id": 1}, {"id": 1}]), self.source_table, if_exists="drop")
+        self.assertRaises(
+            ValueError,
+            self.db_sync.table_sync_full,
+            self.source_table,
+            self.destination_table,
+            order_by="id",
+        )
+
+    def test_invalid_pagination(self):
+        self.assertRaises(ValueError, DBSync, self.source_db, self.destination_db, pagination="x")
+        self.assertRaises(ValueError, DBSync, self.source_db, self.destination_db, slices=2)
+
+    def test_table_sync_full_keyset_slices(self):
+        source = Table([{"id": i, "value": f"row {i}"} for i in range(1, 101)])
+        self.source_db.copy(source, "numbered_source")
+        self.set_up_db_sync(read_chunk_size=7, pagination="keyset", slices=4)
+        self.db_sync.table_sync_full("numbered_source", "numbered_destination", order_by="id")
+
+        progress = self.db_sync.slice_progress
+        self.assertEqual(
+            [(p["lower"], p["upper"]) for p in progress],
+            [(None, 25), (25, 49), (49, 73), (73, None)],
+        )
+        self.assertEqual([p["rows_copied"] for p in progress], [25, 24, 24, 27])
+
+        destination = self.destination_db.table("numbered_destination").data
+        self.assertEqual(sorted(destination["id"]), list(range(1, 101)))
+
+    def test_table_sync_keyset_retry_resumes(self):
+        source = Table([{"id": i} for i in range(1, 11)])
+        source_table = self.source_db.setup_table("numbered_source", source)
+
+        cutoffs = []
+        get_new_rows = source_table.get_new_rows
+
+        def recording_get_new_rows(*args, **kwargs):
+            cutoffs.append(kwargs["cutoff_value"])
+            return get_new_rows(*args, **kwargs)
+
+        source_table.get_new_rows = recording_get_new_rows
+
+        # Fail on the second write; the retry should resume after the first write
+        destination_db_copy = self.destination_db.copy
+        calls = []
+
+        def flaky_copy(data, table_name, **kwargs):
+            calls.append(data.num_rows)
+            if len(calls) == 2:
+                raise ValueError("Canned error")
+            destination_db_copy(data, table_name, **kwargs)
+
+        self.destination_db.copy = flaky_copy
+        self.set_up_db_sync(read_chunk_size=4, pagination="keyset", retries=1)
+        self.db_sync.table_sync_full("numbered_source", "numbered_destination", order_by="id")
+
+        destination = self.destination_db.table("numbered_destination").data
+        self.assertEqual(destination["id"], list(range(1, 11)))
+        self.assertEqual(self.db_sync.slice_progress[0]["last_key"], 10)
+        self.assertEqual(self.db_sync.slice_progress[0]["rows_copied"], 10)
+
+        # The slice is read again from the last key written, not from the start
+        self.assertEqual(cutoffs, [None, 4, 4, 8])
+        self.assertEqual(calls, [4, 4, 4, 2])
+
+    def test_table_sync_full_pipeline(self):
+        self.set_up_db_sync(read_chunk_size=2, write_chunk_size=3, pipeline=True)
+        self.table_sync_full(if_exists="drop")
+        self.assert_matching_tables()
+
+    def test_table_sync_full_pipeline_keyset_slices(self):
+        source = Table([{"id": i} for i in range(1, 51)])
+        self.source_db.copy(source, "numbered_source")
+        self.set_up_db_sync(read_chunk_size=4, pagination="keyset", slices=3, pipeline=True)
+        self.db_sync.table_sync_full("numbered_source", "numbered_destination", order_by="id")
+
+        destination = self.destination_db.table("numbered_destination").data
+        self.assertEqual(sorted(destination["id"]), list(range(1, 51)))
+
+    def test_table_sync_pipeline_memory_cap(self):
+        source = Table([{"id": i} for i in range(1, 21)])
+        source_table = self.source_db.setup_table("numbered_source", source)
+
+        rows_read = []
+        read_ahead = []
+        get_rows = source_table.get_rows
+
+        def counting_get_rows(*args, **kwargs):
+            rows = get_rows(*args, **kwargs)
+            rows_read.append(rows.num_rows)
+            return rows
+
+        rows_written = []
+        destination_db_copy = self.destination_db.copy
+
+        def slow_copy(data, table_name, **kwargs):
+            time.sleep(0.01)
+            read_ahead.append(sum(rows_read) - sum(rows_written))
+            destination_db_copy(data, table_name, **kwargs)
+            rows_written.append(data.num_rows)
+
+        source_table.get_rows = counting_get_rows
+        self.destination_db.copy = slow_copy
+        self.set_up_db_sync(
+            read_chunk_size=1, write_chunk_size=1, pipeline=True, max_pipeline_rows=3
+        )
+        self.db_sync.table_sync_full("numbered_source", "numbered_destination")
+
+        destination = self.destination_db.table("numbered_destination").data
+        self.assertEqual(destination["id"], list(range(1, 21)))
+        # At most the capped rows (plus the chunk being read) are held ahead of the writer
+        self.assertLessEqual(max(read_ahead), 4)
+
+    def test_table_sync_pipeline_read_error(self):
+        source_table = self.source_db.table(self.source_table)
+
+        def broken_get_rows(*args, **kwargs):
+            raise ValueError("Canned error")
+
+        source_table.get_rows = broken_get_rows
+        self.set_up_db_sync(pipeline=True)
+        self.assertRaises(ValueError, lambda: self.table_sync_full(if_exists="drop"))
+
 
 # These tests interact directly with the Postgres database. In order to run, set the
 # env to LIVE_TEST='TRUE'.
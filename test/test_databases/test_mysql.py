@@ -1,5 +1,9 @@
 import os
+import tempfile
 import unittest
+from unittest import mock
+
+import petl
 
 from parsons import MySQL, Table
 from parsons.databases.mysql.create_table import MySQLCreateTable
@@ -39,6 +43,13 @@ class TestMySQLLive(unittest.TestCase):
 
         assert_matching_tables(Table([{"name": "me", "user_name": "myuser"}]), r)
 
+    def test_copy(self):
+        tbl = Table([{"name": 'O\'Brady; \\ "quoted"', "id": 1}, {"name": None, "id": 2}])
+
+        for method in ["insert", "load_data"]:
+            self.mysql.copy(tbl, "test", if_exists="drop", method=method)
+            assert_matching_tables(tbl, self.mysql.query("select * from test order by id"))
+
 
 # These tests interact directly with the MySQL database. To run, set env variable "LIVE_TEST=True"
 @unittest.skipIf(not os.environ.get("LIVE_TEST"), "Skipping because not running live test")
@@ -158,11 +169,93 @@ class TestMySQL(unittest.TestCase):  # noqa: F811
     def test_evaluate_table(self):
         table_map = [
             {"name": "ID", "type": "smallint", "width": 0},
-            {"name": "Name", "type": "varchar", "width": 8},
+            {"name": "Name", "type": "varchar", "width": 5},
             {"name": "Score", "type": "float", "width": 0},
         ]
         self.assertEqual(self.mysql.evaluate_table(self.tbl), table_map)
 
     def test_create_statement(self):
-        stmt = "CREATE TABLE test_table ( \n id smallint \n,name varchar(10) \n,score float \n);"
+        stmt = "CREATE TABLE test_table ( \n id smallint \n,name varchar(6) \n,score float \n);"
         self.assertEqual(self.mysql.create_statement(self.tbl, "test_table"), stmt)
+
+    def test_insert_batches(self):
+        rows = [[1, "a" * 10], [2, "b" * 10], [3, "c" * 10]]
+
+        # Each row is estimated at 19 bytes
+        batches = list(self.mysql._insert_batches(rows, max_bytes=40))
+        self.assertEqual(batches, [[(1, "a" * 10), (2, "b" * 10)], [(3, "c" * 10)]])
+
+        batches = list(self.mysql._insert_batches(rows, max_bytes=1000, chunk_size=1))
+        self.assertEqual(len(batches), 3)
+
+        # A single oversized row is still sent on its own
+        self.assertEqual(len(list(self.mysql._insert_batches(rows, max_bytes=1))), 3)
+
+    @mock.patch("parsons.databases.mysql.mysql.mysql.connect")
+    def test_copy_insert(self, connect):
+        cursor = connect.return_value.cursor.return_value
+        cursor.fetchone.return_value = [40]
+
+        with mock.patch.object(self.mysql, "table_exists", return_value=True):
+            self.mysql.copy(self.tbl, "test_table", if_exists="append")
+
+        # The rows are sent as parameters in batches sized from max_allowed_packet
+        sql, batch = cursor.executemany.call_args_list[0][0]
+        self.assertIn("(ID,Name,Score)", sql)
+        self.assertIn("VALUES (%s,%s,%s)", sql)
+        self.assertEqual(batch, [(1, "Jim", 1.9)])
+        self.assertEqual(cursor.executemany.call_count, 3)
+
+    @mock.patch("parsons.databases.mysql.mysql.mysql.connect")
+    def test_copy_load_data_falls_back(self, connect):
+        cursor = connect.return_value.cursor.return_value
+        cursor.fetchone.side_effect = [["OFF"], [1048576]]
+
+        with mock.patch.object(self.mysql, "table_exists", return_value=True):
+            self.mysql.copy(self.tbl, "test_table", if_exists="append", method="load_data")
+
+        self.assertIn("allow_local_infile_in_path", connect.call_args[1])
+        self.assertEqual(cursor.executemany.call_count, 1)
+
+    @unittest.skipIf(not hasattr(os, "mkfifo"), "Named pipes are not supported")
+    def test_load_data_table_error(self):
+        class FailingTable(petl.Table):
+            def __iter__(self):
+                yield ("ID", "Name")
+                yield (1, "Jim")
+                raise ValueError("Canned error")
+
+        loaded = []
+
+        def load_data(sql, connection, commit=True):
+            # Read the pipe as the server would, until the writer closes it
+            path = sql.split("'")[1]
+            with open(path, "rb") as f:
+                loaded.append(f.read())
+
+        connection = mock.MagicMock()
+        with (
+            tempfile.TemporaryDirectory() as temp_dir,
+            mock.patch.object(self.mysql, "query_with_connection", side_effect=load_data),
+        ):
+            self.assertRaises(
+                ValueError,
+                self.mysql._load_data,
+                Table(FailingTable()),
+                "test_table",
+                connection,
+                temp_dir,
+            )
+
+        # The server saw the end of the data early, so the load is rolled back
+        self.assertEqual(len(loaded), 1)
+        connection.rollback.assert_called_once()
+
+    def test_copy_invalid_method(self):
+        self.assertRaises(ValueError, self.mysql.copy, self.tbl, "test_table", method="bulk")
+
+    def test_load_data_rows(self):
+        tbl = Table([["a", "b"], [None, True], ["back\\slash", 1.5]])
+        rows = list(self.mysql._load_data_rows(tbl))
+
+        self.assertEqual(rows, [["a", "b"], ["\\N", 1], ["back\\\\slash", 1.5]])
@@ -1,5 +1,6 @@
 import os
 import unittest
+from unittest import mock
 
 from parsons import Postgres, Table
 from test.utils import assert_matching_tables
@@ -145,6 +146,23 @@ class TestPostgresCreateStatement(unittest.TestCase):
         empty_table = Table([["Col_1", "Col_2"]])
         self.assertRaises(ValueError, self.pg.create_statement, empty_table, "tmc.test")
 
+    def test_copy_stream(self):
+        cursor = mock.MagicMock()
+        copied = []
+        cursor.copy_expert.side_effect = lambda sql, file: copied.append((sql, file.read()))
+
+        with (
+            mock.patch.object(Postgres, "connection"),
+            mock.patch.object(Postgres, "cursor") as mock_cursor,
+            mock.patch.object(Postgres, "_create_table_precheck", return_value=False),
+        ):
+            mock_cursor.return_value.__enter__.return_value = cursor
+            self.pg.copy(self.tbl, "tmc.test", if_exists="append")
+
+        sql, data = copied[0]
+        self.assertEqual(sql, 'COPY "tmc.test" ("ID","Name") FROM STDIN CSV HEADER;')
+        self.assertEqual(data, b"ID,Name\r\n1,Jim\r\n2,John\r\n3,Sarah\r\n")
+
 
 # These tests interact directly with the Postgres database
 
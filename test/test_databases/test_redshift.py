@@ -1,6 +1,7 @@
 import os
 import re
 import unittest
+from unittest import mock
 
 from testfixtures import LogCapture
 
@@ -362,6 +363,59 @@ class TestRedshift(unittest.TestCase):
         # Check that all of the expected options are there:
         [self.assertNotEqual(sql.find(o), -1) for o in expected_options]
 
+    @mock.patch("parsons.databases.redshift.rs_copy_table.S3")
+    def test_temp_s3_copy_parts(self, s3):
+        self.rs.s3_temp_bucket = "buck"
+        tbl = Table([["id"]] + [[i] for i in range(10)])
+
+        with mock.patch.object(self.rs, "generate_manifest") as generate_manifest:
+            manifest_key, keys = self.rs.temp_s3_copy_parts(tbl, 4, max_workers=2)
+
+        # 10 rows in 4 parts of 3 rows, uploaded as numbered parts under a single prefix
+        self.assertEqual(len(keys), 4)
+        prefix = keys[0][: -len("part-00000.csv.gz")]
+        self.assertEqual(keys[3], f"{prefix}part-00003.csv.gz")
+        self.assertEqual(manifest_key, f"{prefix}manifest.json")
+        self.assertEqual(s3.return_value.put_stream.call_count, 4)
+        uploaded = sorted(c[0][1] for c in s3.return_value.put_stream.call_args_list)
+        self.assertEqual(uploaded, keys)
+
+        _, kwargs = generate_manifest.call_args
+        self.assertEqual(kwargs["prefix"], f"{prefix}part-")
+        self.assertEqual(kwargs["manifest_key"], manifest_key)
+
+    @mock.patch("parsons.databases.redshift.rs_copy_table.S3")
+    def test_temp_s3_copy_parts_cleans_up(self, s3):
+        self.rs.s3_temp_bucket = "buck"
+        s3.return_value.put_stream.side_effect = [None, ValueError("Upload failed")]
+
+        with mock.patch.object(self.rs, "generate_manifest"):
+            self.assertRaises(ValueError, self.rs.temp_s3_copy_parts, self.tbl, 3, max_workers=1)
+
+        self.assertEqual(s3.return_value.remove_file.call_count, 2)
+
+    def test_copy_parts(self):
+        tbl = Table([["id"]] + [[i] for i in range(10)])
+
+        with mock.patch("parsons.databases.redshift.rs_copy_table.MIN_ROWS_PER_PART", 2):
+            with mock.patch("parsons.databases.redshift.rs_copy_table.TARGET_ROWS_PER_PART", 2):
+                with mock.patch.object(
+                    self.rs, "query", return_value=Table([{"slices": 2}])
+                ) as query:
+                    self.assertEqual(self.rs._copy_parts(tbl), (4, 10))
+
+                    # The slice count is only read once
+                    self.assertEqual(self.rs._copy_parts(tbl), (4, 10))
+                    self.assertEqual(query.call_count, 1)
+
+                self.rs._slice_count = 8
+                self.assertEqual(self.rs._copy_parts(tbl), (1, 10))
+
+                # Without the slice count, the table isn't counted
+                self.rs._slice_count = None
+                with mock.patch.object(self.rs, "query", side_effect=ValueError("No access")):
+                    self.assertEqual(self.rs._copy_parts(tbl), (1, None))
+
 
 # These tests interact directly with the Redshift database
 
@@ -491,6 +545,13 @@ class TestRedshiftDB(unittest.TestCase):
             self.assertTrue("DIST" in desired_log.msg)
             self.assertFalse("SORT" in desired_log.msg)
 
+    def test_copy_parts(self):
+        # Copy a table split into several files with a manifest
+        self.rs.copy(self.tbl, f"{self.temp_schema}.test_copy", if_exists="drop", parts=2)
+
+        tbl = self.rs.query(f"select * from {self.temp_schema}.test_copy order by id")
+        self.assertEqual(tbl["name"], ["Jim", "John", "Sarah"])
+
     def test_upsert(self):
         # Create a target table when no target table exists
         self.rs.upsert(self.tbl, f"{self.temp_schema}.test_copy", "ID")
@@ -1,13 +1,16 @@
+import gzip
 import os
 import shutil
 import tempfile
 import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from unittest import mock
 
 import petl
 
 from parsons import Table
+from parsons.etl.stream import CSVStream
 from parsons.utilities import zip_archive
 from test.utils import assert_matching_tables
 
@@ -227,6 +230,51 @@ class TestParsonsTable(unittest.TestCase):
 
             self.assertRaises(ValueError, Table.from_csv, path)
 
+    def test_to_csv_stream(self):
+        tbl = Table(
+            [
+                ["first", "last", "note"],
+                ["Bob", "Smith", 'says "hi", often'],
+                ["Jane", None, "multi\nline ✊🏽"],
+            ]
+        )
+        expected = Path(tbl.to_csv(encoding="utf-8")).read_bytes()
+
+        stream = tbl.to_csv_stream()
+        self.assertEqual(stream.read(), expected)
+        self.assertEqual(stream.num_rows, 2)
+
+        # Small blocks and reads give the same output
+        stream = CSVStream(tbl.table, block_size=5)
+        chunks = iter(lambda: stream.read(3), b"")
+        self.assertEqual(b"".join(chunks), expected)
+
+        # Header only
+        stream = Table([["a", "b"]]).to_csv_stream()
+        self.assertEqual(stream.read(), b"a,b\r\n")
+        self.assertEqual(stream.num_rows, 0)
+
+        # Compressed in blocks as the stream is read
+        stream = CSVStream(tbl.table, block_size=5, compression="gzip")
+        chunks = iter(lambda: stream.read(3), b"")
+        self.assertEqual(gzip.decompress(b"".join(chunks)), expected)
+
+        self.assertRaises(ValueError, tbl.to_csv_stream, compression="zip")
+
+    @mock.patch("parsons.aws.S3")
+    def test_to_s3_csv_streams(self, s3):
+        tbl = Table([["a", "b"], [1, 2]])
+        tbl.to_s3_csv("bucket", "key.csv.gz")
+
+        # gzip and uncompressed files are streamed without a local file
+        bucket, key, stream = s3.return_value.put_stream.call_args[0]
+        self.assertEqual((bucket, key), ("bucket", "key.csv.gz"))
+        self.assertEqual(gzip.decompress(stream.read()), b"a,b\r\n1,2\r\n")
+        s3.return_value.put_file.assert_not_called()
+
+        tbl.to_s3_csv("bucket", "key.zip")
+        s3.return_value.put_file.assert_called_once()
+
     def test_to_csv_zip(self):
         try:
             # Test using the to_csv() method
@@ -638,6 +686,57 @@ class TestParsonsTable(unittest.TestCase):
         # Assert last table is 99
         self.assertEqual(99, chunks[4].num_rows)
 
+    def test_iter_chunks(self):
+        class CountingTable(petl.Table):
+            reads = 0
+
+            def __iter__(self):
+                CountingTable.reads += 1
+                yield ["a", "b"]
+                for i in range(5):
+                    yield [i, i * 2]
+
+        test_table = Table(CountingTable())
+        CountingTable.reads = 0
+
+        chunks = test_table.iter_chunks(2)
+        first = next(chunks)
+        assert_matching_tables(first, Table([["a", "b"], [0, 0], [1, 2]]))
+
+        chunks = [first] + list(chunks)
+        self.assertEqual([c.num_rows for c in chunks], [2, 2, 1])
+        self.assertEqual(chunks[2]["b"], [8])
+
+        # The source is only read once
+        self.assertEqual(CountingTable.reads, 1)
+
+        self.assertEqual(list(Table().iter_chunks(10)), [])
+        self.assertRaises(ValueError, next, test_table.iter_chunks(0))
+
+    def test_from_pages(self):
+        requested = []
+
+        def pages():
+            for i in range(3):
+                requested.append(i)
+                yield [{"a": i * 2, "b": "x"}, {"a": i * 2 + 1, "b": "y"}]
+
+        tbl = Table.from_pages(pages(), header=["a", "b"])
+        self.assertEqual(requested, [])
+
+        # Pages are only requested as their rows are reached
+        self.assertEqual(tbl[1], {"a": 1, "b": "y"})
+        self.assertEqual(requested, [0])
+
+        self.assertEqual(tbl["a"], [0, 1, 2, 3, 4, 5])
+        self.assertEqual(tbl.num_rows, 6)
+        self.assertEqual(requested, [0, 1, 2])
+
+        # Without a header, the columns are discovered from the first rows
+        tbl = Table.from_pages(iter([[{"a": 1}], [{"a": 2, "b": 3}]]))
+        self.assertEqual(tbl.columns, ["a", "b"])
+        self.assertEqual(tbl["b"], [None, 3])
+
     def test_match_columns(self):
         raw = [
             {"first name": "Mary", "LASTNAME": "Nichols", "Middle__Name": "D"},
@@ -834,6 +933,53 @@ class TestParsonsTable(unittest.TestCase):
         # Evaluates based on byte length rather than char length
         self.assertEqual(tbl.get_column_max_width("c"), 33)
 
+    def test_profile(self):
+        tbl = Table(
+            [
+                ["a", "b", "c"],
+                [1, "text", None],
+                [-5, "", 2.5],
+                [3, "NA", True],
+            ]
+        )
+        profile = tbl.profile()
+
+        self.assertEqual(profile["num_rows"], 3)
+        a, b, c = profile["columns"]
+
+        self.assertEqual(a["name"], "a")
+        self.assertEqual(a["type"], ["int"])
+        self.assertEqual((a["int_min"], a["int_max"]), (-5, 3))
+        self.assertEqual((a["min"], a["max"]), (-5, 3))
+        self.assertEqual(a["max_width"], 2)
+
+        self.assertEqual(b["text_count"], 3)
+        self.assertEqual(b["blank_count"], 2)
+        self.assertEqual(b["max_width"], 4)
+
+        self.assertEqual(c["type"], ["NoneType", "float", "bool"])
+        self.assertEqual(c["null_count"], 1)
+        self.assertEqual((c["bool_count"], c["float_count"]), (1, 1))
+
+    def test_profile_cache(self):
+        source = [["a"], [1], [22]]
+        tbl = Table(source)
+        tbl.profile()
+
+        # Cached stats are reused until the table is transformed
+        source.append([333])
+        self.assertEqual(tbl.get_column_max_width("a"), 2)
+        self.assertEqual(tbl.num_rows, 2)
+
+        # Renaming the header keeps the cache
+        tbl.set_header(["b"])
+        self.assertEqual(tbl.get_columns_type_stats(), [{"name": "b", "type": ["int"]}])
+        self.assertEqual(tbl.get_column_max_width("b"), 2)
+
+        tbl.convert_column("b", str)
+        self.assertEqual(tbl.get_column_types("b"), ["str"])
+        self.assertEqual(tbl.get_column_max_width("b"), 3)
+
     def test_sort(self):
         # Test basic sort
         unsorted_tbl = Table([["a", "b"], [3, 1], [2, 2], [1, 3]])
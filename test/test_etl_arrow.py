@@ -0,0 +1,123 @@
+import datetime
+import unittest
+
+import pytest
+
+from parsons import Table
+from parsons.etl.arrow import ArrowView
+from test.utils import assert_matching_tables
+
+pa = pytest.importorskip("pyarrow")
+pc = pytest.importorskip("pyarrow.compute")
+
+
+class TestArrowTable(unittest.TestCase):
+    def setUp(self):
+        self.rows = [
+            ["id", "name", "score"],
+            [3, "carol", 7.5],
+            [1, "alice", 9.0],
+            [2, "bob", 7.5],
+            [1, "alice", 1.0],
+        ]
+        self.tbl = Table(self.rows)
+        self.tbl.materialize(engine="arrow")
+
+    def petl_tbl(self):
+        return Table(self.rows)
+
+    def test_materialize_arrow(self):
+        self.assertIsInstance(self.tbl.table, ArrowView)
+        self.assertEqual(self.tbl.columns, ["id", "name", "score"])
+        self.assertEqual(self.tbl.num_rows, 4)
+        assert_matching_tables(self.tbl, self.petl_tbl())
+
+    def test_materialize_arrow_falls_back_to_petl(self):
+        tbl = Table([{"a": 1, "b": {"nested": True}}, {"a": "two", "b": None}])
+        tbl.materialize(engine="arrow")
+
+        self.assertNotIsInstance(tbl.table, ArrowView)
+        self.assertEqual(tbl[1], {"a": "two", "b": None})
+
+    def test_materialize_invalid_engine(self):
+        self.assertRaises(ValueError, self.petl_tbl().materialize, engine="pandas")
+
+    def test_from_arrow_to_arrow(self):
+        arrow_table = pa.table({"a": [1, 2], "b": [datetime.date(2024, 1, 1), None]})
+        tbl = Table.from_arrow(arrow_table)
+
+        self.assertEqual(tbl[0], {"a": 1, "b": datetime.date(2024, 1, 1)})
+        self.assertTrue(tbl.to_arrow().equals(arrow_table))
+        self.assertTrue(Table([["a"], [1]]).to_arrow().equals(pa.table({"a": [1]})))
+
+    def test_cut(self):
+        cut = self.tbl.cut("name", "id")
+
+        self.assertIsInstance(cut.table, ArrowView)
+        assert_matching_tables(cut, self.petl_tbl().cut("name", "id"))
+
+    def test_select_rows(self):
+        selected = self.tbl.select_rows(pc.field("score") > 7)
+
+        self.assertIsInstance(selected.table, ArrowView)
+        assert_matching_tables(selected, self.petl_tbl().select_rows("{score} > 7"))
+
+        # Python callables fall back to petl
+        selected = self.tbl.select_rows(lambda row: row.id == 1)
+        self.assertEqual(selected.num_rows, 2)
+
+    def test_sort(self):
+        for columns, reverse in [(None, False), ("score", True), (["score", "name"], False)]:
+            expected = self.petl_tbl().sort(columns, reverse=reverse)
+            self.tbl.materialize(engine="arrow")
+            arrow_sorted = Table(self.tbl.table).sort(columns, reverse=reverse)
+
+            self.assertIsInstance(arrow_sorted.table, ArrowView)
+            assert_matching_tables(arrow_sorted, expected)
+
+    def test_sort_with_nulls_falls_back(self):
+        tbl = Table([["a"], [2], [None], [1]])
+        tbl.materialize(engine="arrow")
+        tbl.sort("a")
+
+        self.assertEqual(tbl["a"], [None, 1, 2])
+
+    def test_deduplicate(self):
+        for keys in [None, "id", ["score"], ["score", "name"]]:
+            expected = self.petl_tbl().deduplicate(keys)
+            deduped = Table(self.tbl.table).deduplicate(keys)
+
+            self.assertIsInstance(deduped.table, ArrowView)
+            assert_matching_tables(deduped, expected)
+
+    def test_convert_column(self):
+        self.tbl.convert_column("name", "upper")
+        self.tbl.convert_column(["id"], str)
+        self.tbl.convert_column("id", float)
+
+        self.assertIsInstance(self.tbl.table, ArrowView)
+        self.assertEqual(self.tbl["name"], ["CAROL", "ALICE", "BOB", "ALICE"])
+        self.assertEqual(self.tbl["id"], [3.0, 1.0, 2.0, 1.0])
+
+    def test_convert_column_falls_back(self):
+        self.tbl.convert_column("id", lambda v: v * 10)
+
+        self.assertNotIsInstance(self.tbl.table, ArrowView)
+        self.assertEqual(self.tbl["id"], [30, 10, 20, 10])
+
+    def test_concat(self):
+        other = Table([{"id": 4, "name": "dan", "extra": True}])
+        other.materialize(engine="arrow")
+        self.tbl.concat(other)
+
+        self.assertIsInstance(self.tbl.table, ArrowView)
+        self.assertEqual(self.tbl.columns, ["id", "name", "score", "extra"])
+        self.assertEqual(self.tbl[4], {"id": 4, "name": "dan", "score": None, "extra": True})
+
+    def test_concat_mismatched_types_falls_back(self):
+        other = Table([{"id": "four"}])
+        other.materialize(engine="arrow")
+        self.tbl.concat(other)
+
+        self.assertNotIsInstance(self.tbl.table, ArrowView)
+        self.assertEqual(self.tbl["id"], [3, 1, 2, 1, "four"])
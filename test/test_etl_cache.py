@@ -0,0 +1,131 @@
+import os
+import tempfile
+import unittest
+
+import petl
+
+from parsons import Table
+from parsons.etl.cache import CacheView
+
+
+class CountingTable(petl.Table):
+    # A table that counts how many times its rows are read
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.reads = 0
+
+    def __iter__(self):
+        self.reads += 1
+        return iter(self.rows)
+
+
+class TestCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+        self.rows = [("id", "name")] + [(i, f"name {i}") for i in range(1000)]
+        self.source = CountingTable(self.rows)
+
+    def test_replay(self):
+        tbl = Table(self.source).cache()
+        self.source.reads = 0
+
+        self.assertEqual(tbl.num_rows, 1000)
+        self.assertEqual(tbl.columns, ["id", "name"])
+        self.assertTrue(tbl)
+        self.assertEqual(len(list(tbl)), 1000)
+        with open(tbl.to_csv()) as f:
+            self.assertEqual(len(f.readlines()), 1001)
+
+        self.assertEqual(self.source.reads, 1)
+        self.assertEqual(tbl.cache_stats["misses"], 1)
+        self.assertGreaterEqual(tbl.cache_stats["hits"], 4)
+
+    def test_partial_reads_not_recorded(self):
+        tbl = Table(self.source).cache()
+        self.source.reads = 0
+
+        # The header is kept after the first read, but reading the first row isn't a full
+        # pass so it isn't recorded
+        self.assertEqual(tbl.columns, ["id", "name"])
+        self.assertEqual(tbl.columns, ["id", "name"])
+        self.assertTrue(tbl)
+        self.assertFalse(tbl.cache_stats["complete"])
+        self.assertEqual(self.source.reads, 2)
+        self.assertEqual(tbl.cache_stats, {"hits": 1, "misses": 2, "complete": False})
+
+        self.assertEqual(list(iter(tbl.table)), self.rows)
+        self.assertEqual(list(iter(tbl.table)), self.rows)
+        self.assertEqual(self.source.reads, 3)
+        self.assertEqual(tbl.cache_stats, {"hits": 2, "misses": 3, "complete": True})
+
+    def test_transformations_after_cache(self):
+        calls = []
+
+        def double(v):
+            calls.append(v)
+            return v * 2
+
+        tbl = Table(self.source).convert_column("id", double).cache()
+        tbl.convert_column("name", str.upper)
+
+        first = list(tbl.table)
+        self.assertEqual(list(tbl.table), first)
+        self.assertEqual(first[2], (2, "NAME 1"))
+        self.assertEqual(len(calls), 1000)
+        self.assertEqual(tbl.num_rows, 1000)
+
+    def test_spill(self):
+        view = CacheView(self.source, max_memory="10KB", spill_dir=self.temp_dir.name)
+
+        self.assertEqual(list(iter(view)), self.rows)
+        self.assertEqual(len(os.listdir(self.temp_dir.name)), 1)
+        self.assertEqual(list(iter(view)), self.rows)
+        self.assertEqual(view.num_rows(), 1000)
+        self.assertEqual((view.hits, view.misses), (2, 1))
+
+        view.clear()
+        self.assertEqual(os.listdir(self.temp_dir.name), [])
+        self.assertEqual(list(iter(view)), self.rows)
+        self.assertEqual(view.misses, 2)
+
+    def test_no_spill(self):
+        view = CacheView(self.source, max_memory="10KB", spill=False, spill_dir=self.temp_dir.name)
+
+        self.assertEqual(list(view), self.rows)
+        self.assertFalse(view.complete)
+        self.assertEqual(os.listdir(self.temp_dir.name), [])
+
+    def test_profile_kept(self):
+        tbl = Table(self.source)
+        profile = tbl.profile()
+        tbl.cache()
+
+        self.source.reads = 0
+        self.assertEqual(tbl.profile(), profile)
+        self.assertEqual(self.source.reads, 0)
+
+    def test_auto_cache(self):
+        Table.set_auto_cache(max_memory="1MB")
+        self.addCleanup(Table.set_auto_cache, False)
+
+        calls = []
+
+        def double(v):
+            calls.append(v)
+            return v * 2
+
+        tbl = Table(self.source)
+        tbl.convert_column("id", double)
+        tbl.add_column("upper", lambda row: row["name"].upper())
+
+        self.assertEqual(tbl.num_rows, 1000)
+        self.assertEqual(tbl["id"][:2], [0, 2])
+        tbl.to_csv()
+        self.assertEqual(len(calls), 1000)
+        self.assertEqual(tbl.cache_stats["misses"], 1)
+
+        # Tables already in memory aren't cached
+        self.assertIsNone(Table([{"a": 1}]).cache_stats)
@@ -0,0 +1,140 @@
+import datetime
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import petl
+
+from parsons import Table
+from parsons.etl.external_sort import ExternalSortView, parse_memory_limit
+from test.utils import assert_matching_tables
+
+# Sorts a generated table with a memory limit in a fresh interpreter, and prints the peak RSS
+# added by the sort, in MB. The table is generated as it is read, so only the sort holds rows.
+BENCHMARK = """
+import json, random, resource, sys
+import petl
+from parsons import Table
+
+rows, width, memory_limit = int(sys.argv[1]), int(sys.argv[2]), sys.argv[3]
+
+class Generated(petl.Table):
+    def __iter__(self):
+        rng = random.Random(0)
+        yield tuple(f"col{i}" for i in range(width))
+        for _ in range(rows):
+            yield (rng.randrange(10**9),) + tuple(f"value {rng.random()}" for _ in range(width - 1))
+
+before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+tbl = Table(Generated()).sort("col0", memory_limit=None if memory_limit == "none" else memory_limit)
+last, count = None, 0
+for row in tbl.table.data():
+    assert last is None or last <= row[0]
+    last, count = row[0], count + 1
+after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+# ru_maxrss is in KB, except on macOS where it is in bytes
+scale = 1024**2 if sys.platform == "darwin" else 1024
+print(json.dumps({"rows": count, "peak_mb": (after - before) / scale}))
+"""
+
+
+def _benchmark(rows, width, memory_limit):
+    result = subprocess.run(
+        [sys.executable, "-c", BENCHMARK, str(rows), str(width), memory_limit],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout)
+
+
+class TestExternalSort(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+        rng = random.Random(0)
+        self.rows = [
+            {
+                "id": rng.randrange(500),
+                "name": rng.choice(["a", "b", None, "c"]),
+                "date": datetime.date(2024, 1, 1 + rng.randrange(28)),
+            }
+            for _ in range(5000)
+        ]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_parse_memory_limit(self):
+        self.assertEqual(parse_memory_limit(1000), 1000)
+        self.assertEqual(parse_memory_limit("512MB"), 512 * 1024**2)
+        self.assertEqual(parse_memory_limit("1.5 gb"), int(1.5 * 1024**3))
+        self.assertRaises(ValueError, parse_memory_limit, "lots")
+
+    def test_matches_petl_sort(self):
+        tbl = Table(self.rows)
+
+        # From an in-memory sort to many runs merged in several passes
+        for memory_limit in ("1GB", "200KB", 2000):
+            for key, reverse in ((None, False), ("id", False), (["name", "id"], True)):
+                view = ExternalSortView(
+                    tbl.table,
+                    key=key,
+                    reverse=reverse,
+                    memory_limit=memory_limit,
+                    spill_dir=self.temp_dir.name,
+                )
+                expected = petl.sort(tbl.table, key=key, reverse=reverse)
+
+                self.assertEqual(list(view), [tuple(row) for row in expected])
+
+    def test_runs_kept_and_removed(self):
+        view = ExternalSortView(
+            Table(self.rows).table, key="id", memory_limit="50KB", spill_dir=self.temp_dir.name
+        )
+
+        first = list(view)
+        self.assertEqual(len(os.listdir(self.temp_dir.name)), 1)
+
+        # A second read uses the runs rather than sorting again
+        self.assertEqual(list(view), first)
+
+        view.clear()
+        self.assertEqual(os.listdir(self.temp_dir.name), [])
+
+    def test_table_methods(self):
+        options = {"memory_limit": "50KB", "spill_dir": self.temp_dir.name}
+
+        assert_matching_tables(
+            Table(self.rows).sort(["date", "id"], **options),
+            Table(self.rows).sort(["date", "id"]),
+        )
+        assert_matching_tables(
+            Table(self.rows).deduplicate("id", **options),
+            Table(self.rows).deduplicate("id"),
+        )
+
+        def reducer(key, rows):
+            return [key, len(list(rows))]
+
+        assert_matching_tables(
+            Table(self.rows).reduce_rows("name", reducer, ["name", "count"], **options),
+            Table(self.rows).reduce_rows("name", reducer, ["name", "count"]),
+        )
+
+    @unittest.skipIf(
+        not os.environ.get("BENCHMARK_TEST"), "Skipping because not running benchmarks"
+    )
+    @unittest.skipIf(sys.platform == "win32", "The benchmark measures RSS with resource")
+    def test_benchmark_peak_rss(self):
+        # Narrow and wide tables that take 35MB and 50MB to sort in memory, sorted with a 16MB
+        # budget. The peak memory of the sort stays within the budget whatever the shape.
+        for rows, width in ((300_000, 2), (30_000, 20)):
+            result = _benchmark(rows, width, "16MB")
+
+            self.assertEqual(result["rows"], rows)
+            self.assertLess(result["peak_mb"], 32, (rows, width))
@@ -0,0 +1,50 @@
+import os
+import random
+import tempfile
+import unittest
+
+from parsons import Table
+
+
+class TestHashDedup(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+        rng = random.Random(0)
+        self.rows = [(rng.randrange(300), rng.choice(["a", "b", "c"])) for _ in range(3000)]
+        self.tbl = Table([("id", "name")] + self.rows)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def first_rows(self, key):
+        # The first row for each key, in the original order
+        seen = set()
+        rows = []
+        for row in self.rows:
+            if key(row) not in seen:
+                seen.add(key(row))
+                rows.append(row)
+        return rows
+
+    def test_keeps_first_rows_in_order(self):
+        tbl = Table(self.tbl.table).deduplicate("id", method="hash")
+        self.assertEqual(list(tbl.table.data()), self.first_rows(lambda row: row[0]))
+
+        tbl = Table(self.tbl.table).deduplicate(method="hash")
+        self.assertEqual(list(tbl.table.data()), self.first_rows(lambda row: row))
+
+        tbl = Table(self.tbl.table).deduplicate(["name", "id"], method="hash")
+        self.assertEqual(list(tbl.table.data()), self.first_rows(lambda row: row))
+
+    def test_spills_partitions(self):
+        # A budget of about 50 keys, so most rows are spilled
+        tbl = Table(self.tbl.table).deduplicate(
+            "id", method="hash", memory_limit=5000, spill_dir=self.temp_dir.name
+        )
+
+        self.assertEqual(list(tbl.table.data()), self.first_rows(lambda row: row[0]))
+        self.assertEqual(os.listdir(self.temp_dir.name), [])
+
+    def test_unknown_method(self):
+        self.assertRaises(ValueError, self.tbl.deduplicate, method="bogus")
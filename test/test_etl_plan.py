@@ -0,0 +1,263 @@
+import os
+import time
+import unittest
+from unittest import mock
+
+import petl
+
+from parsons import Table
+from parsons.etl import plan
+from parsons.etl.plan import FusedView
+
+
+def _unfused(table, step, *args):
+    # Each step as the petl view Table used before steps were fused
+    if step == "rename":
+        return petl.rename(table, *args)
+    if step == "convert":
+        fields, function, pass_row, failonerror, errorvalue = args
+        return petl.convert(
+            table,
+            list(fields),
+            function,
+            pass_row=pass_row,
+            failonerror=failonerror,
+            errorvalue=errorvalue,
+        )
+    if step == "add":
+        return petl.addfield(table, *args)
+    if step == "fill":
+        field, value = args
+        if callable(value):
+            return petl.convert(table, field, lambda _, r: value(r), pass_row=True)
+        return petl.update(table, field, value)
+    if step == "cut":
+        return petl.cut(table, *args[0])
+    if step == "cutout":
+        return petl.cutout(table, *args[0])
+    if step == "move":
+        return petl.movefield(table, *args)
+
+
+def _raw_rows(n):
+    header = ["First Name", "LAST", "e-mail", "Phone", "zip", "st", "city", "dob", "notes", "src"]
+    rows = [header]
+    for i in range(n):
+        rows.append(
+            [
+                f"  name{i} ",
+                f"LAST{i % 97}",
+                None if i % 5 == 0 else f"Person{i}@Example.org ",
+                f"(555) {i % 1000:03d}-{i % 10000:04d}",
+                f"{i % 99999:05d}",
+                " ny " if i % 2 else "CA",
+                "springfield" if i % 3 else "",
+                f"19{i % 90 + 10}-0{i % 9 + 1}-1{i % 9}",
+                "x" * (i % 50),
+                "import",
+            ]
+        )
+    return rows
+
+
+def _cleaning_pipeline(tbl):
+    # A 40 step cleaning script of the kind run on voter file and CRM exports
+    tbl.rename_column("First Name", "first_name")
+    tbl.rename_column("LAST", "last_name")
+    tbl.rename_columns({"e-mail": "email", "Phone": "phone", "st": "state"})
+    tbl.convert_column("first_name", str.strip)
+    tbl.convert_column("first_name", str.title)
+    tbl.convert_column("last_name", str.strip)
+    tbl.convert_column("last_name", str.title)
+    tbl.convert_column("email", lambda v: v.strip().lower())
+    tbl.fill_column("phone", lambda r: "".join(c for c in r["phone"] if c.isdigit()))
+    tbl.convert_column("phone", lambda v: v[-10:])
+    tbl.add_column("phone_valid", lambda r: len(r["phone"]) == 10)
+    tbl.convert_column("state", lambda v: v.strip().upper())
+    tbl.convert_column("zip", lambda v: v.zfill(5))
+    tbl.add_column("zip5", lambda r: r["zip"][:5])
+    tbl.remove_column("zip")
+    tbl.rename_column("zip5", "zip")
+    tbl.convert_column("city", lambda v: v or None)
+    tbl.convert_column("city", lambda v: v.title() if v else v)
+    tbl.add_column("mailing_city", None)
+    tbl.coalesce_columns("mailing_city", ["city", "state"], remove_source_columns=False)
+    tbl.add_column("birth_year", lambda r: int(r["dob"][:4]))
+    tbl.convert_column("birth_year", lambda v: v if v > 1900 else None)
+    tbl.add_column("age", lambda r: 2024 - r["birth_year"] if r["birth_year"] else None)
+    tbl.remove_column("dob")
+    tbl.add_column("notes_length", lambda r: len(r["notes"]))
+    tbl.remove_column("notes")
+    tbl.convert_column("notes_length", lambda v: min(v, 40))
+    tbl.fill_column("src", "van")
+    tbl.add_column("full_name", lambda r: f"{r['first_name']} {r['last_name']}")
+    tbl.add_column("email_domain", lambda r: r["email"].split("@")[-1] if r["email"] else None)
+    tbl.add_column("has_email", lambda r: r["email"] is not None)
+    tbl.convert_column("email_domain", lambda v: v.lower() if v else v)
+    tbl.add_column("contact", None)
+    tbl.coalesce_columns("contact", ["email", "phone"], remove_source_columns=False)
+    tbl.move_column("full_name", 0)
+    tbl.move_column("contact", 1)
+    tbl.remove_column("mailing_city")
+    tbl.add_column("region", lambda r: "west" if r["state"] == "CA" else "east")
+    tbl.convert_column("age", lambda v: v if v is None or v < 120 else None)
+    return tbl.cut(
+        "full_name",
+        "contact",
+        "first_name",
+        "last_name",
+        "email",
+        "phone",
+        "phone_valid",
+        "state",
+        "zip",
+        "age",
+        "notes_length",
+        "src",
+        "email_domain",
+        "has_email",
+        "region",
+    )
+
+
+class TestFusedView(unittest.TestCase):
+    def setUp(self):
+        self.rows = [["a", "b", "c"], [1, "x", None], [2, "y", 3.5]]
+
+    def test_steps_fused(self):
+        tbl = Table(self.rows)
+        tbl.rename_column("a", "id")
+        tbl.convert_column("id", lambda v: v * 10)
+        tbl.add_column("d", lambda r: r["id"] + 1, index=0)
+        tbl.fill_column("b", lambda r: r["b"].upper())
+        tbl.move_column("c", 0)
+
+        self.assertIsInstance(tbl.table, FusedView)
+        self.assertEqual(len(tbl.table.steps), 5)
+        self.assertEqual(tbl.columns, ["c", "d", "id", "b"])
+        self.assertEqual(list(tbl.data), [(None, 11, 10, "X"), (3.5, 21, 20, "Y")])
+
+        # Cut returns a new table, and the original is unchanged
+        cut = tbl.cut("b", "id")
+        self.assertEqual(list(cut.data), [("X", 10), ("Y", 20)])
+        self.assertEqual(tbl.cut(["b", "id"]).columns, ["b", "id"])
+        self.assertEqual(tbl.columns, ["c", "d", "id", "b"])
+
+    def test_dead_steps_not_run(self):
+        calls = []
+
+        def spy(v):
+            calls.append(v)
+            return v
+
+        tbl = Table(self.rows)
+        tbl.convert_column("a", spy)
+        tbl.convert_column("b", spy)
+        tbl.remove_column("a")
+        tbl.fill_column("b", "z")
+
+        self.assertEqual(list(tbl.data), [("z", None), ("z", 3.5)])
+        self.assertEqual(calls, [])
+
+        # Source columns that aren't used aren't read from the row
+        _, function = tbl.table.compile(("a", "b", "c"))
+        self.assertEqual(function([object(), object(), 1]), ("z", 1))
+
+    def test_petl_semantics(self):
+        tbl = Table(self.rows)
+
+        # Errors in conversions become None by default
+        tbl.convert_column("c", lambda v: v + 1)
+        self.assertEqual(tbl["c"], [None, 4.5])
+
+        tbl.convert_column("a", lambda v: 1 / 0, failonerror="inline")
+        self.assertIsInstance(tbl["a"][0], ZeroDivisionError)
+
+        tbl.convert_column("b", lambda v: 1 / 0, failonerror=True)
+        self.assertRaises(ZeroDivisionError, list, tbl.table)
+
+        # Conversions fused or not give the same result
+        tbl = Table(self.rows)
+        tbl.convert_column(["a", "c"], lambda v, r: (v, r["b"]), pass_row=True)
+        self.assertEqual(
+            list(tbl.data), [((1, "x"), "x", (None, "x")), ((2, "y"), "y", (3.5, "y"))]
+        )
+
+        # Conversions that can't be fused use petl
+        tbl = Table(self.rows).convert_column("b", "upper")
+        self.assertNotIsInstance(tbl.table, FusedView)
+        self.assertEqual(tbl["b"], ["X", "Y"])
+
+    def test_missing_columns(self):
+        for step in (
+            lambda t: t.rename_column("nope", "other"),
+            lambda t: t.convert_column("nope", str),
+            lambda t: t.remove_column("nope"),
+            lambda t: t.cut("nope").table,
+        ):
+            # The steps are checked against the header once the table is read
+            self.assertRaises(petl.errors.FieldSelectionError, lambda: list(step(Table(self.rows))))
+
+    def test_short_rows(self):
+        tbl = Table([["a", "b"], [1], [2, 3]]).convert_column("b", lambda v: v is None)
+        self.assertEqual(list(tbl.data), [(1, True), (2, False)])
+
+    def test_long_rows(self):
+        rows = [["a", "b"], [1, 2, 3]]
+
+        # Values past the header are kept or dropped as the petl functions do
+        for fused, unfused in (
+            (lambda t: t.convert_column("a", str).table, lambda t: petl.convert(t, "a", str)),
+            (lambda t: t.rename_column("a", "c").table, lambda t: petl.rename(t, "a", "c")),
+            (lambda t: t.fill_column("a", 0).table, lambda t: petl.update(t, "a", 0)),
+            (lambda t: t.cut("a").table, lambda t: petl.cut(t, "a")),
+            (lambda t: t.remove_column("a").table, lambda t: petl.cutout(t, "a")),
+            (lambda t: t.move_column("b", 0).table, lambda t: petl.movefield(t, "b", 0)),
+        ):
+            table = fused(Table(rows))
+            self.assertIsInstance(table, FusedView)
+            self.assertEqual(list(table), list(unfused(rows)))
+
+        tbl = Table(rows).convert_column("a", str).cut("a")
+        self.assertEqual(list(tbl.data), [("1",)])
+
+        # A new column ends the row, so the values past the header are dropped
+        tbl = Table(rows).add_column("c", 4)
+        self.assertEqual(list(tbl.data), [(1, 2, 4)])
+
+    def test_num_rows(self):
+        tbl = Table(self.rows)
+        tbl.add_column("d", lambda r: 1 / 0)
+        with mock.patch.object(FusedView, "__iter__", side_effect=AssertionError):
+            self.assertEqual(tbl.num_rows, 2)
+
+    def test_cleaning_pipeline(self):
+        # A realistic 40 step pipeline gives the same rows fused as a stack of petl views
+        results = self._run_cleaning_pipeline(_raw_rows(500))[0]
+        self.assertEqual(results["fused"], results["unfused"])
+        self.assertEqual(len(results["fused"]), 501)
+
+    @unittest.skipIf(
+        not os.environ.get("BENCHMARK_TEST"), "Skipping because not running benchmarks"
+    )
+    def test_benchmark_cleaning_pipeline(self):
+        results, timings = self._run_cleaning_pipeline(_raw_rows(5000))
+        self.assertEqual(results["fused"], results["unfused"])
+        self.assertLess(timings["fused"] * 2, timings["unfused"], timings)
+
+    def _run_cleaning_pipeline(self, rows):
+        timings = {}
+        results = {}
+        for name in ("unfused", "fused"):
+            tbl = Table(rows)
+            if name == "unfused":
+                with mock.patch.object(plan, "fuse", _unfused):
+                    tbl = _cleaning_pipeline(tbl)
+            else:
+                tbl = _cleaning_pipeline(tbl)
+
+            start = time.perf_counter()
+            results[name] = list(tbl.table)
+            timings[name] = time.perf_counter() - start
+
+        return results, timings
@@ -0,0 +1,133 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import petl
+
+from parsons import Table
+from parsons.etl.predicate import Predicate, PredicateView
+from parsons.etl.spill import SpillSelectView
+
+EXPRESSIONS = [
+    "{foo} == 'a' and {baz} > 88.1",
+    "{foo} != 'a'",
+    "not {foo} == 'a'",
+    "{foo} in ('a', 'b')",
+    "{foo} not in ['a']",
+    "{foo} is None or {bar} == 1",
+    "{foo} is not None and {bar} * 2 >= 4",
+    "{foo} is not None and 1 < {bar} <= 4",
+]
+
+
+class TestPredicate(unittest.TestCase):
+    def setUp(self):
+        self.rows = [
+            ["foo", "bar", "baz"],
+            ["c", 4, 9.3],
+            ["a", 2, 88.2],
+            ["b", 1, 23.3],
+            [None, None, None],
+        ]
+
+    def expected(self, expression):
+        return list(petl.data(petl.select(self.rows, expression)))
+
+    def test_compiled(self):
+        for expression in EXPRESSIONS:
+            tbl = Table(self.rows).select_rows(expression)
+
+            self.assertIsInstance(tbl.table, PredicateView)
+            self.assertEqual(list(tbl.table.data()), self.expected(expression), expression)
+
+    def test_compiled_short_rows(self):
+        tbl = Table([["foo", "bar"], ["a"], ["b", 2]]).select_rows("{bar} is None")
+        self.assertEqual(list(tbl.table.data()), [("a", None)])
+
+    def test_unknown_column(self):
+        tbl = Table(self.rows).select_rows("{nope} == 1")
+        self.assertRaises(petl.errors.FieldSelectionError, list, tbl.table)
+
+    def test_arrow(self):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            self.skipTest("pyarrow is not installed")
+
+        for expression in EXPRESSIONS:
+            tbl = Table(self.rows)
+            tbl.materialize(engine="arrow")
+
+            self.assertIsNotNone(Predicate(expression).to_arrow(), expression)
+            self.assertEqual(
+                list(tbl.select_rows(expression).table.data()),
+                self.expected(expression),
+                expression,
+            )
+
+        # Expressions without a vectorized equivalent are run row by row
+        self.assertIsNone(Predicate("{foo}.startswith('a')").to_arrow())
+        self.assertIsNone(Predicate("{bar} > {baz}").to_arrow())
+        self.assertIsNone(Predicate("{bar} / 2 > 1").to_arrow())
+
+        # Arrow divides integers with integer division, so division is run row by row
+        tbl = Table([["a"], [3], [4]])
+        tbl.materialize(engine="arrow")
+        self.assertEqual(tbl.select_rows("{a} / 2 > 1")["a"], [3, 4])
+
+        # As are comparisons Arrow can't run, such as a string column to a number
+        tbl = Table([["a"], ["x"]])
+        tbl.materialize(engine="arrow")
+        self.assertEqual(tbl.select_rows("{a} == 5").num_rows, 0)
+
+    def test_spill(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for expression in EXPRESSIONS:
+                tbl = Table(self.rows)
+                tbl.materialize_to_file(os.path.join(temp_dir, "spill"))
+                selected = tbl.select_rows(expression)
+
+                self.assertIsInstance(selected.table, SpillSelectView)
+                self.assertEqual(list(selected.table.data()), self.expected(expression), expression)
+
+            # Slices of the file are filtered too
+            tbl.head(2)
+            self.assertEqual(tbl.select_rows("{bar} < 3")["foo"], ["a"])
+
+    def test_to_sql(self):
+        sql, params = Predicate("{foo} == 'a' and ({bar} in (1, 2) or {baz} is None)").to_sql()
+
+        self.assertEqual(
+            sql,
+            '(COALESCE("foo" = %s, FALSE) AND '
+            '(COALESCE("bar" IN (%s, %s), FALSE) OR ("baz" IS NULL)))',
+        )
+        self.assertEqual(params, ["a", 1, 2])
+
+        # Simple names match case-insensitively, like unquoted SQL names; others exactly
+        sql, _ = Predicate("{State} == 'NY' and {First Name} is None").to_sql()
+        self.assertEqual(sql, '(COALESCE("state" = %s, FALSE) AND ("First Name" IS NULL))')
+
+        self.assertRaises(ValueError, Predicate("{foo}.upper() == 'A'").to_sql)
+        self.assertRaises(ValueError, Predicate("{bar} / 2 > 1").to_sql)
+
+    @mock.patch("parsons.databases.postgres.Postgres")
+    def test_from_postgres_where(self, postgres):
+        Table.from_postgres("SELECT * FROM people;", where="{state} == 'NY'")
+
+        postgres.return_value.query.assert_called_once_with(
+            "SELECT * FROM (SELECT * FROM people) AS parsons_query "
+            'WHERE COALESCE("state" = %s, FALSE)',
+            ["NY"],
+        )
+
+    @mock.patch("parsons.databases.postgres.Postgres")
+    def test_from_postgres_where_escapes_percent(self, postgres):
+        Table.from_postgres("SELECT * FROM people WHERE name LIKE 'A%'", where="{state} == 'NY'")
+
+        postgres.return_value.query.assert_called_once_with(
+            "SELECT * FROM (SELECT * FROM people WHERE name LIKE 'A%%') AS parsons_query "
+            'WHERE COALESCE("state" = %s, FALSE)',
+            ["NY"],
+        )
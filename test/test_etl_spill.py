@@ -0,0 +1,104 @@
+import datetime
+import decimal
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import petl
+
+from parsons import Table
+from parsons.etl.spill import SpillView, SpillWriter, write_spill
+from test.utils import assert_matching_tables
+
+
+class TestSpill(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "spill")
+
+        self.rows = [
+            {
+                "id": i,
+                "name": f"name {i}",
+                "amount": decimal.Decimal(i) / 100,
+                "date": datetime.date(2024, 1, 1 + i % 28),
+                "data": {"i": i} if i % 2 else None,
+            }
+            for i in range(25)
+        ]
+        self.tbl = Table(self.rows)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_round_trip_keeps_types(self):
+        view = write_spill(self.tbl.table, self.path, block_rows=10)
+
+        self.assertEqual(len(view.blocks), 3)
+        self.assertEqual(len(view), 26)
+        assert_matching_tables(Table(view), self.tbl)
+
+    def test_writer_batches(self):
+        with SpillWriter(self.path, ["a", "b"], block_rows=4) as writer:
+            writer.write([(1, "x"), (2, "y"), (3, "z")])
+            writer.write([(4, "w"), (5, "v")])
+
+        view = SpillView(self.path)
+        self.assertEqual([rows for _, rows in view.blocks], [4, 1])
+        self.assertEqual(list(view)[-1], (5, "v"))
+
+    def test_project(self):
+        write_spill(self.tbl.table, self.path, block_rows=10)
+
+        view = SpillView(self.path, columns=["date", "id"])
+        assert_matching_tables(Table(view), self.tbl.cut("date", "id"))
+
+        # Projections by position are relative to the current view
+        self.assertEqual(list(view.project([1]))[:2], [("id",), (0,)])
+
+        self.assertRaises(petl.errors.FieldSelectionError, view.project, ["name"])
+
+    def test_slice_skips_blocks(self):
+        view = write_spill(self.tbl.table, self.path, block_rows=10)
+
+        sliced = view.slice(8, 12)
+        self.assertEqual([r[0] for r in petl.data(sliced)], [8, 9, 10, 11])
+        self.assertEqual(len(sliced), 5)
+
+        # Slices are relative to the current view
+        self.assertEqual([r[0] for r in petl.data(sliced.slice(1, 2))], [9])
+
+        # Blocks outside of the range are never read
+        with mock.patch.object(
+            SpillView, "_read_block", autospec=True, side_effect=SpillView._read_block
+        ) as read_block:
+            list(view.slice(12, 15))
+
+        self.assertEqual([c[0][2] for c in read_block.call_args_list], [view.blocks[1][0]])
+
+    def test_ragged_rows(self):
+        view = write_spill([["a", "b"], [1], [1, 2, 3]], self.path)
+
+        self.assertEqual(list(view), [("a", "b"), (1,), (1, 2, 3)])
+        self.assertEqual(list(view.project(["b"])), [("b",), (None,), (2,)])
+
+    def test_not_a_spill_file(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not a spill file")
+
+        self.assertRaises(ValueError, SpillView, self.path)
+
+    def test_materialize_to_file_pushdown(self):
+        self.tbl.materialize_to_file(self.path)
+
+        self.assertIsInstance(self.tbl.table, SpillView)
+        self.assertEqual(self.tbl.num_rows, 25)
+
+        cut = self.tbl.cut("name")
+        self.assertIsInstance(cut.table, SpillView)
+        self.assertEqual(cut[3], {"name": "name 3"})
+
+        self.tbl.head(2)
+        self.assertIsInstance(self.tbl.table, SpillView)
+        self.assertEqual(self.tbl["id"], [0, 1])
@@ -0,0 +1,64 @@
+import json
+import subprocess
+import sys
+import unittest
+
+import parsons
+
+# Dependencies of individual connectors, which importing Parsons shouldn't import
+HEAVY_MODULES = [
+    "boto3",
+    "google.cloud",
+    "googleapiclient",
+    "simple_salesforce",
+    "paramiko",
+    "psycopg2",
+    "mysql",
+    "facebook_business",
+    "civis",
+    "twilio",
+    "slack_sdk",
+]
+
+# Importing Parsons imported over 2,500 modules when every connector was imported up front
+MAX_MODULES = 500
+
+
+def _run(code):
+    # Run code in a fresh interpreter, so nothing is already imported
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout)
+
+
+class TestImportTime(unittest.TestCase):
+    def test_import_is_lazy(self):
+        loaded = _run(
+            "import json, sys, parsons; parsons.Table; print(json.dumps(list(sys.modules)))"
+        )
+
+        self.assertEqual([m for m in HEAVY_MODULES if m in loaded], [])
+        self.assertLess(len(loaded), MAX_MODULES)
+
+    def test_connectors_resolve(self):
+        from parsons import VAN
+
+        self.assertIs(parsons.VAN, VAN)
+        self.assertIn("VAN", dir(parsons))
+        self.assertIn("VAN", parsons.__all__)
+
+        self.assertRaises(AttributeError, getattr, parsons, "NotAConnector")
+        with self.assertRaises(ImportError):
+            from parsons import NotAConnector  # noqa: F401
+
+    def test_star_import_skips_missing_dependencies(self):
+        # A connector module that can't be imported, as when its dependencies aren't installed
+        names = _run(
+            "import json, sys; sys.modules['parsons.zoom.zoom'] = None; "
+            "from parsons import *; import parsons; print(json.dumps(parsons.__all__))"
+        )
+
+        self.assertNotIn("Zoom", names)
+        self.assertIn("VAN", names)
+        self.assertEqual(names[0], "Table")
@@ -133,6 +133,13 @@ class TestS3(unittest.TestCase):
         result_tbl = Table.from_csv(path)
         assert_matching_tables(self.tbl, result_tbl)
 
+    def test_put_stream(self):
+        stream = self.tbl.to_csv_stream(compression="gzip")
+        self.s3.put_stream(self.test_bucket, "stream.csv.gz", stream)
+
+        path = self.s3.get_file(self.test_bucket, "stream.csv.gz")
+        assert_matching_tables(self.tbl, Table.from_csv(path))
+
     def test_get_url(self):
         # Test that you can download from URL
         url = self.s3.get_url(self.test_bucket, self.test_key)
@@ -0,0 +1,184 @@
+import http.server
+import threading
+import unittest
+from unittest import mock
+
+from requests.auth import HTTPBasicAuth
+from requests.exceptions import HTTPError
+
+from parsons.utilities.api_connector import APIConnector
+
+
+class StatusHandler(http.server.BaseHTTPRequestHandler):
+    # Each test sets the list of (status, headers) responses to send in order
+    responses = []
+    requests = []
+
+    def _respond(self):
+        StatusHandler.requests.append((self.command, self.path))
+        status, headers = StatusHandler.responses.pop(0)
+
+        body = b'{"ok": true}'
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = _respond
+    do_POST = _respond
+
+    def log_message(self, *args):
+        pass
+
+
+class TestAPIConnector(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), StatusHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.uri = f"http://127.0.0.1:{cls.server.server_address[1]}/"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        StatusHandler.responses = []
+        StatusHandler.requests = []
+
+        self.connector = APIConnector(self.uri)
+        self.connector.backoff_factor = 0
+
+    def test_session_is_reused(self):
+        session = self.connector.session
+        self.assertIs(self.connector.session, session)
+        self.assertIsNot(APIConnector(self.uri).session, session)
+
+    def test_pool_settings(self):
+        self.connector.pool_maxsize = 25
+        self.connector.max_retries = 5
+
+        adapter = self.connector.session.get_adapter("https://example.com")
+        self.assertEqual(adapter._pool_maxsize, 25)
+        self.assertEqual(adapter.max_retries.total, 5)
+        self.assertIn(429, adapter.max_retries.status_forcelist)
+
+    def test_retry_after(self):
+        StatusHandler.responses = [
+            (429, {"Retry-After": "0"}),
+            (503, {}),
+            (200, {}),
+        ]
+
+        self.assertEqual(self.connector.get_request("things"), {"ok": True})
+        self.assertEqual(len(StatusHandler.requests), 3)
+
+    def test_retries_exhausted(self):
+        self.connector.max_retries = 1
+        StatusHandler.responses = [(503, {}), (503, {})]
+
+        self.assertRaises(HTTPError, self.connector.get_request, "things")
+        self.assertEqual(len(StatusHandler.requests), 2)
+
+    def test_post_not_retried_on_status(self):
+        StatusHandler.responses = [(503, {})]
+
+        self.assertRaises(HTTPError, self.connector.post_request, "things", json={})
+        self.assertEqual(len(StatusHandler.requests), 1)
+
+    def test_session_cookies(self):
+        # Cookies set by a response, eg. after logging in, are kept for later requests
+        StatusHandler.responses = [(200, {"Set-Cookie": "session=abc"})]
+
+        self.connector.get_request("login")
+        self.assertEqual(self.connector.session.cookies.get("session"), "abc")
+
+    def test_get_pages(self):
+        requested = []
+
+        def get_page(page):
+            requested.append(page)
+            return {"page": page, "pages": 5}
+
+        pages = self.connector.get_pages(get_page, lambda r: r["pages"], max_workers=3)
+
+        self.assertEqual([p["page"] for p in pages], [1, 2, 3, 4, 5])
+        self.assertEqual(requested[0], 1)
+        self.assertEqual(sorted(requested), [1, 2, 3, 4, 5])
+
+    def test_get_pages_single(self):
+        pages = self.connector.get_pages(lambda page: page, lambda r: None, first_page=3)
+        self.assertEqual(pages, [3])
+
+    def test_get_pages_rate_limited(self):
+        limiter = mock.Mock()
+
+        self.connector.get_pages(lambda page: page, lambda r: 4, rate_limiter=limiter)
+        self.assertEqual(limiter.acquire.call_count, 4)
+
+    def test_get_pages_error(self):
+        def get_page(page):
+            if page == 2:
+                raise HTTPError("Page failed")
+            return page
+
+        self.assertRaises(
+            HTTPError, self.connector.get_pages, get_page, lambda r: 10, max_workers=2
+        )
+
+    def test_rate_limit_shared(self):
+        self.connector.rate_limit = 5
+        self.connector.rate_limit_burst = 2
+
+        limiter = self.connector.rate_limiter
+        self.assertEqual(limiter.rate, 5)
+
+        # Connectors with the same credentials share a limiter
+        other = APIConnector(self.uri)
+        other.rate_limit = 5
+        self.assertIs(other.rate_limiter, limiter)
+
+        other = APIConnector(self.uri, headers={"Authorization": "other"})
+        other.rate_limit = 5
+        self.assertIsNot(other.rate_limiter, limiter)
+
+        self.assertIsNone(APIConnector(self.uri).rate_limiter)
+
+    def test_rate_limit_shared_auth(self):
+        def rate_limiter(auth):
+            connector = APIConnector(self.uri, auth=auth)
+            connector.rate_limit = 5
+            return connector.rate_limiter
+
+        # Separate auth objects with the same credentials share a limiter
+        limiter = rate_limiter(HTTPBasicAuth("user", "secret"))
+        self.assertIs(rate_limiter(HTTPBasicAuth("user", "secret")), limiter)
+        self.assertIsNot(rate_limiter(HTTPBasicAuth("user", "other")), limiter)
+        self.assertIs(rate_limiter(("user", "secret")), rate_limiter(("user", "secret")))
+
+    def test_rate_limit_requests(self):
+        self.connector.rate_limit = 1
+        self.connector.rate_limit_key = "test_rate_limit_requests"
+        StatusHandler.responses = [(200, {}), (200, {})]
+
+        with mock.patch("parsons.utilities.rate_limiter.time.sleep") as sleep:
+            self.connector.get_request("things")
+            self.connector.get_request("things")
+
+        sleep.assert_called_once()
+        self.assertAlmostEqual(sleep.call_args[0][0], 1, delta=0.1)
+
+    def test_rate_limit_adaptive(self):
+        self.connector.rate_limit_adaptive = True
+        self.connector.rate_limit_key = "test_rate_limit_adaptive"
+        StatusHandler.responses = [
+            (200, {"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": "10"}),
+        ]
+
+        self.connector.get_request("things")
+        self.assertEqual(self.connector.rate_limiter.current_rate, 0.5)
@@ -0,0 +1,133 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from parsons import Table
+from parsons.utilities.incremental_sync import (
+    DatabaseStateStore,
+    IncrementalSync,
+    JSONStateStore,
+    SQLiteStateStore,
+    action_kit_fetch,
+    action_network_fetch,
+    mobilize_fetch,
+)
+from test.test_databases.fakes import FakeDatabase
+
+
+class QueryableFakeDatabase(FakeDatabase):
+    # Answers the state store's query for a key's latest cursor
+    def query(self, sql, parameters=None):
+        assert sql.startswith("SELECT cursor_value FROM"), sql
+        assert "WHERE sync_key = %s" in sql, sql
+
+        rows = [
+            row
+            for row in self.table_map["parsons_sync_state"]["table"].data
+            if row["sync_key"] == parameters[0]
+        ]
+        rows.sort(key=lambda row: row["updated_at"], reverse=True)
+
+        return Table([{"cursor_value": row["cursor_value"]} for row in rows[:1]])
+
+
+class TestIncrementalSync(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def check_store(self, store):
+        self.assertIsNone(store.get("people"))
+
+        store.set("people", "2024-01-01")
+        store.set("events", 1700000000)
+        store.set("people", "2024-02-01")
+
+        self.assertEqual(store.get("people"), "2024-02-01")
+        self.assertEqual(store.get("events"), 1700000000)
+
+    def test_json_store(self):
+        path = os.path.join(self.temp_dir.name, "state.json")
+        self.check_store(JSONStateStore(path))
+
+        # The cursors are kept between runs
+        self.assertEqual(JSONStateStore(path).get("people"), "2024-02-01")
+
+    def test_sqlite_store(self):
+        path = os.path.join(self.temp_dir.name, "state.sqlite")
+        store = SQLiteStateStore(path)
+        self.check_store(store)
+        store.close()
+
+        store = SQLiteStateStore(path)
+        self.assertEqual(store.get("people"), "2024-02-01")
+        store.close()
+
+    def test_database_store(self):
+        db = QueryableFakeDatabase()
+        self.check_store(DatabaseStateStore(db))
+
+        self.assertEqual(db.copy_call_args[0]["kwargs"], {"if_exists": "append"})
+
+    def test_pull(self):
+        sync = IncrementalSync(JSONStateStore(os.path.join(self.temp_dir.name, "state.json")))
+        fetch = mock.Mock(
+            return_value=Table(
+                [{"id": 1, "modified_date": "2024-01-02"}, {"id": 2, "modified_date": "2024-01-03"}]
+            )
+        )
+
+        with sync:
+            tbl = sync.pull("people", fetch, "modified_date", start="2024-01-01")
+
+        fetch.assert_called_once_with("2024-01-01")
+        self.assertEqual(tbl.num_rows, 2)
+        self.assertEqual(sync.store.get("people"), "2024-01-03")
+
+        # Nothing new keeps the cursor
+        fetch.return_value = Table()
+        with sync:
+            sync.pull("people", fetch, "modified_date")
+
+        fetch.assert_called_with("2024-01-03")
+        self.assertEqual(sync.store.get("people"), "2024-01-03")
+
+    def test_pull_not_committed_on_error(self):
+        sync = IncrementalSync(JSONStateStore(os.path.join(self.temp_dir.name, "state.json")))
+        fetch = mock.Mock(return_value=Table([{"id": 5}]))
+
+        with self.assertRaises(ValueError):
+            with sync:
+                sync.pull("people", fetch, "id")
+                raise ValueError("Load failed")
+
+        self.assertIsNone(sync.store.get("people"))
+        self.assertIsNone(sync.cursor("people"))
+
+    def test_pull_returned_cursor(self):
+        sync = IncrementalSync(JSONStateStore(os.path.join(self.temp_dir.name, "state.json")))
+
+        sync.pull("people", lambda cursor: (Table([{"id": 1}]), "next-token"))
+        sync.commit()
+
+        self.assertEqual(sync.store.get("people"), "next-token")
+
+    def test_connector_fetches(self):
+        method = mock.Mock()
+
+        action_network_fetch(method, per_page=10)(None)
+        method.assert_called_with(filter=None, per_page=10)
+        action_network_fetch(method)("2024-01-01T00:00:00Z")
+        method.assert_called_with(filter="modified_date gt '2024-01-01T00:00:00Z'")
+
+        mobilize_fetch(method, organization_id=1)(1700000000)
+        method.assert_called_with(updated_since=1700000000, organization_id=1)
+
+        ak = mock.Mock()
+        action_kit_fetch(ak, "order")("2024-01-01T00:00:00")
+        ak.paginated_get.assert_called_with(
+            "order", order_by="updated_at", updated_at__gt="2024-01-01T00:00:00"
+        )
@@ -0,0 +1,79 @@
+import threading
+import unittest
+from unittest import mock
+
+from parsons.utilities.rate_limiter import TokenBucket, shared_limiter
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst(self):
+        bucket = TokenBucket(rate=1, burst=3)
+
+        with mock.patch("time.sleep") as sleep:
+            for _ in range(3):
+                self.assertEqual(bucket.acquire(), 0)
+
+        sleep.assert_not_called()
+
+    def test_waits_for_tokens(self):
+        bucket = TokenBucket(rate=20, burst=1)
+        bucket.acquire()
+
+        self.assertGreater(bucket.acquire(), 0)
+
+    def test_shared_across_threads(self):
+        bucket = TokenBucket(rate=10, burst=5)
+        waits = []
+
+        def acquire():
+            waits.append(bucket.acquire())
+
+        threads = [threading.Thread(target=acquire) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # The burst is taken immediately, and the rest wait for new tokens
+        self.assertEqual(sum(1 for wait in waits if wait == 0), 5)
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, TokenBucket, rate=0)
+        self.assertRaises(ValueError, TokenBucket, rate=1, burst=0)
+
+    def test_unlimited(self):
+        bucket = TokenBucket(rate=None)
+
+        for _ in range(5):
+            self.assertEqual(bucket.acquire(), 0)
+
+    def test_update_from_headers(self):
+        bucket = TokenBucket(rate=None, burst=10)
+
+        # Plenty of requests remaining
+        bucket.update({"X-RateLimit-Remaining": "100", "X-RateLimit-Reset": "10"})
+        self.assertEqual(bucket.current_rate, 10)
+
+        # A declared rate below the header rate still applies
+        bucket.rate = 2
+        self.assertEqual(bucket.current_rate, 2)
+
+        # No requests remaining, so wait until the reset (sent as an epoch timestamp)
+        with mock.patch("time.time", return_value=1700000000):
+            bucket.update({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1700000030"})
+
+        with mock.patch("time.sleep") as sleep:
+            bucket.acquire()
+
+        self.assertAlmostEqual(sleep.call_args[0][0], 30, delta=0.1)
+
+        # Responses without the headers are ignored
+        bucket.update({})
+        self.assertAlmostEqual(bucket.current_rate, 1 / 30)
+
+    def test_shared_limiter(self):
+        bucket = shared_limiter(("test", "key"), 5)
+
+        self.assertIs(shared_limiter(("test", "key"), 10), bucket)
+        self.assertEqual(bucket.rate, 5)
+        self.assertIsNot(shared_limiter(("test", "other key"), 5), bucket)
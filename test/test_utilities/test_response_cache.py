@@ -0,0 +1,153 @@
+import http.server
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from parsons.utilities.api_connector import APIConnector
+from parsons.utilities.response_cache import MemoryCache, ResponseCache, SQLiteCache
+
+
+class ETagHandler(http.server.BaseHTTPRequestHandler):
+    # Serves a versioned document, honoring If-None-Match
+    version = 1
+    cache_control = None
+    requests = []
+
+    def do_GET(self):
+        ETagHandler.requests.append((self.path, self.headers.get("If-None-Match")))
+        etag = f'"v{ETagHandler.version}"'
+
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        body = json.dumps({"version": ETagHandler.version}).encode()
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        if ETagHandler.cache_control:
+            self.send_header("Cache-Control", ETagHandler.cache_control)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestResponseCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), ETagHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.uri = f"http://127.0.0.1:{cls.server.server_address[1]}/"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        ETagHandler.version = 1
+        ETagHandler.cache_control = None
+        ETagHandler.requests = []
+
+        self.cache = ResponseCache(MemoryCache(), ttl=3600)
+
+    def connector(self, cache=None, headers=None):
+        return APIConnector(self.uri, headers=headers, cache=cache or self.cache)
+
+    def test_fresh_responses_skip_the_network(self):
+        connector = self.connector()
+
+        self.assertEqual(connector.get_request("codes"), {"version": 1})
+        self.assertEqual(connector.get_request("codes"), {"version": 1})
+
+        # A new connector sharing the cache also uses it
+        self.assertEqual(self.connector().get_request("codes"), {"version": 1})
+
+        self.assertEqual(len(ETagHandler.requests), 1)
+
+    def test_revalidates_with_etag(self):
+        self.cache.ttl = 0
+        connector = self.connector()
+
+        connector.get_request("codes")
+        self.assertEqual(connector.get_request("codes"), {"version": 1})
+        self.assertEqual(ETagHandler.requests[1], ("/codes", '"v1"'))
+
+        # A changed document replaces the cached one
+        ETagHandler.version = 2
+        self.assertEqual(connector.get_request("codes"), {"version": 2})
+        self.assertEqual(connector.get_request("codes"), {"version": 2})
+        self.assertEqual(ETagHandler.requests[-1], ("/codes", '"v2"'))
+
+    def test_endpoint_ttls(self):
+        self.cache.ttl = 0
+        self.cache.ttls = {"/codes*": 3600}
+        connector = self.connector()
+
+        for _ in range(2):
+            connector.get_request("codes")
+            connector.get_request("people")
+
+        self.assertEqual(
+            [path for path, _ in ETagHandler.requests], ["/codes", "/people", "/people"]
+        )
+
+    def test_polling_reaches_the_network(self):
+        # By default only urls given a TTL are served without a request, so a repeated status
+        # check sees the status change
+        connector = self.connector(ResponseCache(MemoryCache(), ttls={"/codes*": 3600}))
+
+        self.assertEqual(connector.get_request("jobs/1"), {"version": 1})
+        ETagHandler.version = 2
+        self.assertEqual(connector.get_request("jobs/1"), {"version": 2})
+
+        self.assertEqual([path for path, _ in ETagHandler.requests], ["/jobs/1", "/jobs/1"])
+
+    def test_credentials_are_cached_separately(self):
+        self.connector(headers={"X-API-KEY": "a"}).get_request("codes")
+        self.connector(headers={"X-API-KEY": "b"}).get_request("codes")
+
+        self.assertEqual(len(ETagHandler.requests), 2)
+
+    def test_no_store(self):
+        ETagHandler.cache_control = "no-store"
+        connector = self.connector()
+
+        connector.get_request("codes")
+        connector.get_request("codes")
+
+        self.assertEqual(len(ETagHandler.requests), 2)
+
+    def test_sqlite_persists(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "responses.sqlite")
+
+            self.connector(ResponseCache(SQLiteCache(path), ttl=3600)).get_request("codes")
+
+            # A later run reads the cached response from disk
+            cache = ResponseCache(SQLiteCache(path), ttl=3600)
+            self.assertEqual(self.connector(cache).get_request("codes"), {"version": 1})
+            self.assertEqual(len(ETagHandler.requests), 1)
+
+            cache.clear()
+            self.connector(cache).get_request("codes")
+            self.assertEqual(len(ETagHandler.requests), 2)
+
+            cache.backend.close()
+
+    def test_memory_cache_evicts_least_recently_used(self):
+        backend = MemoryCache(max_entries=2)
+        backend.set("a", 1)
+        backend.set("b", 2)
+        backend.get("a")
+        backend.set("c", 3)
+
+        self.assertEqual([backend.get(k) for k in "abc"], [1, None, 3])
@@ -113,6 +113,70 @@ class TestBulkImport(unittest.TestCase):
 
         self.assertEqual(r, 54679)
 
+    @requests_mock.Mocker()
+    def test_post_bulk_import_chunks(self, m):
+        # Mock Cloud Storage
+        cloud_storage.post_file = mock.MagicMock()
+        cloud_storage.post_file.return_value = "https://s3.com/my_file.zip"
+
+        tbl = Table([["Vanid", "ActivistCodeID"], [1, 10], [2, 20], [3, 30]])
+
+        m.post(
+            self.van.connection.uri + "bulkImportJobs",
+            [{"json": {"jobId": 1}}, {"json": {"jobId": 2}}],
+        )
+
+        job_ids = self.van.bulk_apply_activist_codes(
+            tbl, url_type="S3", max_rows_per_job=2, bucket="my-bucket"
+        )
+
+        self.assertEqual(sorted(job_ids), [1, 2])
+
+        uploaded = [c[0][0] for c in cloud_storage.post_file.call_args_list]
+        self.assertEqual(sorted(t.num_rows for t in uploaded), [1, 2])
+
+        descriptions = sorted(r.json()["description"] for r in m.request_history)
+        self.assertEqual(descriptions, ["Activist Code Upload (1)", "Activist Code Upload (2)"])
+
+    @requests_mock.Mocker()
+    def test_get_bulk_import_jobs_results(self, m):
+        results = [
+            Table([["PrimaryKey", "Status"], ["1", "Processed"]]),
+            Table([["PrimaryKey", "Status"], ["2", "Processed"]]),
+        ]
+
+        def job(status, results_tbl=None):
+            files = [{"url": results_tbl.to_csv()}] if results_tbl else []
+            return {"json": {"status": status, "resultFiles": files}}
+
+        m.get(
+            self.van.connection.uri + "bulkImportJobs/1",
+            [job("InProgress"), job("Completed", results[0])],
+        )
+        m.get(self.van.connection.uri + "bulkImportJobs/2", [job("Completed", results[1])])
+
+        tbl = self.van.get_bulk_import_jobs_results([1, 2], poll_interval=0)
+        assert_matching_tables(
+            tbl, Table([["PrimaryKey", "Status"], ["1", "Processed"], ["2", "Processed"]])
+        )
+
+        # Completed jobs aren't checked again
+        self.assertEqual(m.call_count, 3)
+
+        m.get(self.van.connection.uri + "bulkImportJobs/3", [job("Error")])
+        self.assertRaises(ValueError, self.van.get_bulk_import_jobs_results, [3])
+
+        m.get(self.van.connection.uri + "bulkImportJobs/4", [job("Pending")])
+        self.assertRaises(
+            TimeoutError,
+            self.van.get_bulk_import_jobs_results,
+            [4],
+            poll_interval=0.01,
+            timeout=0.05,
+        )
+
+        self.assertEqual(self.van.get_bulk_import_jobs_results([]).num_rows, 0)
+
     @requests_mock.Mocker()
     def test_bulk_apply_activist_codes(self, m):
         # Mock Cloud Storage
@@ -5,6 +5,7 @@ import unittest.mock as mock
 import requests_mock
 
 from parsons import VAN, Table
+from parsons.ngpvan.changed_entities import _drop_boundary_duplicates
 from test.utils import assert_matching_tables
 
 
@@ -81,14 +82,95 @@ class TestNGPVAN(unittest.TestCase):
             "jobStatus": "Complete",
         }
 
-        tbl = Table([{"a": 1, "b": 2}])
+        tbl = Table([{"a": "1", "b": "2"}])
 
         m.post(self.van.connection.uri + "changedEntityExportJobs", json=json)
         m.get(self.van.connection.uri + "changedEntityExportJobs/2170181229", json=json2)
-
-        Table.from_csv = mock.MagicMock()
-        Table.from_csv.return_value = tbl
+        m.get("https://box.com/file.csv", text="a,b\n1,2\n")
 
         out_tbl = self.van.get_changed_entities("ContactHistory", "2021-10-10")
 
         assert_matching_tables(out_tbl, tbl)
+
+    @requests_mock.Mocker()
+    def test_get_changed_entities_windows(self, m):
+        windows = []
+
+        def create_job(request, context):
+            body = request.json()
+            windows.append((body["dateChangedFrom"], body["dateChangedTo"]))
+            return {"exportJobId": len(windows), "jobStatus": "Pending"}
+
+        def job_status(job_id):
+            # Each job is pending when first checked, and has two files
+            checks = iter(["Pending", "Complete"])
+
+            def status(request, context):
+                return {
+                    "exportJobId": job_id,
+                    "jobStatus": next(checks),
+                    "files": [
+                        {"downloadUrl": f"https://box.com/{job_id}-{i}.csv"} for i in range(2)
+                    ],
+                }
+
+            return status
+
+        m.post(self.van.connection.uri + "changedEntityExportJobs", json=create_job)
+        for job_id in (1, 2):
+            m.get(
+                self.van.connection.uri + f"changedEntityExportJobs/{job_id}",
+                json=job_status(job_id),
+            )
+            for i in range(2):
+                m.get(f"https://box.com/{job_id}-{i}.csv", text=f"job,file\n{job_id},{i}\n")
+
+        # A record changed on the boundary date is in both windows' files
+        m.get("https://box.com/2-1.csv", text="job,file\n2,1\n1,0\n")
+
+        with mock.patch("parsons.ngpvan.changed_entities.time.sleep") as sleep:
+            out_tbl = self.van.get_changed_entities(
+                "ContactHistory", "2021-10-01", "2021-10-05", window_days=2
+            )
+
+        self.assertEqual(
+            sorted(windows),
+            [("2021-10-01", "2021-10-03"), ("2021-10-03", "2021-10-05")],
+        )
+
+        # The jobs are checked together, so there is a single wait
+        sleep.assert_called_once()
+
+        self.assertEqual(out_tbl.num_rows, 4)
+        self.assertEqual(sorted(out_tbl["file"]), ["0", "0", "1", "1"])
+
+    def test_drop_boundary_duplicates(self):
+        first = Table(
+            [
+                ["VanID", "DateChanged", "Name"],
+                [1, "2021-10-03T09:00:00", "Jim"],
+                [1, "2021-10-03T09:00:00", "Jim"],
+                [2, "2021-10-02T09:00:00", "Jane"],
+            ]
+        )
+        second = Table(
+            [
+                ["VanID", "DateChanged", "Name"],
+                [1, "2021-10-03T09:00:00", "Jim B"],
+                [1, "2021-10-04T09:00:00", "Jim"],
+                [3, "2021-10-04T09:00:00", "Sue"],
+                [3, "2021-10-04T09:00:00", "Sue"],
+            ]
+        )
+
+        # Only the second window's copy of the change on the boundary date is dropped, even
+        # though its other columns differ; identical rows within a window are kept
+        (deduplicated,) = _drop_boundary_duplicates([second], [first])
+        self.assertEqual(
+            [tuple(row) for row in deduplicated.data],
+            [
+                (1, "2021-10-04T09:00:00", "Jim"),
+                (3, "2021-10-04T09:00:00", "Sue"),
+                (3, "2021-10-04T09:00:00", "Sue"),
+            ],
+        )
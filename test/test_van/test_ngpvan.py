@@ -23,6 +23,26 @@ class TestNGPVAN(unittest.TestCase):
 
         assert_matching_tables(Table(json), self.van.get_canvass_responses_contact_types())
 
+    @requests_mock.Mocker()
+    def test_get_table(self, m):
+        uri = self.van.connection.uri
+        m.get(
+            uri + "scores",
+            json={"items": [{"scoreId": 1}], "nextPageLink": uri + "scores?$skip=1"},
+        )
+        m.get(uri + "scores?$skip=1", json={"items": [{"scoreId": 2}], "nextPageLink": None})
+
+        self.assertEqual(
+            self.van.connection.get_request("scores"), [{"scoreId": 1}, {"scoreId": 2}]
+        )
+
+        tbl = self.van.connection.get_table("scores")
+        assert_matching_tables(tbl, Table([{"scoreId": 1}, {"scoreId": 2}]))
+        self.assertEqual(tbl.num_rows, 2)
+
+        # Each page is only requested once, however many times the table is read
+        self.assertEqual(m.call_count, 4)
+
     @requests_mock.Mocker()
     def test_get_canvass_responses_input_types(self, m):
         json = [{"inputTypeId": 11, "name": "API"}]